@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+cleaning_engine.py
+사전 컴파일 단일 패스 정제 엔진 (DataCleaner 공용)
+- 모든 패턴을 생성 시 한 번만 컴파일
+- 서로 겹치지 않는 연속 패턴(merge group)은 하나의 alternation으로 합쳐 한 번만 스캔
+- 필수 문자열이 없는 텍스트는 정규식 실행 자체를 건너뜀 (예: '@' 없으면 email 생략)
+- 마지막 공백 정리는 ' '.join(text.split()) (re의 \\s와 str.split 공백 정의 동일)
+- --verify: 기존 순차 re.sub 결과와 일치 여부 확인, --benchmark: 초당 기사 수 측정
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+
+class CleaningEngine:
+    """패턴 dict(순서 유지) → 컴파일된 정제 단계 목록"""
+
+    def __init__(self, patterns, merge_groups=(), literals=None, line_rules=(),
+                 whitespace_rules=('multiple_spaces',)):
+        """
+        patterns: {이름: 정규식} (dict 순서 = 적용 순서)
+        merge_groups: 한 번에 스캔할 연속 패턴 이름 묶음 (매치 문자 집합이 서로 겹치지 않아야 함)
+        literals: {이름: (문자열, ...)} 패턴이 매치되려면 반드시 포함되어야 하는 문자열 (하나 이상)
+        line_rules: 줄 시작 기준(MULTILINE)으로 빈 문자열 치환하는 패턴
+        whitespace_rules: 마지막 공백 정리로 대체되는 패턴 (맨 뒤에 있을 때만 생략)
+        """
+        self.patterns = dict(patterns)
+        self.line_rules = set(line_rules)
+        literals = literals or {}
+
+        names = list(self.patterns)
+        while names and names[-1] in whitespace_rules:
+            names.pop()
+
+        group_of = {}
+        for group in merge_groups:
+            positions = [names.index(name) for name in group]
+            if positions != list(range(positions[0], positions[0] + len(group))):
+                raise ValueError(f"Merge group must be contiguous in rule order: {group}")
+            if self.line_rules & set(group):
+                raise ValueError(f"Line rules cannot be merged: {group}")
+            for name in group:
+                group_of[name] = tuple(group)
+
+        self.steps = []  # (이름, 컴파일된 패턴, 치환 문자열, 필수 문자열 또는 None)
+        i = 0
+        while i < len(names):
+            group = group_of.get(names[i], (names[i],))
+            if len(group) == 1:
+                name = group[0]
+                if name in self.line_rules:
+                    regex, repl = re.compile(self.patterns[name], re.MULTILINE), ''
+                else:
+                    regex, repl = re.compile(self.patterns[name]), ' '
+            else:
+                name = '+'.join(group)
+                regex = re.compile('|'.join(f"(?:{self.patterns[n]})" for n in group))
+                repl = ' '
+
+            # 묶음의 모든 패턴에 필수 문자열이 있어야 사전 검사 가능
+            required = None
+            if all(n in literals for n in group):
+                required = tuple(lit for n in group for lit in literals[n])
+
+            self.steps.append((name, regex, repl, required))
+            i += len(group)
+
+    def clean(self, text):
+        """정제 실행 (빈 값 처리는 호출 측에서)"""
+        for _, regex, repl, required in self.steps:
+            if required is not None and not any(lit in text for lit in required):
+                continue
+            text = regex.sub(repl, text)
+        return ' '.join(text.split())
+
+
+def reference_clean(patterns, text, line_rules=()):
+    """기존 DataCleaner와 동일한 순차 re.sub 정제 (검증용)"""
+    for name, pattern in patterns.items():
+        if name in line_rules:
+            text = re.sub(pattern, '', text, flags=re.MULTILINE)
+        else:
+            text = re.sub(pattern, ' ', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _sample_texts(path, limit=None):
+    """월별 뉴스 파일에서 제목/본문 목록 추출 (json / jsonl / jsonl.gz / jsonl.zst)"""
+    from crawler.common.jsonl_sink import read_records
+
+    data = read_records(path)
+    articles = data if isinstance(data, list) else [a for v in data.values() if isinstance(v, list) for a in v]
+    texts = []
+    for article in articles[:limit]:
+        texts.append(article.get('title') or '')
+        texts.append(article.get('content') or '')
+    return [t for t in texts if t]
+
+
+def verify(cleaner, kind, texts):
+    """엔진 결과가 순차 정제 결과와 같은지 확인 → 불일치 개수"""
+    engine, patterns, line_rules = cleaner.engine_config(kind)
+    mismatches = 0
+    for text in texts:
+        if engine.clean(text) != reference_clean(patterns, text, line_rules):
+            mismatches += 1
+            if mismatches <= 3:
+                print(f"  Mismatch: {text[:80]!r}")
+    return mismatches
+
+
+def benchmark(cleaner, kind, texts, repeat=3):
+    """순차 정제 vs 엔진 초당 기사 수 (제목+본문 2개 = 기사 1개)"""
+    engine, patterns, line_rules = cleaner.engine_config(kind)
+    results = {}
+    for label, fn in (('sequential', lambda t: reference_clean(patterns, t, line_rules)),
+                      ('engine', engine.clean)):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for text in texts:
+                fn(text)
+            best = min(best, time.perf_counter() - start)
+        results[label] = (len(texts) / 2) / best
+    return results
+
+
+def main():
+    """메인 실행 함수"""
+    from cleansing.unified_cleansing import DataCleaner
+
+    parser = argparse.ArgumentParser(description='정제 엔진 검증/벤치마크')
+    parser.add_argument('sample', help='샘플 파일 (예: crawler/data/unified/news_2015_01.jsonl)')
+    parser.add_argument('--kind', choices=['news', 'mpb', 'bond'], default='news')
+    parser.add_argument('--limit', type=int, help='사용할 기사 수')
+    parser.add_argument('--benchmark', action='store_true')
+    args = parser.parse_args()
+
+    cleaner = DataCleaner()
+    texts = _sample_texts(args.sample, args.limit)
+    print(f"Loaded {len(texts):,} texts from {args.sample}")
+
+    mismatches = verify(cleaner, args.kind, texts)
+    print(f"Parity: {len(texts) - mismatches:,}/{len(texts):,} identical")
+
+    if args.benchmark:
+        results = benchmark(cleaner, args.kind, texts)
+        for label, rate in results.items():
+            print(f"  {label:<10} {rate:,.0f} articles/sec")
+        print(f"  Speedup: {results['engine'] / results['sequential']:.2f}x")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+digest_index.py
+코퍼스 전체 완전 중복 제거용 고정 크기 digest 인덱스
+- 정제된 '제목_본문' 문자열 대신 16바이트 blake2b digest만 SQLite(WITHOUT ROWID)에 저장
+- 월/언론사 구분 없이 먼저 등록한 문서가 원본 (owner = 월별 파일명)
+- 월 파일을 다시 정제할 때는 해당 월과 이후 모든 월의 digest를 먼저 해제한 뒤 월 순서대로 다시 등록
+- 정제 규칙 버전이 바뀌면 digest 값 자체가 달라지므로 인덱스 초기화
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+
+
+def content_digest(title, content):
+    """기존 중복 키(f"{title}_{content}")의 16바이트 digest"""
+    return hashlib.blake2b(f"{title}_{content}".encode('utf-8'), digest_size=16).digest()
+
+
+class DigestIndex:
+    """SQLite 기반 digest → owner 인덱스"""
+
+    def __init__(self, path, rule_version=''):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS digests (
+                digest BLOB PRIMARY KEY, owner TEXT NOT NULL) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_digest_owner ON digests (owner);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        """)
+
+        # 새로 만들었거나 규칙이 바뀌어 비운 경우 True (모든 월을 다시 등록해야 함)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'rule_version'").fetchone()
+        self.reset = row is None or row[0] != rule_version
+        if self.reset:
+            self.conn.execute("DELETE FROM digests")
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('rule_version', ?)", (rule_version,))
+            self.conn.commit()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM digests").fetchone()[0]
+
+    def release(self, owner):
+        """owner가 등록한 digest 해제 (해당 월 재정제 전)"""
+        self.conn.execute("DELETE FROM digests WHERE owner = ?", (owner,))
+
+    def claim(self, digest, owner):
+        """처음 보는 digest면 owner로 등록 후 True, 이미 있으면 False (중복)"""
+        cursor = self.conn.execute("INSERT OR IGNORE INTO digests VALUES (?, ?)", (digest, owner))
+        return cursor.rowcount == 1
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
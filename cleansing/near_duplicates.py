@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+near_duplicates.py
+MinHash + LSH 기반 유사 중복 기사 탐지 (전체 월 / 전체 언론사)
+- 문자 5-gram shingle → 128개 MinHash 서명 ((a·x + b) mod 4294967311)
+- 16 band × 8 row LSH 버킷과 서명을 SQLite에 저장 → 메모리는 파일 하나 분량만 사용
+- 월 순서로 증분 추가: 먼저 들어온 기사가 원본, 이후 유사 기사(추정 Jaccard ≥ 0.8)는 중복으로 기록
+- union-find로 중복 클러스터 보고, 코퍼스 조립 시 중복 기사 제외 (corpus_assembler)
+- 파일별 sha256 기록: 내용이 바뀌었거나 새로 들어온 파일은 그 파일과 이후(파일명 순) 모든 파일의
+  문서/버킷/중복 기록을 지우고 월 순서대로 다시 추가 (먼저 들어온 기사가 원본이라는 규칙 유지)
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from cleansing.unified_cleansing import file_sha256
+from preprocess.data_combine.corpus_assembler import content_key
+
+CLEANED_NEWS_DIR = PROJECT_ROOT / "cleansing/cleaned_data/news_cleaned"
+INDEX_PATH = PROJECT_ROOT / "cleansing/cleaned_data/near_duplicates.sqlite"
+
+MERSENNE_PRIME = 4294967311  # 2^32보다 큰 소수 (universal hashing)
+MAX_HASH = 0xFFFFFFFF
+
+
+def shingle_hashes(text, k=5):
+    """문자 k-gram shingle의 32bit 해시 집합 (numpy 롤링 해시)"""
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    n = len(codes) - k + 1
+    if n <= 0:
+        return np.empty(0, dtype=np.uint64)
+    h = np.zeros(n, dtype=np.uint64)
+    for j in range(k):
+        h = (h * np.uint64(1000003) + codes[j:j + n]) & np.uint64(MAX_HASH)
+    return np.unique(h)
+
+
+class MinHasher:
+    """고정 seed의 universal hash 묶음"""
+
+    def __init__(self, num_perm=128, seed=33):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingles):
+        """shingle 해시 배열 → uint32 MinHash 서명"""
+        # a, x < 2^32 이므로 a·x + b는 uint64 범위 안
+        values = (self.a[:, None] * shingles[None, :] + self.b[:, None]) % np.uint64(MERSENNE_PRIME)
+        return np.minimum(values.min(axis=1), MAX_HASH).astype(np.uint32)
+
+
+class NearDuplicateIndex:
+    """SQLite에 저장되는 증분 MinHash LSH 인덱스"""
+
+    def __init__(self, path=INDEX_PATH, num_perm=128, bands=16, threshold=0.8, shingle_size=5):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.shared = 0  # 다른 파일에서 이미 색인된 doc_id 수 (add 참고)
+
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id INTEGER PRIMARY KEY, source TEXT, date TEXT, file TEXT, signature BLOB);
+            CREATE TABLE IF NOT EXISTS bands (
+                band INTEGER, bucket INTEGER, doc_id INTEGER);
+            CREATE INDEX IF NOT EXISTS idx_bands ON bands (band, bucket);
+            CREATE TABLE IF NOT EXISTS duplicates (
+                doc_id INTEGER PRIMARY KEY, dup_of INTEGER, similarity REAL);
+            CREATE TABLE IF NOT EXISTS files (file TEXT PRIMARY KEY, documents INTEGER, sha256 TEXT);
+        """)
+        # sha256 컬럼이 없던 이전 인덱스 → 추가 (값이 없으므로 다음 build에서 다시 색인)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(files)")}
+        if 'sha256' not in columns:
+            self.conn.execute("ALTER TABLE files ADD COLUMN sha256 TEXT")
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def _buckets(self, signature):
+        """band별 버킷 키 (signed int64)"""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            digest = hashlib.blake2b(chunk, digest_size=8).digest()
+            keys.append(int.from_bytes(digest, 'little', signed=True))
+        return keys
+
+    def add(self, doc_id, text, source='', date='', file=''):
+        """문서 추가 → (원본 doc_id, 추정 유사도) 또는 None
+
+        이미 색인된 doc_id(같은 기사가 앞선 파일에도 있음)는 기존 기록을 그대로 쓰고
+        self.shared에 건수를 센다 (문서는 먼저 색인한 파일 소속으로 남음).
+        """
+        existing = self.conn.execute("SELECT file FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+        if existing:
+            if existing[0] != file:
+                self.shared += 1
+            row = self.conn.execute("SELECT dup_of, similarity FROM duplicates WHERE doc_id = ?",
+                                    (doc_id,)).fetchone()
+            return tuple(row) if row else None
+
+        shingles = shingle_hashes(text, self.shingle_size)
+        if not len(shingles):
+            return None
+        signature = self.hasher.signature(shingles)
+        buckets = self._buckets(signature)
+
+        # 같은 버킷을 공유하는 후보만 서명 비교
+        candidates = set()
+        for band, bucket in enumerate(buckets):
+            candidates.update(row[0] for row in self.conn.execute(
+                "SELECT doc_id FROM bands WHERE band = ? AND bucket = ?", (band, bucket)))
+
+        match = None
+        for candidate in sorted(candidates):
+            blob = self.conn.execute("SELECT signature FROM documents WHERE doc_id = ?",
+                                     (candidate,)).fetchone()[0]
+            similarity = float((np.frombuffer(blob, dtype=np.uint32) == signature).mean())
+            if similarity >= self.threshold and (match is None or similarity > match[1]):
+                match = (candidate, similarity)
+
+        self.conn.execute("INSERT INTO documents VALUES (?, ?, ?, ?, ?)",
+                          (doc_id, source, date, file, signature.tobytes()))
+        self.conn.executemany("INSERT INTO bands VALUES (?, ?, ?)",
+                              [(band, bucket, doc_id) for band, bucket in enumerate(buckets)])
+        if match is not None:
+            self.conn.execute("INSERT INTO duplicates VALUES (?, ?, ?)", (doc_id, *match))
+        return match
+
+    def remove_file(self, name):
+        """파일에서 추가된 문서와 그 버킷 / 중복 기록 삭제"""
+        doc_ids = "SELECT doc_id FROM documents WHERE file = ?"
+        self.conn.execute(f"DELETE FROM bands WHERE doc_id IN ({doc_ids})", (name,))
+        self.conn.execute(f"DELETE FROM duplicates WHERE doc_id IN ({doc_ids}) OR dup_of IN ({doc_ids})",
+                          (name, name))
+        self.conn.execute("DELETE FROM documents WHERE file = ?", (name,))
+        self.conn.execute("DELETE FROM files WHERE file = ?", (name,))
+
+    def add_cleaned_file(self, path):
+        """정제된 월별 뉴스 파일 전체 추가 (내용이 같은 파일은 건너뜀) → 새 중복 수
+
+        파일명 순(= 월 순)으로 호출해야 한다. 다시 정제되었거나 새로 들어온 파일이면 그 파일과
+        이후 파일의 기록을 모두 지우므로, 이후 파일은 다음 호출에서 순서대로 다시 추가된다.
+        """
+        name = Path(path).name
+        digest = file_sha256(path)
+        row = self.conn.execute("SELECT sha256 FROM files WHERE file = ?", (name,)).fetchone()
+        if row is not None and row[0] == digest:
+            return None
+        # 이후 월의 원본/중복 판정은 이 파일 내용에 따라 달라지므로 함께 지우고 다시 색인
+        later = [r[0] for r in self.conn.execute(
+            "SELECT file FROM files WHERE file >= ? ORDER BY file", (name,))]
+        for other in later:
+            self.remove_file(other)
+        if later:
+            self.conn.commit()
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        added = duplicates = 0
+        self.shared = 0
+        for source, articles in data.items():
+            if not isinstance(articles, list):
+                continue
+            for article in articles:
+                title = article.get('title') or ''
+                content = article.get('content') or ''
+                date = article.get('date') or ''
+                doc_id = content_key(source, str(date)[:10], title, content)
+                if self.add(doc_id, f"{title} {content}", source, date, name):
+                    duplicates += 1
+                added += 1
+
+        self.conn.execute("INSERT INTO files VALUES (?, ?, ?)", (name, added, digest))
+        self.conn.commit()
+        if self.shared:
+            print(f"  {name}: {self.shared:,}건은 앞선 파일에서 이미 색인된 기사 (기존 기록 사용)")
+        return duplicates
+
+    def duplicate_ids(self):
+        """제거 대상 doc_id 집합 (원본이 아닌 기사)"""
+        return {row[0] for row in self.conn.execute("SELECT doc_id FROM duplicates")}
+
+    def clusters(self):
+        """union-find로 묶은 중복 클러스터 DataFrame"""
+        parent = {}
+
+        def find(x):
+            parent.setdefault(x, x)
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for doc_id, dup_of, _ in self.conn.execute("SELECT * FROM duplicates"):
+            root_a, root_b = find(doc_id), find(dup_of)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        members = defaultdict(list)
+        for doc_id in list(parent):
+            members[find(doc_id)].append(doc_id)
+
+        rows = []
+        for cluster_id, doc_ids in enumerate(sorted(members.values(), key=len, reverse=True)):
+            placeholders = ','.join('?' * len(doc_ids))
+            for doc_id, source, date, file in self.conn.execute(
+                    f"SELECT doc_id, source, date, file FROM documents WHERE doc_id IN ({placeholders})",
+                    doc_ids):
+                rows.append({'cluster': cluster_id, 'doc_id': doc_id, 'source': source,
+                             'date': date, 'file': file})
+        return pd.DataFrame(rows, columns=['cluster', 'doc_id', 'source', 'date', 'file'])
+
+
+def load_duplicate_ids(path=INDEX_PATH):
+    """코퍼스 조립용: 인덱스가 있으면 제거 대상 doc_id 집합, 없으면 빈 집합"""
+    if not Path(path).exists():
+        return set()
+    index = NearDuplicateIndex(path)
+    try:
+        return index.duplicate_ids()
+    finally:
+        index.close()
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='MinHash/LSH 유사 중복 기사 탐지')
+    parser.add_argument('command', choices=['build', 'report'])
+    parser.add_argument('--index', type=str, default=str(INDEX_PATH))
+    parser.add_argument('--threshold', type=float, default=0.8, help='추정 Jaccard 임계값')
+    args = parser.parse_args()
+
+    index = NearDuplicateIndex(args.index, threshold=args.threshold)
+
+    if args.command == 'build':
+        files = sorted(glob.glob(str(CLEANED_NEWS_DIR / "*_cleaned.json")))
+        start = time.perf_counter()
+        for path in files:
+            duplicates = index.add_cleaned_file(path)
+            if duplicates is not None:
+                print(f"  {Path(path).name}: {duplicates:,} near-duplicates")
+        print(f"✓ Indexed {len(files)} files in {time.perf_counter() - start:.1f}s")
+
+    clusters = index.clusters()
+    output_path = Path(args.index).with_name("near_duplicate_clusters.csv")
+    clusters.to_csv(output_path, index=False, encoding='utf-8')
+
+    n_clusters = clusters['cluster'].nunique() if len(clusters) else 0
+    cross_source = (clusters.groupby('cluster')['source'].nunique() > 1).sum() if len(clusters) else 0
+    print(f"\nDuplicate clusters: {n_clusters:,} ({cross_source:,} across sources)")
+    print(f"Documents to remove: {len(index.duplicate_ids()):,}")
+    print(f"✓ Saved {output_path}")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,9 @@ import glob
 import os
 import sys
 import argparse
+import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
 from datetime import datetime
@@ -20,6 +23,62 @@ from datetime import datetime
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
+from cleansing.cleaning_engine import CleaningEngine
+from cleansing.digest_index import DigestIndex, content_digest
+from crawler.common.jsonl_sink import is_jsonl, read_grouped, read_records, strip_suffix
+
+NEWS_MIN_CONTENT_LENGTH = 10           # 정제 후 본문 최소 길이
+NEWS_MANIFEST = '_manifest.json'       # 월별 입력 해시 / 규칙 버전 / 카운터
+NEWS_DIGEST_INDEX = '_digests.sqlite'  # 코퍼스 전체 중복 제거용 digest 인덱스
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """파일 내용 sha256"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def write_json_atomic(path, data, **kwargs):
+    """같은 디렉토리 임시 파일에 쓴 뒤 os.replace로 교체"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, **kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+_worker_cleaner = None
+
+
+def news_input_files(unified_dir):
+    """월별 크롤링 결과 파일 (json / jsonl / jsonl.gz / jsonl.zst, 같은 월이면 JSONL 우선)"""
+    files = {}
+    for path in sorted(glob.glob(str(Path(unified_dir) / 'news_*.json*'))):
+        if 'summary' in path or not (is_jsonl(path) or path.endswith('.json')):
+            continue
+        month = strip_suffix(path)
+        if month not in files or is_jsonl(path):
+            files[month] = path
+    return [files[month] for month in sorted(files)]
+
+
+def _clean_news_worker(file_path):
+    """프로세스 풀 워커: 프로세스당 DataCleaner 하나를 재사용"""
+    global _worker_cleaner
+    if _worker_cleaner is None:
+        _worker_cleaner = DataCleaner()
+    return _worker_cleaner.clean_news_articles(file_path)
+
+
 class DataCleaner:
     """통합 데이터 정제 클래스"""
 
@@ -62,6 +121,45 @@ class DataCleaner:
             'multiple_spaces': r'\s+',
         }
 
+        # 패턴별 필수 문자열 (없으면 해당 패턴 스캔 생략)
+        self.news_literals = {
+            'email': ('@',),
+            'byline_yonhap': ('연합뉴스',),
+            'byline_edaily': ('이데일리',),
+            'byline_infomax': ('연합인포맥스',),
+            'tags': ('[',),
+            'javascript': ('function(',),
+            'url': ('http',),
+            'parenthesis_content': ('제공', '사진'),
+        }
+        self.mpb_literals = {
+            'stock_code': ('(',),
+            'ad_text': ('관련기사',),
+            'arrow_text': ('☞',),
+            'news_summary': ('<간추린 소식>',),
+        }
+        self.bond_literals = {
+            'html_tags': ('<',),
+        }
+
+        # 컴파일된 정제 엔진 (매치 문자가 겹치지 않는 연속 패턴은 한 번에 스캔)
+        self.news_engine = CleaningEngine(
+            self.news_patterns,
+            merge_groups=[('stock_code', 'special_chars')],
+            literals=self.news_literals
+        )
+        self.mpb_engine = CleaningEngine(
+            self.mpb_patterns,
+            merge_groups=[('special_chars', 'photo_table')],
+            literals=self.mpb_literals,
+            line_rules=('list_number',)
+        )
+        self.bond_engine = CleaningEngine(
+            self.bond_patterns,
+            merge_groups=[('email', 'korean_jamo', 'decimal_numbers', 'numbers', 'special_chars')],
+            literals=self.bond_literals
+        )
+
         # 정제된 데이터 저장 경로
         self.output_dir = PROJECT_ROOT / 'cleansing' / 'cleaned_data'
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -71,113 +169,210 @@ class DataCleaner:
         if pd.isna(text) or text == '':
             return ''
 
-        # 순서 중요: 특정 패턴부터 일반 패턴으로
-        for pattern_name, pattern in self.news_patterns.items():
-            text = re.sub(pattern, ' ', text)
-
-        # 공백 정리
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        # 순서 중요: 특정 패턴부터 일반 패턴으로 (엔진이 순서 유지)
+        return self.news_engine.clean(text)
 
     def clean_text_mpb(self, text):
         """MPB 텍스트 정제"""
         if pd.isna(text) or text == '':
             return ''
 
-        for pattern_name, pattern in self.mpb_patterns.items():
-            if pattern_name == 'list_number':
-                text = re.sub(pattern, '', text, flags=re.MULTILINE)
-            else:
-                text = re.sub(pattern, ' ', text)
-
-        # 공백 정리
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        return self.mpb_engine.clean(text)
 
     def clean_text_bond(self, text):
         """채권 텍스트 정제"""
         if pd.isna(text) or text == '':
             return ''
 
-        for pattern_name, pattern in self.bond_patterns.items():
-            text = re.sub(pattern, ' ', text)
-
-        # 공백 정리
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
-
-    def clean_news_data(self):
-        """뉴스 데이터 정제 (359K articles)"""
+        return self.bond_engine.clean(text)
+
+    def engine_config(self, kind):
+        """(엔진, 원본 패턴, 줄 단위 패턴) - 검증/벤치마크용"""
+        if kind == 'news':
+            return self.news_engine, self.news_patterns, ()
+        if kind == 'mpb':
+            return self.mpb_engine, self.mpb_patterns, ('list_number',)
+        if kind == 'bond':
+            return self.bond_engine, self.bond_patterns, ()
+        raise ValueError(f"Unknown data type: {kind}")
+
+    @property
+    def news_rule_version(self):
+        """뉴스 정제 규칙 버전 (패턴/필수 문자열/엔진 단계가 바뀌면 달라짐)"""
+        rules = {
+            'patterns': self.news_patterns,
+            'literals': self.news_literals,
+            'steps': [name for name, _, _, _ in self.news_engine.steps],
+            'min_content_length': NEWS_MIN_CONTENT_LENGTH,
+        }
+        payload = json.dumps(rules, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+    def clean_news_articles(self, file_path):
+        """월별 뉴스 파일 하나의 제목/본문 정제 (중복 판정 전, 워커에서 실행)
+
+        반환: ({source: [(digest, 기사 dict 또는 None)]}, 전체 기사 수)
+        정제 후 본문이 너무 짧은 기사도 중복 판정에는 참여하므로 digest는 남긴다.
+        """
+        # {소스: [기사]} (JSONL은 기사별 source 필드로 묶음)
+        data = read_grouped(file_path)
+
+        total = 0
+        cleaned = {}
+
+        # 각 언론사별 처리
+        for source in ['yonhap', 'edaily', 'infomax']:
+            if source not in data:
+                continue
+
+            entries = []
+            for article in data[source]:
+                total += 1
+
+                # 제목과 내용 정제
+                cleaned_title = self.clean_text_news(article.get('title', ''))
+                cleaned_content = self.clean_text_news(article.get('content', ''))
+                digest = content_digest(cleaned_title, cleaned_content)
+
+                # 빈 내용 제외
+                record = None
+                if cleaned_content and len(cleaned_content) > NEWS_MIN_CONTENT_LENGTH:
+                    record = {
+                        'date': article.get('date', ''),
+                        'title': cleaned_title,
+                        'content': cleaned_content,
+                        'url': article.get('url', '')
+                    }
+                entries.append((digest, record))
+
+            cleaned[source] = entries
+
+        return cleaned, total
+
+    def dedupe_news_articles(self, cleaned, total, digest_index, owner, output_path):
+        """digest 인덱스로 코퍼스 전체 중복 제거 후 저장 → 카운터 dict
+
+        부모 프로세스에서 월 순서대로만 호출하므로 어떤 기사가 원본인지 항상 같다.
+        출력은 임시 파일에 쓴 뒤 os.replace로 교체하므로 반쯤 쓰인 _cleaned.json이 남지 않는다.
+        """
+        counts = {'total': total, 'cleaned': 0, 'duplicates': 0}
+        cleaned_data = {}
+
+        # 다시 정제하는 월의 이전 digest 해제
+        digest_index.release(owner)
+
+        for source, entries in cleaned.items():
+            cleaned_articles_list = []
+            for digest, record in entries:
+                # 중복 체크 (제목+내용, 전체 월/언론사 기준)
+                if not digest_index.claim(digest, owner):
+                    counts['duplicates'] += 1
+                    continue
+                if record is not None:
+                    cleaned_articles_list.append(record)
+                    counts['cleaned'] += 1
+            cleaned_data[source] = cleaned_articles_list
+
+        # 정제된 데이터 저장 (원자적 교체) 후 digest 확정
+        write_json_atomic(output_path, cleaned_data, indent=2)
+        digest_index.commit()
+        return counts
+
+    def clean_news_data(self, workers=1):
+        """뉴스 데이터 정제 (359K articles)
+
+        workers > 1이면 월별 파일을 프로세스 풀에서 병렬 정제한다.
+        중복 판정(digest 인덱스)과 저장은 부모 프로세스에서 월 순서대로 수행한다.
+        입력 해시와 규칙 버전이 manifest와 같은 월은 건너뛴다. 단, 앞선 월이 하나라도 바뀌면
+        그 뒤의 월은 모두 다시 중복 판정한다 (원본/중복 관계가 월 순서로 정해지기 때문).
+        """
         print("="*60)
         print("뉴스 데이터 정제 시작")
         print("="*60)
 
-        news_files = glob.glob(str(PROJECT_ROOT / 'crawler/data/unified/news_*.json'))
-        news_files = sorted([f for f in news_files if 'summary' not in f])
+        news_files = news_input_files(PROJECT_ROOT / 'crawler/data/unified')
 
         print(f"처리할 파일 수: {len(news_files)}")
 
         cleaned_news_dir = self.output_dir / 'news_cleaned'
         cleaned_news_dir.mkdir(exist_ok=True)
 
-        total_articles = 0
-        cleaned_articles = 0
-        removed_duplicates = 0
-
-        for file_path in tqdm(news_files, desc="뉴스 파일 처리"):
-            filename = os.path.basename(file_path)
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            cleaned_data = {}
-
-            # 각 언론사별 처리
-            for source in ['yonhap', 'edaily', 'infomax']:
-                if source not in data:
-                    continue
-
-                articles = data[source]
-                cleaned_articles_list = []
-                seen_contents = set()  # 중복 제거용
-
-                for article in articles:
-                    total_articles += 1
-
-                    # 제목과 내용 정제
-                    cleaned_title = self.clean_text_news(article.get('title', ''))
-                    cleaned_content = self.clean_text_news(article.get('content', ''))
-
-                    # 중복 체크 (제목+내용)
-                    content_hash = f"{cleaned_title}_{cleaned_content}"
-                    if content_hash in seen_contents:
-                        removed_duplicates += 1
-                        continue
-
-                    seen_contents.add(content_hash)
-
-                    # 빈 내용 제외
-                    if cleaned_content and len(cleaned_content) > 10:
-                        cleaned_articles_list.append({
-                            'date': article.get('date', ''),
-                            'title': cleaned_title,
-                            'content': cleaned_content,
-                            'url': article.get('url', '')
-                        })
-                        cleaned_articles += 1
-
-                cleaned_data[source] = cleaned_articles_list
-
-            # 정제된 데이터 저장
+        rule_version = self.news_rule_version
+        digest_index = DigestIndex(cleaned_news_dir / NEWS_DIGEST_INDEX, rule_version)
+
+        manifest_path = cleaned_news_dir / NEWS_MANIFEST
+        manifest = {}
+        # digest 인덱스가 새로 만들어졌으면 건너뛴 월의 digest가 없으므로 전체 재정제
+        if manifest_path.exists() and not digest_index.reset:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+
+        # 변경된 월과 그 이후 월을 작업 목록에 추가
+        jobs = []
+        totals = {'total': 0, 'cleaned': 0, 'duplicates': 0}
+        skipped = 0
+        for file_path in news_files:
+            # manifest / digest 소유자 키는 입력 형식과 무관하게 news_YYYY_MM.json
+            filename = f"{strip_suffix(file_path)}.json"
             output_path = cleaned_news_dir / f"{filename.replace('.json', '_cleaned.json')}"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(cleaned_data, f, ensure_ascii=False, indent=2)
+            input_hash = file_sha256(file_path)
+            entry = manifest.get(filename, {})
+
+            if (not jobs and output_path.exists() and entry.get('input_sha256') == input_hash
+                    and entry.get('rule_version') == rule_version):
+                for key in totals:
+                    totals[key] += entry['counts'][key]
+                skipped += 1
+                continue
+            jobs.append((filename, file_path, str(output_path), input_hash))
+
+        if skipped:
+            print(f"변경 없는 월 건너뜀: {skipped}개")
+
+        # 다시 처리할 월의 digest와 manifest 항목을 먼저 모두 해제
+        # (뒤 월이 가진 digest 때문에 앞 월 기사가 중복으로 빠지지 않도록, 중단되어도 다음 실행에서 다시 처리)
+        for filename, _, _, _ in jobs:
+            digest_index.release(filename)
+            manifest.pop(filename, None)
+        if jobs:
+            digest_index.commit()
+            write_json_atomic(manifest_path, manifest, indent=2)
+
+        def record(job, counts):
+            filename, _, _, input_hash = job
+            manifest[filename] = {'input_sha256': input_hash, 'rule_version': rule_version,
+                                  'counts': counts}
+            for key in totals:
+                totals[key] += counts[key]
+            # 월 단위로 manifest 갱신 (중단되어도 완료된 월은 다음 실행에서 건너뜀)
+            write_json_atomic(manifest_path, manifest, indent=2)
+
+        def dedupe(job, result):
+            filename, _, output_path, _ = job
+            cleaned, total = result
+            record(job, self.dedupe_news_articles(cleaned, total, digest_index, filename, output_path))
+
+        # 정제는 워커에서 병렬로, 중복 판정과 저장은 부모에서 월 순서대로
+        if workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_clean_news_worker, [job[1] for job in jobs])
+                for job, result in tqdm(zip(jobs, results), total=len(jobs), desc="뉴스 파일 처리"):
+                    dedupe(job, result)
+        else:
+            for job in tqdm(jobs, desc="뉴스 파일 처리"):
+                dedupe(job, self.clean_news_articles(job[1]))
+        digest_index.close()
+
+        total_articles = totals['total']
+        cleaned_articles = totals['cleaned']
+        removed_duplicates = totals['duplicates']
 
         print(f"\n✓ 뉴스 정제 완료:")
         print(f"  - 전체 기사: {total_articles:,}")
         print(f"  - 정제된 기사: {cleaned_articles:,}")
         print(f"  - 제거된 중복: {removed_duplicates:,}")
-        print(f"  - 정제율: {(cleaned_articles/total_articles)*100:.1f}%")
+        if total_articles:
+            print(f"  - 정제율: {(cleaned_articles/total_articles)*100:.1f}%")
 
         return cleaned_articles
 
@@ -193,8 +388,7 @@ class DataCleaner:
             print(f"MPB 파일을 찾을 수 없습니다: {mpb_file}")
             return 0
 
-        with open(mpb_file, 'r', encoding='utf-8') as f:
-            mpb_data = json.load(f)
+        mpb_data = read_records(mpb_file)
 
         print(f"처리할 의사록: {len(mpb_data)}개")
 
@@ -230,14 +424,16 @@ class DataCleaner:
         print("채권 보고서 정제 시작")
         print("="*60)
 
-        bond_file = PROJECT_ROOT / 'data/auxiliary/bond_reports_consolidated.json'
+        # bond_consolidator.py 출력 (JSON Lines(압축 포함) 우선, 이전 JSON 배열 형식도 지원)
+        candidates = [PROJECT_ROOT / f'data/auxiliary/bond_reports_consolidated{suffix}'
+                      for suffix in ('.jsonl', '.jsonl.gz', '.jsonl.zst', '.json')]
+        bond_file = next((path for path in candidates if path.exists()), candidates[-1])
 
         if not bond_file.exists():
             print(f"채권 파일을 찾을 수 없습니다: {bond_file}")
             return 0
 
-        with open(bond_file, 'r', encoding='utf-8') as f:
-            bond_data = json.load(f)
+        bond_data = read_records(bond_file)
 
         print(f"처리할 보고서: {len(bond_data):,}개")
 
@@ -267,7 +463,7 @@ class DataCleaner:
 
         return len(cleaned_bonds)
 
-    def clean_all(self):
+    def clean_all(self, workers=1):
         """모든 데이터 정제"""
         start_time = datetime.now()
 
@@ -276,7 +472,7 @@ class DataCleaner:
         print("="*60)
 
         # 각 데이터 소스 정제
-        news_count = self.clean_news_data()
+        news_count = self.clean_news_data(workers=workers)
         mpb_count = self.clean_mpb_data()
         bond_count = self.clean_bond_data()
 
@@ -296,14 +492,16 @@ def main():
     parser = argparse.ArgumentParser(description='통합 데이터 정제')
     parser.add_argument('--type', choices=['all', 'news', 'mpb', 'bond'],
                        default='all', help='정제할 데이터 타입')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='뉴스 월별 파일 병렬 정제 프로세스 수')
     args = parser.parse_args()
 
     cleaner = DataCleaner()
 
     if args.type == 'all':
-        cleaner.clean_all()
+        cleaner.clean_all(workers=args.workers)
     elif args.type == 'news':
-        cleaner.clean_news_data()
+        cleaner.clean_news_data(workers=args.workers)
     elif args.type == 'mpb':
         cleaner.clean_mpb_data()
     elif args.type == 'bond':
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+asyncio 기반 채권 리포트 크롤러
+- aiohttp 세션 하나(연결 풀 공유)로 목록 / 상세 / PDF 요청 처리
+- 호스트별 동시 요청 수 제한 (asyncio.Semaphore)
+- 429 / 5xx / 타임아웃은 비동기 지수 백오프로 재시도 (스레드를 재우지 않음)
+- 목록 페이지 → bounded 큐 → 상세/PDF 워커, PDF 텍스트 추출은 ProcessPool
+- 리포트가 완료되는 즉시 JSON Lines로 한 줄씩 출력 (전체를 메모리에 모으지 않음)
+- --base-url로 로컬 대체 서버(stand_in_server.py, 네이버 리서치 형식 fixture)를 대상으로 실행 가능
+
+사용법:
+    python bond_async_crawler.py 2024-01-01 2024-01-31 --output bond_reports.jsonl
+    python bond_async_crawler.py 2024-01-01 2024-01-31 --base-url http://127.0.0.1:8080
+    python stand_in_server.py check     # 대체 서버로 수집 결과 / 호스트별 동시 요청 수 검증
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.pdf_store import PdfStore
+from common.pdf_text import extract_pdf_text
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+NAVER_FINANCE = "https://finance.naver.com"
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def extract_report_text(pdf_content, max_chars=50000):
+    """PDF 바이트 → 텍스트 (추출 프로세스에서 실행)"""
+    return extract_pdf_text(pdf_content, max_chars=max_chars)
+
+
+def parse_total_pages(html):
+    """목록 첫 페이지 → 마지막 페이지 번호"""
+    soup = BeautifulSoup(html, 'html.parser')
+    last_page_link = soup.select_one('td.pgRR > a')
+    if last_page_link:
+        match = re.search(r'page=(\d+)', last_page_link.get('href', ''))
+        if match:
+            return int(match.group(1))
+
+    pages = [int(link.text.strip()) for link in soup.select('table.Nnavi a') if link.text.strip().isdigit()]
+    return max(pages) if pages else 1
+
+
+def parse_list_page(html, base_url):
+    """목록 페이지 → 상세 페이지 URL 목록"""
+    soup = BeautifulSoup(html, 'html.parser')
+    urls = []
+    for row in soup.select('table.type_1 tr'):
+        link = row.select_one('a')
+        if link and link.get('href'):
+            urls.append(urljoin(base_url + '/research/', link['href']))
+    return urls
+
+
+def parse_report_page(html, report_url=''):
+    """상세 페이지 → {'company', 'date', 'title', 'pdf_url'} 또는 None"""
+    soup = BeautifulSoup(html, 'html.parser')
+    source = soup.select_one('p.source')
+    subject = soup.select_one('th.view_sbj')
+    if not source or not subject:
+        return None
+
+    report_info = source.text.strip().replace("\n", '').replace("\t", '').split("|")
+    company = report_info[0].strip()
+    date = report_info[1].strip() if len(report_info) > 1 else ''
+    title = subject.text.strip().replace("\n", '').replace("\t", '')
+    title = title.split(company)[0].strip() if company else title
+
+    pdf_url = None
+    for link in soup.select('a.con_link'):
+        href = link.get('href', '')
+        if '.pdf' in href.lower():
+            pdf_url = urljoin(report_url, href)
+            break
+
+    return {'company': company, 'date': date, 'title': title, 'pdf_url': pdf_url}
+
+
+class AsyncBondCrawler:
+    """단일 연결 풀 + 호스트별 세마포어 기반 비동기 채권 리포트 크롤러"""
+
+    def __init__(self, start_date, end_date, base_url=NAVER_FINANCE, per_host=4, max_connections=16,
+                 report_workers=16, extract_workers=None, max_retries=3, timeout=30, pdf_store=None):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.base_url = base_url.rstrip('/')
+        self.per_host = per_host
+        self.max_connections = max_connections
+        self.report_workers = report_workers
+        self.extract_workers = extract_workers or os.cpu_count() or 1
+        self.max_retries = max_retries
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.pdf_store = pdf_store
+
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36',
+            'Referer': 'https://www.naver.com/'
+        }
+        self.host_limits = {}
+
+        self.stats = {
+            'total_pages': 0,
+            'total_reports': 0,
+            'successful_pdfs': 0,
+            'failed_reports': 0,
+            'skipped_no_pdf': 0,
+            'retry_count': 0,
+            'bytes_downloaded': 0
+        }
+
+    def _host_limit(self, url):
+        """호스트별 세마포어 (PDF CDN과 목록 서버는 따로 제한)"""
+        host = urlparse(url).netloc
+        if host not in self.host_limits:
+            self.host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self.host_limits[host]
+
+    async def fetch(self, session, url, params=None, binary=False):
+        """재시도/백오프가 포함된 GET → str / bytes, 실패 시 None"""
+        for attempt in range(self.max_retries):
+            try:
+                async with self._host_limit(url):
+                    async with session.get(url, params=params) as response:
+                        if response.status == 200:
+                            body = await response.read()
+                            self.stats['bytes_downloaded'] += len(body)
+                            if body:
+                                if binary:
+                                    return body
+                                return body.decode(response.get_encoding() or 'utf-8', errors='replace')
+                            logger.warning(f"0바이트 응답: {url}")
+                        elif response.status not in RETRY_STATUS:
+                            logger.warning(f"HTTP {response.status}: {url}")
+                            return None
+                        else:
+                            logger.warning(f"HTTP {response.status} (시도 {attempt+1}/{self.max_retries}): {url}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"요청 실패 (시도 {attempt+1}/{self.max_retries}): {url} - {e!r}")
+
+            # 세마포어를 놓은 상태에서 대기 → 다른 요청은 계속 진행
+            if attempt < self.max_retries - 1:
+                self.stats['retry_count'] += 1
+                await asyncio.sleep(2 ** attempt + random.random())
+        return None
+
+    def _list_params(self, page):
+        return {
+            'keyword': '',
+            'brokerCode': '',
+            'searchType': 'writeDate',
+            'writeFromDate': self.start_date,
+            'writeToDate': self.end_date,
+            'page': page
+        }
+
+    async def _produce(self, session, reports):
+        """목록 페이지를 돌며 상세 URL을 큐에 넣음 (큐가 차면 대기)"""
+        list_url = f"{self.base_url}/research/debenture_list.naver"
+        first = await self.fetch(session, list_url, self._list_params(1))
+        if first is None:
+            logger.error("목록 첫 페이지 요청 실패")
+            return
+
+        total_pages = parse_total_pages(first)
+        self.stats['total_pages'] = total_pages
+        logger.info(f"전체 페이지 수: {total_pages}")
+
+        seen = set()
+
+        async def enqueue(html, page):
+            urls = [url for url in parse_list_page(html, self.base_url) if url not in seen]
+            seen.update(urls)
+            logger.info(f"페이지 {page}: {len(urls)}개 리포트 발견")
+            for url in urls:
+                self.stats['total_reports'] += 1
+                await reports.put(url)
+
+        await enqueue(first, 1)
+        # 목록 페이지도 같은 호스트 제한 안에서 동시에 요청하되, 큐 순서는 페이지 순서 유지
+        for chunk_start in range(2, total_pages + 1, self.per_host):
+            pages = range(chunk_start, min(chunk_start + self.per_host, total_pages + 1))
+            htmls = await asyncio.gather(*(self.fetch(session, list_url, self._list_params(p)) for p in pages))
+            for page, html in zip(pages, htmls):
+                if html is None:
+                    logger.error(f"페이지 {page} 처리 실패")
+                    continue
+                await enqueue(html, page)
+
+    async def _process_report(self, session, executor, report_url):
+        """상세 페이지 → PDF → 텍스트 → item 또는 None"""
+        html = await self.fetch(session, report_url)
+        info = parse_report_page(html, report_url) if html else None
+        if info is None:
+            self.stats['failed_reports'] += 1
+            return None
+        if not info['pdf_url']:
+            logger.info(f"PDF 없음: {info['title']}")
+            self.stats['skipped_no_pdf'] += 1
+            return None
+
+        pdf_content = await self.fetch(session, info['pdf_url'], binary=True)
+        if pdf_content is None:
+            logger.error(f"PDF 다운로드 실패: {info['title']}")
+            self.stats['failed_reports'] += 1
+            return None
+
+        # 저장소 기록(gzip + SQLite)은 스레드에서 → 이벤트 루프의 다른 다운로드를 막지 않음
+        if self.pdf_store is not None:
+            await asyncio.to_thread(self.pdf_store.add, info['pdf_url'], pdf_content, 'bond',
+                                    title=info['title'], company=info['company'], date=info['date'],
+                                    report_url=report_url)
+
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(executor, extract_report_text, pdf_content)
+        if not text:
+            self.stats['failed_reports'] += 1
+            return None
+
+        self.stats['successful_pdfs'] += 1
+        return {
+            'report_id': hashlib.md5(f"{info['title']}_{info['company']}_{info['date']}".encode()).hexdigest(),
+            'date': info['date'],
+            'title': info['title'],
+            'company': info['company'],
+            'content': text,
+            'link': info['pdf_url'],
+            'report_url': report_url,
+            'collected_at': datetime.now().isoformat()
+        }
+
+    async def crawl(self):
+        """완료되는 순서대로 item을 내보내는 async generator"""
+        reports = asyncio.Queue(maxsize=self.report_workers * 4)
+        items = asyncio.Queue(maxsize=self.report_workers * 2)
+        done = object()
+
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers,
+                                         timeout=self.timeout) as session:
+            with ProcessPoolExecutor(max_workers=self.extract_workers) as executor:
+
+                async def worker():
+                    while True:
+                        report_url = await reports.get()
+                        if report_url is done:
+                            break
+                        try:
+                            item = await self._process_report(session, executor, report_url)
+                        except Exception as e:
+                            logger.error(f"리포트 처리 실패 ({report_url}): {e!r}")
+                            self.stats['failed_reports'] += 1
+                            item = None
+                        if item is not None:
+                            await items.put(item)
+
+                async def run_all():
+                    workers = [asyncio.create_task(worker()) for _ in range(self.report_workers)]
+                    try:
+                        await self._produce(session, reports)
+                    finally:
+                        for _ in workers:
+                            await reports.put(done)
+                        await asyncio.gather(*workers)
+                        await items.put(done)
+
+                runner = asyncio.create_task(run_all())
+                while True:
+                    item = await items.get()
+                    if item is done:
+                        break
+                    yield item
+                await runner
+
+    async def run(self, output_path, csv_dir=None):
+        """크롤링 실행, item을 JSON Lines로 즉시 기록 → 통계 dict"""
+        start = time.perf_counter()
+        logger.info("="*60)
+        logger.info(f"채권 리포트 비동기 크롤링: {self.start_date} ~ {self.end_date} ({self.base_url})")
+        logger.info(f"호스트별 동시 요청 {self.per_host}, 리포트 워커 {self.report_workers}, "
+                    f"추출 프로세스 {self.extract_workers}")
+        logger.info("="*60)
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        if csv_dir:
+            os.makedirs(csv_dir, exist_ok=True)
+
+        with open(output_path, 'a', encoding='utf-8') as f:
+            async for item in self.crawl():
+                f.write(json.dumps(item, ensure_ascii=False) + '\n')
+                f.flush()
+                if csv_dir:
+                    self._write_csv(csv_dir, item)
+
+        self.stats['seconds'] = round(time.perf_counter() - start, 1)
+        logger.info(f"크롤링 완료: {self.stats}")
+        return self.stats
+
+    @staticmethod
+    def _write_csv(csv_dir, item):
+        """bond_consolidator 입력 형식 CSV (Date, Title, Content, Link)"""
+        title = item['title'].replace('/', '_')
+        csv_path = os.path.join(csv_dir, f"{item['date']}_{title}_{item['company']}.csv")
+        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Date', 'Title', 'Content', 'Link'])
+            writer.writerow([item['date'], title, item['content'], item['link']])
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='asyncio 채권 리포트 크롤러')
+    parser.add_argument('start_date', nargs='?', default="2014-01-01")
+    parser.add_argument('end_date', nargs='?', default=datetime.now().strftime("%Y-%m-%d"))
+    parser.add_argument('--base-url', default=NAVER_FINANCE, help='대상 서버 (로컬 대체 서버 테스트용)')
+    parser.add_argument('--output', default='bond_reports_async.jsonl', help='JSON Lines 출력 파일')
+    parser.add_argument('--csv-dir', default=None, help='리포트별 CSV도 저장할 디렉토리')
+    parser.add_argument('--per-host', type=int, default=4, help='호스트별 동시 요청 수')
+    parser.add_argument('--max-connections', type=int, default=16, help='전체 연결 풀 크기')
+    parser.add_argument('--report-workers', type=int, default=16, help='상세/PDF 처리 코루틴 수')
+    parser.add_argument('--extract-workers', type=int, default=None, help='PDF 추출 프로세스 수')
+    parser.add_argument('--no-store', action='store_true', help='원본 PDF를 저장소에 보관하지 않음')
+    args = parser.parse_args()
+
+    crawler = AsyncBondCrawler(
+        args.start_date, args.end_date, base_url=args.base_url, per_host=args.per_host,
+        max_connections=args.max_connections, report_workers=args.report_workers,
+        extract_workers=args.extract_workers, pdf_store=None if args.no_store else PdfStore()
+    )
+    return asyncio.run(crawler.run(args.output, csv_dir=args.csv_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """
 개선된 채권 리포트 크롤러
-- 재시도 로직
+- 재시도 로직 (대기는 고정 sleep 대신 공용 적응형 속도 제한기 core.rate_limiter가 담당)
 - 에러 핸들링 강화
 - 진행상황 추적
 - 0바이트 파일 방지
+- 원본 PDF는 내용 주소 기반 저장소(common/pdf_store)에 보관 → 오프라인 재추출 가능
+- 2단계 파이프라인: 다운로드 스레드 → bounded 큐 → 텍스트 추출 프로세스 풀
+  (두 풀의 크기는 독립적으로 설정, 큐 깊이 / 단계별 처리량 통계)
 """
 
 import os
@@ -12,14 +15,24 @@ import sys
 import time
 import json
 import csv
+import queue
 import logging
+import argparse
+import threading
+from functools import partial
 from datetime import datetime, timedelta
 import requests
 from bs4 import BeautifulSoup
-from PyPDF2 import PdfReader
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait
 from urllib.parse import urljoin
 import hashlib
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.pdf_store import PdfStore
+from common.pdf_text import extract_pdf_text
+from core.rate_limiter import mount_limited
 
 # 로깅 설정
 logging.basicConfig(
@@ -32,13 +45,62 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def extract_report_text(pdf_content, max_chars=50000):
+    """PDF 바이트 → (텍스트, 소요 초) (추출 프로세스에서 실행)"""
+    start = time.perf_counter()
+    text = extract_pdf_text(pdf_content, max_chars=max_chars)  # 최대 50000자
+    return text, time.perf_counter() - start
+
+
+class PipelineStats:
+    """다운로드 → 추출 파이프라인 통계 (스레드 안전)"""
+
+    def __init__(self, download_workers, extract_workers):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.workers = {'download': download_workers, 'extract': extract_workers}
+        self.counts = {'download': 0, 'extract': 0}
+        self.busy = {'download': 0.0, 'extract': 0.0}
+        self.queue_samples = 0
+        self.queue_total = 0
+        self.queue_max = 0
+
+    def record(self, stage, seconds):
+        """단계별 처리 1건과 작업 시간 기록"""
+        with self.lock:
+            self.counts[stage] += 1
+            self.busy[stage] += seconds
+
+    def sample_queue(self, depth):
+        """큐 깊이 기록 (put/get 시점마다)"""
+        with self.lock:
+            self.queue_samples += 1
+            self.queue_total += depth
+            self.queue_max = max(self.queue_max, depth)
+
+    def summary(self):
+        """단계별 처리량(건/초), 작업자 가동률, 큐 깊이 평균/최대"""
+        with self.lock:
+            elapsed = max(time.perf_counter() - self.started, 1e-9)
+            result = {'elapsed_seconds': round(elapsed, 1)}
+            for stage, count in self.counts.items():
+                result[f'{stage}_count'] = count
+                result[f'{stage}_per_second'] = round(count / elapsed, 2)
+                result[f'{stage}_utilization'] = round(self.busy[stage] / (elapsed * self.workers[stage]), 2)
+            result['queue_avg'] = round(self.queue_total / self.queue_samples, 1) if self.queue_samples else 0.0
+            result['queue_max'] = self.queue_max
+            return result
+
+
 class BondCrawler:
-    def __init__(self, start_date=None, end_date=None):
+    def __init__(self, start_date=None, end_date=None, rate_limiter=None):
         """
         초기화
         Args:
             start_date: 시작일 (YYYY-MM-DD)
             end_date: 종료일 (YYYY-MM-DD)
+            rate_limiter: 요청 속도 제한기 (없으면 공용 shared_limiter)
         """
         self.start_date = start_date or "2014-01-01"
         self.end_date = end_date or datetime.now().strftime("%Y-%m-%d")
@@ -53,11 +115,12 @@ class BondCrawler:
             'Upgrade-Insecure-Requests': '1'
         }
         
-        # 세션 사용으로 연결 재사용
-        self.session = requests.Session()
+        # 세션 사용으로 연결 재사용 (모든 요청이 도메인별 속도 제한기를 거침)
+        self.session = mount_limited(requests.Session(), rate_limiter)
         self.session.headers.update(self.headers)
         
-        # 통계
+        # 통계 (다운로드 스레드와 추출 콜백에서 함께 갱신)
+        self.stats_lock = threading.Lock()
         self.stats = {
             'total_pages': 0,
             'total_reports': 0,
@@ -67,10 +130,9 @@ class BondCrawler:
             'retry_count': 0
         }
         
-        # 데이터 저장 디렉토리
-        self.pdf_dir = "./pdfs"
+        # 데이터 저장 디렉토리 (원본 PDF는 sha256 이름으로 저장소에 보관)
+        self.pdf_store = PdfStore()
         self.csv_dir = "./dataset_improved"
-        os.makedirs(self.pdf_dir, exist_ok=True)
         os.makedirs(self.csv_dir, exist_ok=True)
         
         # 이미 처리된 파일 추적
@@ -157,27 +219,30 @@ class BondCrawler:
             except Exception as e:
                 logger.error(f"다운로드 오류: {e}")
             
-            # 재시도 전 대기
+            # 재시도 (대기는 속도 제한기 백오프가 담당)
             if attempt < max_retries - 1:
-                wait_time = 2 ** attempt  # 지수 백오프
-                time.sleep(wait_time)
-                self.stats['retry_count'] += 1
+                self.count('retry_count')
         
         return None
     
-    def process_report(self, report_url, title, company, date):
-        """개별 리포트 처리"""
+    def count(self, key):
+        """통계 카운터 증가"""
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def download_report(self, report_url, title, company, date):
+        """리포트 페이지 접근 + PDF 다운로드/저장 (I/O 단계) → 추출 작업 dict 또는 None"""
         # 중복 확인
         report_id = hashlib.md5(f"{title}_{company}_{date}".encode()).hexdigest()
         if report_id in self.processed:
             logger.debug(f"이미 처리됨: {title}")
-            return
-        
+            return None
+
         try:
             # 리포트 페이지 접근
             response = self.session.get(report_url, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
-            
+
             # PDF 링크 찾기
             pdf_link = None
             for link in soup.select('a.con_link'):
@@ -185,69 +250,137 @@ class BondCrawler:
                 if '.pdf' in href.lower():
                     pdf_link = href
                     break
-            
+
             if not pdf_link:
                 logger.info(f"PDF 없음: {title}")
-                self.stats['skipped_no_pdf'] += 1
-                return
-            
+                self.count('skipped_no_pdf')
+                return None
+
             # PDF 다운로드
             pdf_content = self.download_with_retry(pdf_link)
             if not pdf_content:
                 logger.error(f"PDF 다운로드 실패: {title}")
-                self.stats['failed_pdfs'] += 1
-                return
-            
-            # PDF 저장
+                self.count('failed_pdfs')
+                return None
+
+            # PDF 원본 보관 (텍스트 추출은 다시 읽지 않고 메모리에서)
             safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
-            pdf_filename = f"{date}_{safe_title}_{company}.pdf"
-            pdf_path = os.path.join(self.pdf_dir, pdf_filename)
-            
-            with open(pdf_path, 'wb') as f:
-                f.write(pdf_content)
-            
-            # PDF 텍스트 추출
-            text_content = self.extract_pdf_text(pdf_path)
-            
+            self.pdf_store.add(pdf_link, pdf_content, 'bond', title=title, company=company,
+                               date=date, report_url=report_url)
+
+        except Exception as e:
+            logger.error(f"리포트 처리 실패 ({title}): {e}")
+            self.count('failed_pdfs')
+            return None
+
+        return {
+            'report_id': report_id,
+            'title': title,
+            'company': company,
+            'date': date,
+            'pdf_link': pdf_link,
+            'pdf_content': pdf_content,
+            'base_name': f"{date}_{safe_title}_{company}"
+        }
+
+    def save_report(self, job, text_content):
+        """추출된 텍스트 CSV 저장 및 처리 완료 기록"""
+        try:
             # CSV 저장
-            csv_filename = f"{date}_{safe_title}_{company}.csv"
-            csv_path = os.path.join(self.csv_dir, csv_filename)
-            
+            csv_path = os.path.join(self.csv_dir, f"{job['base_name']}.csv")
+
             with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(['Date', 'Title', 'Company', 'Content', 'PDF_URL'])
-                writer.writerow([date, title, company, text_content, pdf_link])
-            
+                writer.writerow([job['date'], job['title'], job['company'], text_content, job['pdf_link']])
+
             # 성공 기록
-            self.processed.add(report_id)
-            self.stats['successful_pdfs'] += 1
-            logger.info(f"✓ 수집 완료: {title}")
-            
-            # 메모리 관리 - PDF 파일 삭제 옵션
-            if os.path.getsize(pdf_path) > 10 * 1024 * 1024:  # 10MB 이상
-                os.remove(pdf_path)
-                logger.debug(f"대용량 PDF 삭제: {pdf_filename}")
-            
-        except Exception as e:
-            logger.error(f"리포트 처리 실패 ({title}): {e}")
-            self.stats['failed_pdfs'] += 1
-    
-    def extract_pdf_text(self, pdf_path):
-        """PDF 텍스트 추출"""
-        try:
-            with open(pdf_path, 'rb') as f:
-                pdf_reader = PdfReader(f)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-                
-                # 텍스트 정제
-                text = ' '.join(text.split())
-                return text[:50000]  # 최대 50000자
+            self.processed.add(job['report_id'])
+            self.count('successful_pdfs')
+            logger.info(f"✓ 수집 완료: {job['title']}")
+
         except Exception as e:
-            logger.error(f"PDF 텍스트 추출 실패: {e}")
-            return ""
-    
+            logger.error(f"리포트 처리 실패 ({job['title']}): {e}")
+            self.count('failed_pdfs')
+
+    def process_report(self, report_url, title, company, date):
+        """개별 리포트 처리 (다운로드와 추출을 현재 스레드에서 순서대로 실행)"""
+        job = self.download_report(report_url, title, company, date)
+        if job is not None:
+            self.save_report(job, self.extract_pdf_text(job['pdf_content']))
+
+    def extract_pdf_text(self, pdf_content):
+        """PDF 텍스트 추출 (메모리에서 파싱)"""
+        return extract_report_text(pdf_content)[0]
+
+    def run_pipeline(self, reports, download_workers=5, extract_workers=None, queue_size=32):
+        """다운로드 스레드 풀 → bounded 큐 → 추출 프로세스 풀
+
+        큐가 가득 차면 다운로드 스레드가 대기하므로, 추출이 느려도 메모리에 들고 있는
+        미처리 PDF 수는 queue_size + 추출 중인 작업 수로 제한된다.
+        """
+        extract_workers = extract_workers or os.cpu_count() or 1
+        pipeline = PipelineStats(download_workers, extract_workers)
+        jobs = queue.Queue(maxsize=queue_size)
+        in_flight = threading.BoundedSemaphore(extract_workers * 2)
+        done = {'count': 0}
+
+        logger.info(f"파이프라인: 다운로드 {download_workers} 스레드 / 추출 {extract_workers} 프로세스 / 큐 {queue_size}")
+
+        def download(report):
+            start = time.perf_counter()
+            job = self.download_report(report['url'], report['title'], report['company'], report['date'])
+            pipeline.record('download', time.perf_counter() - start)
+            if job is not None:
+                jobs.put(job)  # 큐가 가득 차면 대기 (backpressure)
+                pipeline.sample_queue(jobs.qsize())
+
+        def on_extracted(job, future):
+            try:
+                text_content, seconds = future.result()
+                pipeline.record('extract', seconds)
+                self.save_report(job, text_content)
+            except Exception as e:
+                logger.error(f"PDF 텍스트 추출 실패 ({job['title']}): {e}")
+                self.count('failed_pdfs')
+            finally:
+                in_flight.release()
+
+            done['count'] += 1
+            if done['count'] % 100 == 0:
+                logger.info(f"진행: 추출 {done['count']} / 리포트 {len(reports)} | {pipeline.summary()}")
+                self.save_processed()  # 중간 저장
+
+        def dispatch(extract_pool):
+            while True:
+                job = jobs.get()
+                pipeline.sample_queue(jobs.qsize())
+                if job is None:
+                    break
+                in_flight.acquire()
+                try:
+                    future = extract_pool.submit(extract_report_text, job['pdf_content'])
+                except Exception as e:
+                    # 디스패처가 멈추면 큐가 차서 다운로드 스레드도 멈추므로 건별로 실패 처리
+                    logger.error(f"PDF 추출 작업 제출 실패 ({job['title']}): {e}")
+                    self.count('failed_pdfs')
+                    in_flight.release()
+                    continue
+                future.add_done_callback(partial(on_extracted, job))
+
+        with ProcessPoolExecutor(max_workers=extract_workers) as extract_pool:
+            dispatcher = threading.Thread(target=dispatch, args=(extract_pool,), daemon=True)
+            dispatcher.start()
+
+            with ThreadPoolExecutor(max_workers=download_workers) as download_pool:
+                wait([download_pool.submit(download, report) for report in reports])
+
+            jobs.put(None)
+            dispatcher.join()
+
+        self.stats['pipeline'] = pipeline.summary()
+        return self.stats['pipeline']
+
     def process_page(self, page_num):
         """페이지별 리포트 목록 처리"""
         url = f"{self.base_url}/research/debenture_list.naver"
@@ -295,7 +428,7 @@ class BondCrawler:
             logger.error(f"페이지 {page_num} 처리 실패: {e}")
             return []
     
-    def run(self, max_workers=5):
+    def run(self, max_workers=5, extract_workers=None, queue_size=32):
         """크롤링 실행"""
         logger.info("="*60)
         logger.info(f"채권 리포트 크롤링 시작")
@@ -319,27 +452,10 @@ class BondCrawler:
         self.stats['total_reports'] = len(all_reports)
         logger.info(f"전체 리포트 수: {len(all_reports)}")
         
-        # 리포트별 PDF 다운로드 및 처리
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
-            for report in all_reports:
-                future = executor.submit(
-                    self.process_report,
-                    report['url'],
-                    report['title'],
-                    report['company'],
-                    report['date']
-                )
-                futures.append(future)
-            
-            # 진행상황 표시
-            completed = 0
-            for future in as_completed(futures):
-                completed += 1
-                if completed % 100 == 0:
-                    logger.info(f"진행: {completed}/{len(all_reports)}")
-                    self.save_processed()  # 중간 저장
-        
+        # 리포트별 PDF 다운로드(스레드) → 텍스트 추출(프로세스)
+        self.run_pipeline(all_reports, download_workers=max_workers,
+                          extract_workers=extract_workers, queue_size=queue_size)
+
         # 최종 저장
         self.save_processed()
         
@@ -354,17 +470,24 @@ class BondCrawler:
         logger.info(f"재시도 횟수: {self.stats['retry_count']}")
         success_rate = (self.stats['successful_pdfs'] / self.stats['total_reports'] * 100) if self.stats['total_reports'] > 0 else 0
         logger.info(f"성공률: {success_rate:.1f}%")
+        pipeline = self.stats.get('pipeline', {})
+        if pipeline:
+            logger.info(f"다운로드: {pipeline['download_per_second']}건/초 (가동률 {pipeline['download_utilization']})")
+            logger.info(f"추출: {pipeline['extract_per_second']}건/초 (가동률 {pipeline['extract_utilization']})")
+            logger.info(f"큐 깊이: 평균 {pipeline['queue_avg']} / 최대 {pipeline['queue_max']}")
         logger.info("="*60)
 
 if __name__ == "__main__":
     # 명령행 인자 처리
-    if len(sys.argv) >= 3:
-        start_date = sys.argv[1]
-        end_date = sys.argv[2]
-    else:
-        start_date = "2014-01-01"
-        end_date = datetime.now().strftime("%Y-%m-%d")
-    
+    parser = argparse.ArgumentParser(description='채권 리포트 크롤러')
+    parser.add_argument('start_date', nargs='?', default="2014-01-01")
+    parser.add_argument('end_date', nargs='?', default=datetime.now().strftime("%Y-%m-%d"))
+    parser.add_argument('--download-workers', type=int, default=5, help='다운로드 스레드 수')
+    parser.add_argument('--extract-workers', type=int, default=None, help='PDF 추출 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--queue-size', type=int, default=32, help='다운로드 → 추출 큐 크기')
+    args = parser.parse_args()
+
     # 크롤러 실행
-    crawler = BondCrawler(start_date, end_date)
-    crawler.run(max_workers=5)
\ No newline at end of file
+    crawler = BondCrawler(args.start_date, args.end_date)
+    crawler.run(max_workers=args.download_workers, extract_workers=args.extract_workers,
+                queue_size=args.queue_size)
@@ -2,11 +2,8 @@
 
 from bs4 import BeautifulSoup
 import requests
-import time
 import re
-from requests import get
 from urllib import request
-from PyPDF2 import PdfReader
 import os
 import csv
 import shutil
@@ -17,6 +14,19 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 1 - Command line arguments support for monthly collection
 import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.pdf_store import PdfStore
+from common.pdf_text import extract_pdf_text
+from core.rate_limiter import mount_limited
+
+# 원본 PDF 저장소 (sha256 이름, 오프라인 재추출용)
+pdf_store = PdfStore()
+
+# 모든 요청은 공용 적응형 속도 제한기를 거침 (고정 sleep 대신, 페이지 10 × 리포트 10 스레드가 공유)
+session = mount_limited(requests.Session(), pool_maxsize=100)
 
 # Default date range
 default_start = "2014-08-11"  # 프로젝트 시작일
@@ -40,7 +50,7 @@ headers = {
 }
 
 # 2
-response = requests.get(url, headers=headers)
+response = session.get(url, headers=headers)
 soup = BeautifulSoup(response.text, 'html.parser')
 
 last_page = soup.select_one('td.pgRR>a').attrs['href']
@@ -56,7 +66,7 @@ def process_report(report_link):
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36', 
         'Referer': 'https://www.naver.com/'
     }
-    response = requests.get(report_page, headers=headers)
+    response = session.get(report_page, headers=headers)
     soup = BeautifulSoup(response.text, 'html.parser')
 
     try:
@@ -82,25 +92,17 @@ def process_report(report_link):
             print("PDF 파일이 존재합니다")
             content = content.split(pdf_name)[0]  # 내용과 PDF 분리
 
-            # PDF 저장
-            with open(pdf_name, "wb") as file:   # open in binary mode
-                response = get(pdf_link)
-                file.write(response.content)
-                time.sleep(1)
+            # PDF 다운로드 → 원본은 저장소에 보관
+            response = session.get(pdf_link)
+            pdf_store.add(pdf_link, response.content, 'bond', title=title, company=cop_name,
+                          date=published_date, report_url=report_page)
 
-            # PDF 텍스트 추출 (PyPDF2 사용)
+            # PDF 텍스트 추출 (메모리에서 파싱, 공백 정리 포함 / 글자 수 제한 없음)
             try:
-                with open(pdf_name, 'rb') as pdf_file:
-                    pdf_reader = PdfReader(pdf_file)
-                    text = ""
-                    for page in pdf_reader.pages:
-                        text += page.extract_text()
+                text = extract_pdf_text(response.content, max_chars=None)
                 
                 if text:
-                    # 기본적인 텍스트 정제
-                    new_str = re.sub("\n", " ", text)
-                    new_str = re.sub(r'\s+', ' ', new_str)  # 여러 공백을 하나로
-                    kospacing_result = new_str.strip()  # pykospacing 대신 기본 정제
+                    kospacing_result = text  # pykospacing 대신 기본 정제
 
                     directory = f'./dataset_2'
                     os.makedirs(directory, exist_ok=True)  # 디렉토리가 없으면 생성
@@ -113,9 +115,6 @@ def process_report(report_link):
                         csvwriter.writerow([published_date, title, kospacing_result, pdf_link])  # CSV 데이터
 
                     print(f"Saved CSV: {csv_file_path}")
-
-                    # PDF 파일 삭제
-                    os.remove(pdf_name)
                 else:
                     print(f"PDF 파일을 읽을 수 없습니다: {pdf_name}")
                     
@@ -130,7 +129,7 @@ def process_report(report_link):
 # Function to process each page of reports
 def process_page(page):
     page_url = f"https://finance.naver.com/research/debenture_list.naver?keyword=&brokerCode=&searchType=writeDate&writeFromDate={target_day}&writeToDate={today}&x=0&y=0&page={page}"
-    response = requests.get(page_url, headers=headers)
+    response = session.get(page_url, headers=headers)
     soup = BeautifulSoup(response.text, 'html.parser')
     reports = soup.select('table.type_1 tr')
 
@@ -2,16 +2,17 @@
 """
 채권 리포트 병렬 수집 스크립트
 네이버 금융에서 채권 분석 리포트를 효율적으로 수집
+결과는 페이지가 끝날 때마다 JSON Lines / CSV에 바로 기록 (전체 리포트를 메모리에 모으지 않음)
+요청 간격은 고정 sleep 대신 공용 적응형 속도 제한기(core.rate_limiter)가 조절 (워커 스레드가 세션 공유)
 """
 
 from bs4 import BeautifulSoup
 import requests
-import time
 import re
 from requests import get
 from urllib import request
-from PyPDF2 import PdfReader
 import os
+import sys
 import csv
 import shutil
 from datetime import datetime, timedelta
@@ -20,6 +21,13 @@ import json
 import logging
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.jsonl_sink import JsonlSink
+from common.pdf_store import PdfStore
+from common.pdf_text import extract_pdf
+from core.rate_limiter import mount_limited
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -28,18 +36,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class BondReportCrawler:
-    def __init__(self, start_date, end_date, output_dir="data/bond_reports", max_workers=5):
+    def __init__(self, start_date, end_date, output_dir="data/bond_reports", max_workers=5, rate_limiter=None):
         self.start_date = start_date
         self.end_date = end_date
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.max_workers = max_workers
         
+        # 원본 PDF 저장소 (sha256 이름, 오프라인 재추출용)
+        self.pdf_store = PdfStore()
+        
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36',
             'Referer': 'https://www.naver.com/'
         }
         
+        # 모든 요청은 도메인별 속도 제한기를 거침 (워커 수만큼 연결 풀 확보)
+        self.session = mount_limited(requests.Session(), rate_limiter, pool_maxsize=max_workers)
+        
         # 수집 통계
         self.stats = {
             'total_pages': 0,
@@ -54,7 +68,7 @@ class BondReportCrawler:
         url = f"https://finance.naver.com/research/debenture_list.naver?keyword=&brokerCode=&searchType=writeDate&writeFromDate={self.start_date}&writeToDate={self.end_date}&x=0&y=0&page=1"
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.session.get(url, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
             
             last_page_elem = soup.select_one('td.pgRR>a')
@@ -75,7 +89,7 @@ class BondReportCrawler:
         results = []
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.session.get(url, headers=self.headers, timeout=30)
             soup = BeautifulSoup(response.text, 'html.parser')
             
             # 리포트 목록 추출
@@ -90,9 +104,6 @@ class BondReportCrawler:
                 report_data = self.extract_report_info(row, title_elem)
                 if report_data:
                     results.append(report_data)
-                    
-                # 서버 부하 방지
-                time.sleep(0.5)
                 
         except Exception as e:
             logger.error(f"페이지 {page_num} 처리 실패: {e}")
@@ -126,7 +137,7 @@ class BondReportCrawler:
             if link:
                 detail_url = f"https://finance.naver.com/research/{link}"
                 try:
-                    detail_response = requests.get(detail_url, headers=self.headers, timeout=30)
+                    detail_response = self.session.get(detail_url, headers=self.headers, timeout=30)
                     detail_soup = BeautifulSoup(detail_response.text, 'html.parser')
                     
                     # PDF 링크 찾기
@@ -136,7 +147,8 @@ class BondReportCrawler:
                         
                         # PDF 다운로드 및 텍스트 추출
                         if pdf_url:
-                            pdf_content = self.extract_pdf_text(pdf_url, title)
+                            pdf_content = self.extract_pdf_text(pdf_url, title, company_name,
+                                                                report_date, detail_url)
                             
                 except Exception as e:
                     logger.warning(f"상세 페이지 처리 실패: {title} - {e}")
@@ -156,36 +168,22 @@ class BondReportCrawler:
             logger.error(f"리포트 정보 추출 실패: {e}")
             return None
     
-    def extract_pdf_text(self, pdf_url, title):
+    def extract_pdf_text(self, pdf_url, title, company='', date='', report_url=''):
         """PDF 텍스트 추출"""
         try:
-            # PDF 다운로드
-            pdf_response = requests.get(pdf_url, timeout=60)
-            
-            # 임시 파일로 저장
-            safe_title = re.sub(r'[^\w\s-]', '_', title)[:50]
-            pdf_path = self.output_dir / f"{safe_title}.pdf"
+            # PDF 다운로드 → 원본은 저장소에 보관
+            pdf_response = self.session.get(pdf_url, timeout=60)
+            self.pdf_store.add(pdf_url, pdf_response.content, 'bond', title=title,
+                               company=company, date=date, report_url=report_url)
             
-            with open(pdf_path, 'wb') as f:
-                f.write(pdf_response.content)
-            
-            # PDF 텍스트 추출
-            text = ""
-            with open(pdf_path, 'rb') as pdf_file:
-                pdf_reader = PdfReader(pdf_file)
-                for page in pdf_reader.pages:
-                    try:
-                        text += page.extract_text()
-                    except:
-                        continue
-            
-            # 텍스트 정제
-            text = re.sub(r'\s+', ' ', text)
-            text = text[:50000]  # 최대 50,000자로 제한
+            # 임시 파일 없이 메모리에서 텍스트 추출 (공백 정리, 최대 50,000자)
+            result = extract_pdf(pdf_response.content, max_chars=50000)
+            if result.stopped == 'error':
+                raise ValueError("PDF 파싱 불가")
             
             self.stats['pdf_success'] += 1
             
-            return text
+            return result.text
             
         except Exception as e:
             logger.warning(f"PDF 처리 실패: {title} - {e}")
@@ -193,7 +191,7 @@ class BondReportCrawler:
             return None
     
     def run_parallel_collection(self):
-        """병렬 수집 실행"""
+        """병렬 수집 실행 → 수집한 리포트 수"""
         logger.info(f"수집 시작: {self.start_date} ~ {self.end_date}")
         
         # 전체 페이지 수 확인
@@ -201,55 +199,64 @@ class BondReportCrawler:
         self.stats['total_pages'] = total_pages
         logger.info(f"전체 페이지 수: {total_pages}")
         
-        # 병렬 처리
-        all_reports = []
+        # 병렬 처리 - 완료된 페이지부터 바로 저장
+        self.open_results()
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 모든 페이지를 작업 큐에 추가
-            futures = {
-                executor.submit(self.process_page, page): page 
-                for page in range(1, total_pages + 1)
-            }
-            
-            # 완료된 작업 처리
-            for future in as_completed(futures):
-                page = futures[future]
-                try:
-                    results = future.result()
-                    all_reports.extend(results)
-                    logger.info(f"페이지 {page}/{total_pages} 완료 - {len(results)}개 리포트")
-                except Exception as e:
-                    logger.error(f"페이지 {page} 실패: {e}")
-        
-        self.stats['total_reports'] = len(all_reports)
-        
-        # 결과 저장
-        self.save_results(all_reports)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # 모든 페이지를 작업 큐에 추가
+                futures = {
+                    executor.submit(self.process_page, page): page 
+                    for page in range(1, total_pages + 1)
+                }
+                
+                # 완료된 작업 처리
+                for future in as_completed(futures):
+                    page = futures[future]
+                    try:
+                        results = future.result()
+                        self.save_results(results)
+                        self.stats['total_reports'] += len(results)
+                        logger.info(f"페이지 {page}/{total_pages} 완료 - {len(results)}개 리포트")
+                    except Exception as e:
+                        logger.error(f"페이지 {page} 실패: {e}")
+        finally:
+            self.close_results()
         
-        return all_reports
+        return self.stats['total_reports']
+    
+    def open_results(self):
+        """결과 파일 열기 (JSONL은 리포트 한 줄씩, CSV 헤더는 첫 리포트의 키로)"""
+        name = f"{self.start_date}_{self.end_date}"
+        self.json_path = self.output_dir / f"bond_reports_{name}.jsonl"
+        self.csv_path = self.output_dir / f"bond_reports_{name}.csv"
+        self.sink = JsonlSink(self.json_path, append=False)
+        self.csv_file = None
+        self.csv_writer = None
     
     def save_results(self, reports):
-        """결과 저장"""
-        # JSON 저장
-        json_path = self.output_dir / f"bond_reports_{self.start_date}_{self.end_date}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(reports, f, ensure_ascii=False, indent=2)
+        """페이지 하나의 리포트를 JSONL / CSV에 이어 쓰기"""
+        self.sink.write_many(reports)
         
-        # CSV 저장
-        csv_path = self.output_dir / f"bond_reports_{self.start_date}_{self.end_date}.csv"
-        if reports:
-            keys = reports[0].keys()
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=keys)
-                writer.writeheader()
-                writer.writerows(reports)
+        if reports and self.csv_writer is None:
+            self.csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8-sig')
+            self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=reports[0].keys())
+            self.csv_writer.writeheader()
+        if self.csv_writer is not None:
+            self.csv_writer.writerows(reports)
+    
+    def close_results(self):
+        """결과 파일 닫기 + 통계 저장"""
+        self.sink.close()
+        if self.csv_file is not None:
+            self.csv_file.close()
         
         # 통계 저장
         stats_path = self.output_dir / f"stats_{self.start_date}_{self.end_date}.json"
         with open(stats_path, 'w', encoding='utf-8') as f:
             json.dump(self.stats, f, ensure_ascii=False, indent=2)
         
-        logger.info(f"저장 완료: {json_path}")
+        logger.info(f"저장 완료: {self.json_path}")
         logger.info(f"통계: {self.stats}")
 
 
@@ -270,9 +277,7 @@ def collect_by_month(year, month):
     logger.info(f"{'='*50}")
     
     crawler = BondReportCrawler(start_date, end_date, max_workers=5)
-    reports = crawler.run_parallel_collection()
-    
-    return len(reports)
+    return crawler.run_parallel_collection()
 
 
 def main():
@@ -295,9 +300,9 @@ def main():
     logger.info(f"병렬 작업자: {max_workers}개")
     
     crawler = BondReportCrawler(start_date, end_date, max_workers=max_workers)
-    reports = crawler.run_parallel_collection()
+    total = crawler.run_parallel_collection()
     
-    logger.info(f"수집 완료: 총 {len(reports)}개 리포트")
+    logger.info(f"수집 완료: 총 {total}개 리포트")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+채권 리포트 크롤러용 로컬 대체 서버 (네이버 리서치 형식 fixture)
+- fixtures/naver_research/의 목록 / 상세 페이지 템플릿으로 리포트 N개를 가진 사이트를 흉내냄
+- PDF는 리포트마다 텍스트 한 페이지짜리 최소 PDF를 생성
+- --fail-rate로 503 응답을 섞어 재시도/백오프 확인, /stats로 호스트 동시 요청 최댓값 확인
+- check: 서버를 띄우고 AsyncBondCrawler를 실행해 수집 수와 동시 요청 상한을 검증 (종료 코드 0/1)
+
+사용법:
+    python stand_in_server.py serve --port 8080 --reports 40 --fail-rate 0.1
+    python bond_async_crawler.py 2024-01-01 2024-01-31 --base-url http://127.0.0.1:8080 --no-store
+    python stand_in_server.py check --reports 40 --fail-rate 0.1 --per-host 4
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+from string import Template
+
+from aiohttp import web
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from BOND.bond_async_crawler import AsyncBondCrawler
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures/naver_research"
+COMPANIES = ['한국투자증권', 'NH투자증권', '삼성증권', 'KB증권', '하나증권']
+
+
+def _template(name):
+    return Template((FIXTURE_DIR / name).read_text(encoding='utf-8'))
+
+
+def make_pdf(text):
+    """텍스트 한 페이지짜리 최소 PDF (Helvetica, ASCII 텍스트)"""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for i, obj in enumerate(objects):
+        offsets.append(len(out))
+        out += f"{i + 1} 0 obj\n{obj}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+
+class StandInSite:
+    """리포트 목록 / 상세 / PDF를 제공하는 aiohttp 앱"""
+
+    def __init__(self, reports=40, per_page=10, fail_rate=0.0, delay=0.01, seed=42):
+        self.reports = [
+            {'nid': 1000 + i, 'title': f'채권 전략 리포트 {i + 1}', 'company': COMPANIES[i % len(COMPANIES)],
+             'date': f'24.01.{i % 28 + 1:02d}', 'views': 100 + i}
+            for i in range(reports)
+        ]
+        self.per_page = per_page
+        self.fail_rate = fail_rate
+        self.delay = delay
+        self.random = random.Random(seed)
+        self.active = 0
+        self.max_active = 0
+        self.requests = 0
+        self.failures = 0
+
+        self.list_template = _template('debenture_list.html')
+        self.row_template = _template('debenture_list_row.html')
+        self.read_template = _template('debenture_read.html')
+
+    @property
+    def pages(self):
+        return max(1, -(-len(self.reports) // self.per_page))
+
+    @web.middleware
+    async def track(self, request, handler):
+        """동시 요청 수 기록 + 503 주입"""
+        self.requests += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if request.path != '/stats' and self.random.random() < self.fail_rate:
+                self.failures += 1
+                return web.Response(status=503, text='Service Unavailable')
+            return await handler(request)
+        finally:
+            self.active -= 1
+
+    async def list_page(self, request):
+        page = int(request.query.get('page', 1))
+        chunk = self.reports[(page - 1) * self.per_page:page * self.per_page]
+        rows = '\n'.join(self.row_template.substitute(report, page=page, short_date=report['date'])
+                         for report in chunk)
+        pages = '\n'.join(f'<td><a href="/research/debenture_list.naver?page={p}">{p}</a></td>'
+                          for p in range(1, self.pages + 1))
+        html = self.list_template.substitute(rows=rows, pages=pages, last_page=self.pages)
+        return web.Response(text=html, content_type='text/html')
+
+    async def read_page(self, request):
+        nid = int(request.query.get('nid', 0))
+        report = next((r for r in self.reports if r['nid'] == nid), None)
+        if report is None:
+            raise web.HTTPNotFound()
+        html = self.read_template.substitute(report, summary=f"{report['title']} 요약",
+                                             pdf_href=f"/pdf/{nid}.pdf")
+        return web.Response(text=html, content_type='text/html')
+
+    async def pdf(self, request):
+        nid = request.match_info['nid']
+        return web.Response(body=make_pdf(f"Bond report {nid} yield curve outlook"),
+                            content_type='application/pdf')
+
+    async def stats(self, request):
+        return web.json_response({'requests': self.requests, 'failures': self.failures,
+                                  'max_active': self.max_active})
+
+    def app(self):
+        app = web.Application(middlewares=[self.track])
+        app.router.add_get('/research/debenture_list.naver', self.list_page)
+        app.router.add_get('/research/debenture_read.naver', self.read_page)
+        app.router.add_get('/pdf/{nid}.pdf', self.pdf)
+        app.router.add_get('/stats', self.stats)
+        return app
+
+
+async def check(reports=40, fail_rate=0.1, per_host=4, port=0):
+    """대체 서버 대상으로 AsyncBondCrawler 실행 → 검증 통과 여부"""
+    site = StandInSite(reports=reports, fail_rate=fail_rate)
+    runner = web.AppRunner(site.app())
+    await runner.setup()
+    server = web.TCPSite(runner, '127.0.0.1', port)
+    await server.start()
+    port = runner.addresses[0][1]
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / 'reports.jsonl'
+            crawler = AsyncBondCrawler('2024-01-01', '2024-01-31', base_url=f'http://127.0.0.1:{port}',
+                                       per_host=per_host, extract_workers=2, max_retries=5)
+            stats = await crawler.run(output)
+            items = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+    finally:
+        await runner.cleanup()
+
+    checks = {
+        'all reports collected': len(items) == reports,
+        'report text extracted': all('Bond report' in item['content'] for item in items),
+        f'concurrency <= {per_host}': site.max_active <= per_host,
+    }
+    print(f"Stand-in server: {site.requests} requests, {site.failures} injected 503s, "
+          f"max concurrency {site.max_active}")
+    print(f"Crawler: {len(items)}/{reports} reports, {stats['retry_count']} retries")
+    for name, ok in checks.items():
+        print(f"  {'✓' if ok else '✗'} {name}")
+    return all(checks.values())
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='채권 리포트 크롤러용 로컬 대체 서버')
+    parser.add_argument('command', choices=['serve', 'check'])
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--reports', type=int, default=40, help='리포트 수')
+    parser.add_argument('--fail-rate', type=float, default=0.1, help='503 응답 비율')
+    parser.add_argument('--per-host', type=int, default=4, help='check: 크롤러 호스트별 동시 요청 수')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        site = StandInSite(reports=args.reports, fail_rate=args.fail_rate)
+        web.run_app(site.app(), host='127.0.0.1', port=args.port)
+        return 0
+    return 0 if asyncio.run(check(args.reports, args.fail_rate, args.per_host)) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,15 @@
 import scrapy
-import PyPDF2
-from io import BytesIO
+import sys
+from pathlib import Path
 import os
 import time
 import re
 import requests
 
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from common.pdf_text import extract_pdf
+
 
 class MpbCrawlerSpider(scrapy.Spider):
     name = "mpb_crawler"
@@ -59,13 +63,11 @@ class MpbCrawlerSpider(scrapy.Spider):
 
     def parse_pdf(self, response):
         try:
-            # PyPDF2로 PDF 텍스트 추출
-            pdf_file = BytesIO(response.body)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
+            # PDF 텍스트 추출
+            pdf = extract_pdf(response.body, max_chars=None, normalize=False)
+            if pdf.stopped == 'error':
+                raise ValueError("PDF 파싱 불가")
+            text = pdf.text
             
             # 제목에서 날짜 추출
             date_matches = re.findall(r'(\d{4}\.\d{1,2}\.\d{1,2})', response.meta['title'])
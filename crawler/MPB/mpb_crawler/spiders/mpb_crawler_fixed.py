@@ -1,9 +1,13 @@
 import scrapy
-import PyPDF2
-from io import BytesIO
+import sys
+from pathlib import Path
 import re
 from datetime import datetime
 
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from common.pdf_text import extract_pdf
+
 
 class MpbCrawlerFixedSpider(scrapy.Spider):
     """개선된 MPB 의사록 크롤러 - 동적 페이지네이션 및 기간 설정"""
@@ -123,18 +127,11 @@ class MpbCrawlerFixedSpider(scrapy.Spider):
     def parse_pdf(self, response):
         """PDF 파싱 및 데이터 추출"""
         try:
-            # PyPDF2로 PDF 텍스트 추출
-            pdf_file = BytesIO(response.body)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text
-                except Exception as e:
-                    self.logger.warning(f"페이지 {page_num+1} 추출 실패: {e}")
+            # PDF 텍스트 추출 (섹션 추출을 위해 글자 수 제한 없이 읽음)
+            pdf = extract_pdf(response.body, max_chars=None, normalize=False)
+            if pdf.stopped == 'error':
+                raise ValueError("PDF 파싱 불가")
+            text = pdf.text
             
             # 메타데이터 추출
             title = response.meta['title']
@@ -183,11 +180,11 @@ class MpbCrawlerFixedSpider(scrapy.Spider):
                 'discussion': discussion_text,
                 'decision': decision_text,
                 'link': response.url,
-                'pdf_pages': len(pdf_reader.pages),
+                'pdf_pages': pdf.total_pages,
                 'extraction_success': bool(text)
             }
             
-            self.logger.info(f"✅ 성공적으로 처리: {title} (페이지: {len(pdf_reader.pages)})")
+            self.logger.info(f"✅ 성공적으로 처리: {title} (페이지: {pdf.total_pages})")
             
         except Exception as e:
             self.logger.error(f"PDF 파싱 오류 {response.url}: {e}")
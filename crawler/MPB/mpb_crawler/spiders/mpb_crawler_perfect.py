@@ -1,10 +1,16 @@
 import scrapy
-import PyPDF2
-from io import BytesIO
+import sys
+from pathlib import Path
 import re
 from datetime import datetime
 import time
 
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from common.mpb_sections import build_minutes_item, extract_date
+from common.pdf_store import PdfStore
+from common.pdf_text import extract_pdf
+
 
 class MpbCrawlerPerfectSpider(scrapy.Spider):
     """
@@ -26,6 +32,9 @@ class MpbCrawlerPerfectSpider(scrapy.Spider):
         self.collected_items = []
         self.empty_page_count = 0
         
+        # 원본 PDF 저장소 (sha256 이름, 오프라인 재추출용)
+        self.pdf_store = PdfStore()
+        
     def start_requests(self):
         """첫 페이지 요청 - 마지막 페이지 번호 정확히 파악"""
         base_url = 'https://www.bok.or.kr/portal/singl/newsData/listCont.do'
@@ -271,58 +280,16 @@ class MpbCrawlerPerfectSpider(scrapy.Spider):
         date = self.extract_date(title)
         
         try:
-            pdf_file = BytesIO(response.body)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    text += page.extract_text()
-                except:
-                    self.logger.warning(f"페이지 {page_num+1} 추출 실패")
-            
-            # 섹션 추출
-            discussion = None
-            decision = None
-            
-            if text:
-                # 토의내용 추출
-                disc_patterns = [
-                    r"위원\s*토의\s*내용(.*?)심의\s*결과",
-                    r"토의\s*내용(.*?)결정\s*사항",
-                    r"위원\s*토의(.*?)의결\s*사항"
-                ]
-                
-                for pattern in disc_patterns:
-                    match = re.search(pattern, text, re.DOTALL)
-                    if match:
-                        discussion = match.group(1).strip()[:5000]
-                        break
-                
-                # 결정사항 추출
-                dec_patterns = [
-                    r"심의\s*결과(.*?)$",
-                    r"결정\s*사항(.*?)$",
-                    r"의결\s*사항(.*?)$"
-                ]
-                
-                for pattern in dec_patterns:
-                    match = re.search(pattern, text, re.DOTALL)
-                    if match:
-                        decision = match.group(1).strip()[:2000]
-                        break
-            
-            yield {
-                'title': title,
-                'date': date,
-                'year': date[:4] if date else None,
-                'content': text[:10000] if text else None,
-                'discussion': discussion,
-                'decision': decision,
-                'pdf_url': response.url,
-                'pdf_pages': len(pdf_reader.pages),
-                'status': 'success'
-            }
+            # 원본 PDF는 저장소에 보관 (섹션 규칙이 바뀌면 common/reextract.py로 재생성)
+            self.pdf_store.add(response.url, response.body, 'mpb', title=title, date=date)
+
+            # 결정사항은 문서 끝부분에 있으므로 글자 수 제한 없이 읽음 (시간 예산만 적용)
+            pdf = extract_pdf(response.body, max_chars=None, normalize=False)
+            if pdf.stopped == 'error':
+                raise ValueError("PDF 파싱 불가")
+
+            # 섹션 추출 (토의내용 / 결정사항)
+            yield build_minutes_item(title, pdf.text, response.url, pdf.total_pages)
             
             self.logger.info(f"✅ 수집 완료: {title}")
             
@@ -338,13 +305,7 @@ class MpbCrawlerPerfectSpider(scrapy.Spider):
     
     def extract_date(self, title):
         """제목에서 날짜 추출"""
-        date_match = re.search(r'(\d{4})[\.\s년](\d{1,2})[\.\s월](\d{1,2})', title)
-        if date_match:
-            year = date_match.group(1)
-            month = date_match.group(2).zfill(2)
-            day = date_match.group(3).zfill(2)
-            return f"{year}-{month}-{day}"
-        return None
+        return extract_date(title)
     
     def closed(self, reason):
         """크롤링 종료 통계"""
@@ -0,0 +1,11 @@
+"""
+Crawler Common Modules (뉴스/채권/MPB 크롤러 공용)
+"""
+
+from .jsonl_sink import JsonlSink, is_jsonl, iter_jsonl, read_grouped, read_records, write_grouped
+from .pdf_store import PdfStore
+from .pdf_text import PdfText, extract_pdf, extract_pdf_text
+from .response_archive import ResponseArchive
+
+__all__ = ['JsonlSink', 'PdfStore', 'PdfText', 'ResponseArchive', 'extract_pdf', 'extract_pdf_text',
+           'is_jsonl', 'iter_jsonl', 'read_grouped', 'read_records', 'write_grouped']
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+스트리밍 JSON Lines 저장/읽기
+- JsonlSink: 한 줄에 레코드 하나씩 추가 쓰기, batch_size개마다 flush / fsync_every개마다 fsync
+- 압축은 확장자로 선택: .jsonl(무압축) / .jsonl.gz(gzip) / .jsonl.zst(zstd, zstandard 패키지 필요)
+- 이어 쓰기(append)는 압축 파일도 가능 (gzip 멤버 / zstd 프레임이 이어 붙음)
+- 읽기: iter_jsonl(스트리밍), read_records(JSONL 또는 기존 JSON 배열),
+  read_grouped(월별 뉴스처럼 {소스: [기사]} 구조 - JSONL은 기사별 source 필드로 복원)
+"""
+
+import gzip
+import io
+import json
+import os
+import threading
+from pathlib import Path
+
+JSONL_SUFFIXES = ('.jsonl', '.jsonl.gz', '.jsonl.zst')
+
+
+def is_jsonl(path):
+    return str(path).endswith(JSONL_SUFFIXES)
+
+
+def strip_suffix(path):
+    """파일명에서 .json / .jsonl(.gz/.zst) 확장자 제거"""
+    name = Path(path).name
+    for suffix in JSONL_SUFFIXES + ('.json',):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd 압축(.jsonl.zst)에는 zstandard 패키지가 필요합니다: pip install zstandard") from e
+    return zstandard
+
+
+class JsonlSink:
+    """추가 쓰기 전용 JSON Lines 파일 (여러 스레드에서 write 가능)"""
+
+    def __init__(self, path, append=True, batch_size=100, fsync_every=1000):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.fsync_every = fsync_every
+        self.count = 0
+        self.lock = threading.Lock()
+
+        self.raw = open(self.path, 'ab' if append else 'wb')
+        name = self.path.name
+        if name.endswith('.gz'):
+            self.stream = gzip.GzipFile(fileobj=self.raw, mode='ab')
+        elif name.endswith('.zst'):
+            self.stream = _zstandard().ZstdCompressor().stream_writer(self.raw, closefd=False)
+        else:
+            self.stream = self.raw
+
+    def write(self, record):
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        with self.lock:
+            self.stream.write(line)
+            self.count += 1
+            if self.fsync_every and self.count % self.fsync_every == 0:
+                self._flush(fsync=True)
+            elif self.batch_size and self.count % self.batch_size == 0:
+                self._flush(fsync=False)
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+        return self.count
+
+    def _flush(self, fsync):
+        if self.stream is not self.raw:
+            self.stream.flush()
+        self.raw.flush()
+        if fsync:
+            os.fsync(self.raw.fileno())
+
+    def flush(self, fsync=False):
+        with self.lock:
+            self._flush(fsync)
+
+    def close(self):
+        with self.lock:
+            if self.raw.closed:
+                return
+            if self.stream is not self.raw:
+                self.stream.close()  # 압축 스트림 종료 (gzip 트레일러 / zstd 프레임 끝)
+            self.raw.flush()
+            os.fsync(self.raw.fileno())
+            self.raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _open_text(path):
+    name = str(path)
+    if name.endswith('.gz'):
+        return gzip.open(name, 'rt', encoding='utf-8')
+    if name.endswith('.zst'):
+        # 이어 쓰기로 생긴 여러 프레임을 모두 읽음
+        reader = _zstandard().ZstdDecompressor().stream_reader(open(name, 'rb'), read_across_frames=True)
+        return io.TextIOWrapper(reader, encoding='utf-8')
+    return open(name, 'r', encoding='utf-8')
+
+
+def iter_jsonl(path):
+    """JSON Lines 레코드를 한 줄씩 (빈 줄 무시)"""
+    with _open_text(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_records(path):
+    """JSONL이면 레코드 리스트, 아니면 json.load 결과 그대로"""
+    if is_jsonl(path):
+        return list(iter_jsonl(path))
+    with _open_text(path) as f:
+        return json.load(f)
+
+
+def read_grouped(path, key='source'):
+    """{그룹: [레코드]} 구조로 읽기 (JSONL은 레코드의 key 필드로 묶음, 그룹 순서는 처음 나온 순)"""
+    if not is_jsonl(path):
+        with _open_text(path) as f:
+            return json.load(f)
+    grouped = {}
+    for record in iter_jsonl(path):
+        grouped.setdefault(record.get(key), []).append(record)
+    return grouped
+
+
+def write_grouped(path, data, key='source'):
+    """{그룹: [레코드]}를 JSONL로 (레코드마다 key 필드에 그룹 이름 기록) → 레코드 수"""
+    with JsonlSink(path, append=False) as sink:
+        for group, records in data.items():
+            for record in records:
+                if record.get(key) != group:
+                    record = dict(record, **{key: group})
+                sink.write(record)
+        return sink.count
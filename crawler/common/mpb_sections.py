@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+MPB 의사록 본문에서 위원 토의내용 / 심의결과 섹션 추출
+- mpb_crawler_perfect 스파이더와 오프라인 재추출(reextract)이 같은 규칙을 사용
+"""
+
+import re
+
+DISCUSSION_PATTERNS = [
+    re.compile(r"위원\s*토의\s*내용(.*?)심의\s*결과", re.DOTALL),
+    re.compile(r"토의\s*내용(.*?)결정\s*사항", re.DOTALL),
+    re.compile(r"위원\s*토의(.*?)의결\s*사항", re.DOTALL),
+]
+
+DECISION_PATTERNS = [
+    re.compile(r"심의\s*결과(.*?)$", re.DOTALL),
+    re.compile(r"결정\s*사항(.*?)$", re.DOTALL),
+    re.compile(r"의결\s*사항(.*?)$", re.DOTALL),
+]
+
+DATE_PATTERN = re.compile(r'(\d{4})[\.\s년](\d{1,2})[\.\s월](\d{1,2})')
+
+
+def _first_match(patterns, text, limit):
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1).strip()[:limit]
+    return None
+
+
+def extract_sections(text):
+    """의사록 전체 텍스트 → (토의내용 최대 5000자, 결정사항 최대 2000자)"""
+    if not text:
+        return None, None
+    return _first_match(DISCUSSION_PATTERNS, text, 5000), _first_match(DECISION_PATTERNS, text, 2000)
+
+
+def extract_date(title):
+    """제목에서 날짜 추출 (YYYY-MM-DD)"""
+    date_match = DATE_PATTERN.search(title or '')
+    if date_match:
+        year = date_match.group(1)
+        month = date_match.group(2).zfill(2)
+        day = date_match.group(3).zfill(2)
+        return f"{year}-{month}-{day}"
+    return None
+
+
+def build_minutes_item(title, text, pdf_url, total_pages):
+    """스파이더 출력과 같은 형식의 의사록 item"""
+    date = extract_date(title)
+    discussion, decision = extract_sections(text)
+    return {
+        'title': title,
+        'date': date,
+        'year': date[:4] if date else None,
+        'content': text[:10000] if text else None,
+        'discussion': discussion,
+        'decision': decision,
+        'pdf_url': pdf_url,
+        'pdf_pages': total_pages,
+        'status': 'success'
+    }
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+내용 주소 기반(content-addressed) 원본 PDF 저장소
+- 파일명 = PDF 바이트의 sha256 (objects/ab/abcdef....pdf[.gz]) → 같은 PDF는 한 번만 저장
+- 선택적 gzip 압축, 임시 파일 + os.replace로 원자적 저장
+- SQLite 인덱스: URL → sha256 + 종류(bond/mpb) + 재추출에 필요한 메타데이터(JSON)
+- 추출기나 섹션 규칙이 바뀌면 네트워크 없이 reextract.py로 데이터셋을 다시 생성
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+STORE_DIR = Path(__file__).parent.parent / "data/raw/pdf_store"
+
+
+def object_path(root, digest, compressed):
+    """sha256 → 저장 경로 (앞 2자리로 디렉토리 분산)"""
+    suffix = '.pdf.gz' if compressed else '.pdf'
+    return Path(root) / "objects" / digest[:2] / f"{digest}{suffix}"
+
+
+def read_object(root, digest):
+    """저장된 PDF 바이트 (압축 여부 자동 판별, 없으면 None)"""
+    for compressed in (True, False):
+        path = object_path(root, digest, compressed)
+        if path.exists():
+            data = path.read_bytes()
+            return gzip.decompress(data) if compressed else data
+    return None
+
+
+class PdfStore:
+    """sha256 이름의 PDF 객체 + URL 인덱스 (여러 다운로드 스레드에서 공유 가능)"""
+
+    def __init__(self, root=STORE_DIR, compress=True):
+        self.root = Path(root)
+        self.compress = compress
+        (self.root / "objects").mkdir(parents=True, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.root / "index.sqlite", check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY, sha256 TEXT NOT NULL, kind TEXT NOT NULL,
+                size INTEGER, fetched_at TEXT, meta TEXT);
+            CREATE INDEX IF NOT EXISTS idx_urls_kind ON urls (kind);
+        """)
+
+    def has(self, digest):
+        return any(object_path(self.root, digest, c).exists() for c in (True, False))
+
+    def put(self, data):
+        """PDF 바이트 저장 → sha256 (이미 있으면 다시 쓰지 않음)"""
+        digest = hashlib.sha256(data).hexdigest()
+        if self.has(digest):
+            return digest
+
+        path = object_path(self.root, digest, self.compress)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(gzip.compress(data, compresslevel=6) if self.compress else data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return digest
+
+    def get(self, digest):
+        return read_object(self.root, digest)
+
+    def add(self, url, data, kind, **meta):
+        """PDF 저장 + URL 인덱스 기록 → sha256"""
+        digest = self.put(data)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO urls VALUES (?, ?, ?, ?, ?, ?)",
+                (url, digest, kind, len(data), datetime.now().isoformat(),
+                 json.dumps(meta, ensure_ascii=False))
+            )
+            self.conn.commit()
+        return digest
+
+    def lookup(self, url):
+        """URL → sha256 (없으면 None)"""
+        with self.lock:
+            row = self.conn.execute("SELECT sha256 FROM urls WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def entries(self, kind=None):
+        """인덱스 항목 [{'url', 'sha256', 'kind', 'meta'}] (URL 순)"""
+        query = "SELECT url, sha256, kind, meta FROM urls"
+        params = ()
+        if kind:
+            query += " WHERE kind = ?"
+            params = (kind,)
+        with self.lock:
+            rows = self.conn.execute(query + " ORDER BY url", params).fetchall()
+        return [{'url': url, 'sha256': digest, 'kind': k, 'meta': json.loads(meta or '{}')}
+                for url, digest, k, meta in rows]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
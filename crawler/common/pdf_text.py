@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+공용 PDF 텍스트 추출 (채권 리포트 / MPB 의사록)
+- 디스크에 저장했다 다시 읽지 않고 메모리(BytesIO)에서 바로 파싱
+- 문자 예산(max_chars)에 도달하면 나머지 페이지는 읽지 않음
+- 페이지 텍스트는 리스트에 모아 한 번에 join (문자열 += 반복 없음)
+- 문서당 시간 예산(time_budget): 페이지 사이에서 확인, 초과하면 그때까지 읽은 페이지만 사용
+"""
+
+import logging
+import time
+from io import BytesIO
+from typing import NamedTuple
+
+from PyPDF2 import PdfReader
+
+logger = logging.getLogger(__name__)
+
+
+class PdfText(NamedTuple):
+    """추출 결과"""
+    text: str
+    pages_read: int
+    total_pages: int
+    stopped: str  # '' (끝까지 읽음) | 'chars' | 'time' | 'error'
+
+
+def extract_pdf(data, max_chars=50000, time_budget=30.0, normalize=True):
+    """PDF 바이트 → PdfText
+
+    Args:
+        data: PDF 바이트 (bytes / bytearray / memoryview)
+        max_chars: 최대 문자 수 (None이면 제한 없음)
+        time_budget: 문서당 최대 추출 시간(초, None이면 제한 없음)
+        normalize: 연속 공백을 공백 하나로 정리 (False면 PyPDF2 원문 유지)
+    """
+    start = time.perf_counter()
+    pages = []
+    collected = 0
+    pages_read = total_pages = 0
+    stopped = ''
+
+    try:
+        reader = PdfReader(BytesIO(data))
+        total_pages = len(reader.pages)
+
+        for page in reader.pages:
+            if max_chars is not None and collected >= max_chars:
+                stopped = 'chars'
+                break
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                stopped = 'time'
+                break
+
+            pages_read += 1
+            try:
+                page_text = page.extract_text() or ''
+            except Exception as e:
+                logger.warning(f"페이지 {pages_read} 추출 실패: {e}")
+                continue
+
+            pages.append(page_text)
+            # 페이지별 정리 길이의 합은 전체를 이어 붙여 정리한 길이보다 길지 않으므로
+            # 예산 도달 후 잘라낸 결과는 전체 페이지를 읽고 자른 결과와 같다
+            collected += len(' '.join(page_text.split())) if normalize else len(page_text)
+
+    except Exception as e:
+        logger.error(f"PDF 텍스트 추출 실패: {e}")
+        stopped = 'error'
+
+    text = ''.join(pages)
+    if normalize:
+        text = ' '.join(text.split())
+    if max_chars is not None:
+        text = text[:max_chars]
+
+    if stopped == 'time':
+        logger.warning(f"PDF 시간 예산 초과 ({time_budget}s): {pages_read}/{total_pages} 페이지만 추출")
+    return PdfText(text, pages_read, total_pages, stopped)
+
+
+def extract_pdf_text(data, max_chars=50000, time_budget=30.0, normalize=True):
+    """PDF 바이트 → 텍스트 (실패 시 빈 문자열)"""
+    return extract_pdf(data, max_chars, time_budget, normalize).text
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+PDF 저장소(pdf_store)에서 채권 / MPB 텍스트 데이터셋 오프라인 재생성
+- 네트워크 접근 없이 저장된 원본 PDF만 사용
+- PDF 파싱은 ProcessPool로 병렬 처리
+- 채권: 리포트별 CSV (Date, Title, Content, Link) → bond_consolidator.py 입력 형식
+- MPB: 스파이더 출력과 같은 형식의 JSON 목록 (날짜순)
+
+사용법:
+    python crawler/common/reextract.py all --workers 8
+    python crawler/common/reextract.py bond --bond-output crawler/BOND/dataset_reextracted
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+CRAWLER_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = CRAWLER_ROOT.parent
+sys.path.append(str(CRAWLER_ROOT))
+
+from common.mpb_sections import build_minutes_item
+from common.pdf_store import STORE_DIR, PdfStore, read_object
+from common.pdf_text import extract_pdf
+
+BOND_OUTPUT_DIR = CRAWLER_ROOT / "BOND/dataset_reextracted"
+MPB_OUTPUT_FILE = PROJECT_ROOT / "data/auxiliary/mpb_minutes_reextracted.json"
+
+
+def bond_csv_name(date, title, company):
+    """BondCrawler와 같은 CSV 파일명"""
+    safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
+    return f"{date}_{safe_title}_{company}.csv"
+
+
+def _reextract_task(args):
+    """저장소 항목 하나 → (항목, 결과) (워커 프로세스)"""
+    root, entry, max_chars = args
+    data = read_object(root, entry['sha256'])
+    if data is None:
+        return entry, None
+
+    meta = entry['meta']
+    if entry['kind'] == 'mpb':
+        # 결정사항 섹션 때문에 전체 텍스트 필요
+        pdf = extract_pdf(data, max_chars=None, normalize=False)
+        if pdf.stopped == 'error':
+            return entry, None
+        return entry, build_minutes_item(meta.get('title', ''), pdf.text, entry['url'], pdf.total_pages)
+
+    pdf = extract_pdf(data, max_chars=max_chars)
+    return entry, pdf.text if pdf.text else None
+
+
+def reextract(kinds, store_dir=STORE_DIR, bond_output=BOND_OUTPUT_DIR, mpb_output=MPB_OUTPUT_FILE,
+              workers=None, max_chars=50000):
+    """저장소 전체 재추출 → 종류별 통계 dict"""
+    start = time.perf_counter()
+    store = PdfStore(store_dir)
+    entries = [entry for kind in kinds for entry in store.entries(kind)]
+    store.close()
+
+    workers = workers or os.cpu_count() or 1
+    print(f"Re-extracting {len(entries):,} PDFs with {workers} workers (offline)")
+
+    stats = {kind: {'entries': 0, 'extracted': 0, 'missing': 0} for kind in kinds}
+    minutes = []
+    bond_output = Path(bond_output)
+    if 'bond' in kinds:
+        bond_output.mkdir(parents=True, exist_ok=True)
+
+    tasks = [(str(store_dir), entry, max_chars) for entry in entries]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for entry, result in executor.map(_reextract_task, tasks, chunksize=8):
+            kind_stats = stats[entry['kind']]
+            kind_stats['entries'] += 1
+            if result is None:
+                kind_stats['missing'] += 1
+                continue
+            kind_stats['extracted'] += 1
+
+            if entry['kind'] == 'mpb':
+                minutes.append(result)
+                continue
+
+            meta = entry['meta']
+            csv_path = bond_output / bond_csv_name(meta.get('date', ''), meta.get('title', ''),
+                                                   meta.get('company', ''))
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['Date', 'Title', 'Content', 'Link'])
+                writer.writerow([meta.get('date', ''), meta.get('title', ''), result, entry['url']])
+
+    if 'mpb' in kinds:
+        minutes.sort(key=lambda item: item['date'] or '')
+        Path(mpb_output).parent.mkdir(parents=True, exist_ok=True)
+        with open(mpb_output, 'w', encoding='utf-8') as f:
+            json.dump(minutes, f, ensure_ascii=False, indent=2)
+
+    for kind, kind_stats in stats.items():
+        print(f"  {kind}: {kind_stats['extracted']:,}/{kind_stats['entries']:,} extracted, "
+              f"{kind_stats['missing']:,} missing or unreadable")
+    print(f"✓ Done in {time.perf_counter() - start:.1f}s")
+    return stats
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='PDF 저장소에서 채권/MPB 텍스트 오프라인 재추출')
+    parser.add_argument('kind', choices=['all', 'bond', 'mpb'])
+    parser.add_argument('--store', type=str, default=str(STORE_DIR))
+    parser.add_argument('--bond-output', type=str, default=str(BOND_OUTPUT_DIR))
+    parser.add_argument('--mpb-output', type=str, default=str(MPB_OUTPUT_FILE))
+    parser.add_argument('--workers', type=int, default=None, help='PDF 파싱 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--max-chars', type=int, default=50000, help='채권 리포트 최대 글자 수')
+    args = parser.parse_args()
+
+    kinds = ['bond', 'mpb'] if args.kind == 'all' else [args.kind]
+    return reextract(kinds, Path(args.store), args.bond_output, args.mpb_output,
+                     workers=args.workers, max_chars=args.max_chars)
+
+
+if __name__ == "__main__":
+    main()
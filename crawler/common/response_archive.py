@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+원본 HTTP 응답 보관소 (목록 페이지 / 기사 페이지 / 연합뉴스 API JSONP)
+- 키 = 요청 지문: sha256(메서드 + 정규화 URL(쿼리 파라미터 정렬) + 요청 본문)
+- 응답 본문은 gzip 압축 BLOB으로 SQLite 한 파일에 보관 (작은 HTML이 많아 객체 파일 대신 테이블)
+- 기록: attach(session)이 세션 응답 훅을 등록 → 성공/리다이렉트(< 400) 응답만 저장
+- 재생: replay=True면 attach(session)이 ReplayAdapter를 마운트 → 네트워크 없이 보관된 응답 반환
+  (보관소에 없는 요청은 ArchiveMiss 예외 = ConnectionError 취급)
+- 파서 버그를 고친 뒤 scripts/reparse.py로 재수집 없이 기사를 다시 파싱 / 오프라인 벤치마크
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+ARCHIVE_FILE = Path(__file__).parent.parent / "data/raw/http_archive.sqlite"
+
+# 재생 시 본문이 이미 풀린 상태이므로 버리는 헤더
+_DROP_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+class ArchiveMiss(requests.exceptions.ConnectionError):
+    """재생 모드에서 보관소에 없는 요청"""
+
+
+def request_fingerprint(method, url, body=None):
+    """요청 지문 (hex) - 쿼리 파라미터 순서와 #fragment는 무시"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    canonical = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+    digest = hashlib.sha256(f"{method.upper()} {canonical}\n".encode('utf-8'))
+    if body:
+        digest.update(body if isinstance(body, bytes) else str(body).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ResponseArchive:
+    """요청 지문 → 응답(상태/헤더/압축 본문) (여러 수집 스레드에서 공유 가능)"""
+
+    def __init__(self, path=ARCHIVE_FILE, replay=False, compresslevel=6):
+        self.path = Path(path)
+        self.replay = replay
+        self.compresslevel = compresslevel
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS responses (
+                fp TEXT PRIMARY KEY, method TEXT NOT NULL, url TEXT NOT NULL,
+                status INTEGER NOT NULL, headers TEXT, body BLOB NOT NULL,
+                size INTEGER, fetched_at TEXT);
+            CREATE INDEX IF NOT EXISTS idx_responses_url ON responses (url);
+        """)
+
+        self.recorded = 0
+        self.served = 0
+        self.missed = 0
+
+    def attach(self, session):
+        """기록 모드: 응답 훅 등록 / 재생 모드: 네트워크 대신 ReplayAdapter 마운트"""
+        if self.replay:
+            adapter = ReplayAdapter(self)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        elif self._record_hook not in session.hooks['response']:
+            session.hooks['response'].append(self._record_hook)
+        return session
+
+    def _record_hook(self, response, *args, **kwargs):
+        if response.status_code < 400:
+            self.record(response)
+        return response
+
+    def record(self, response):
+        """응답 하나 저장 (같은 요청이면 최신 응답으로 덮어씀)"""
+        request = response.request
+        fp = request_fingerprint(request.method, request.url, request.body)
+        content = response.content
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS}
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (fp, request.method, request.url, response.status_code,
+                 json.dumps(headers, ensure_ascii=False),
+                 gzip.compress(content, compresslevel=self.compresslevel), len(content),
+                 datetime.now().isoformat(timespec='seconds'))
+            )
+            self.conn.commit()
+            self.recorded += 1
+
+    def lookup(self, method, url, body=None):
+        """보관된 응답 → (상태, 헤더 dict, 본문 바이트) (없으면 None)"""
+        fp = request_fingerprint(method, url, body)
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT status, headers, body FROM responses WHERE fp = ?", (fp,)).fetchone()
+            if row is None:
+                self.missed += 1
+                return None
+            self.served += 1
+        status, headers, body = row
+        return status, json.loads(headers or '{}'), gzip.decompress(body)
+
+    def urls(self, pattern=None):
+        """보관된 GET 요청 URL 목록 (pattern은 SQL LIKE, URL 순)"""
+        query = "SELECT url FROM responses WHERE method = 'GET'"
+        params = ()
+        if pattern:
+            query += " AND url LIKE ?"
+            params = (pattern,)
+        with self.lock:
+            rows = self.conn.execute(query + " ORDER BY url", params).fetchall()
+        return [url for (url,) in rows]
+
+    def stats(self):
+        """보관 응답 수 / 원본 크기 / 압축 크기 / 이번 실행 기록·재생·미적중 수"""
+        with self.lock:
+            count, size, stored = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(body)), 0) FROM responses"
+            ).fetchone()
+        return {'responses': count, 'bytes': size, 'stored_bytes': stored,
+                'recorded': self.recorded, 'served': self.served, 'missed': self.missed}
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """보관소에서 응답을 만들어 돌려주는 어댑터 (네트워크 접근 없음)"""
+
+    def __init__(self, archive):
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        found = self.archive.lookup(request.method, request.url, request.body)
+        if found is None:
+            raise ArchiveMiss(f"보관소에 없는 요청: {request.method} {request.url}", request=request)
+        status, headers, body = found
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response._content = body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.reason = 'Archived'
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
@@ -3,6 +3,13 @@
 통합 뉴스 크롤러 - Scrapy 없이 작동
 연합뉴스, 이데일리, 인포맥스 모두 지원
 requests + BeautifulSoup 사용
+기사 본문(상세 페이지)은 DetailFetcher로 동시 수집 (목록 순회와 겹쳐서 진행)
+연합뉴스 API는 날짜 단위로 나눠 동시 수집 가능 (yonhap_workers > 1, 전체 요청 속도 제한)
+요청 간격은 고정 sleep 대신 도메인별 적응형 속도 제한기(core.rate_limiter)가 조절
+frontier(core.frontier)를 주면 목록 페이지/본문 URL 단위로 저널에 기록하고 재시작 시 이어서 수집
+crawl_all은 소스별 워커(core.scheduler)로 세 사이트를 동시에 수집 (parallel_sources=False면 순차)
+url_index(core.url_index)를 주면 이전 실행에서 받은 본문은 요청 없이 재사용 (재실행 시 목록 페이지만 요청)
+archive(common.response_archive)를 주면 모든 원본 응답을 보관, replay 모드면 네트워크 없이 보관소로 수집
 """
 import requests
 from bs4 import BeautifulSoup
@@ -14,6 +21,19 @@ import os
 import logging
 from typing import List, Dict, Optional
 import hashlib
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.detail_fetcher import DetailFetcher, fill_content
+from core.rate_limiter import RateLimiter, mount_limited, shared_limiter
+from core.scheduler import SourceScheduler
+from common.jsonl_sink import is_jsonl, write_grouped
+
+YONHAP_API_URL = 'http://ars.yna.co.kr/api/v2/search.asis'
 
 # 로깅 설정
 logging.basicConfig(
@@ -26,7 +46,8 @@ logger = logging.getLogger(__name__)
 class UnifiedNewsCrawler:
     """통합 뉴스 크롤러"""
     
-    def __init__(self, keyword="금리"):
+    def __init__(self, keyword="금리", detail_workers=8, per_domain=4, yonhap_workers=1, yonhap_rate=10.0,
+                 rate_limiter=None, frontier=None, parallel_sources=True, url_index=None, archive=None):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -41,12 +62,106 @@ class UnifiedNewsCrawler:
         self.keyword = keyword
         self.collected_urls = set()
         
-        # 네이버 메인에서 쿠키 획득
-        self.session.get('https://www.naver.com')
+        # 모든 세션 요청은 도메인별 AIMD 속도 제한기를 거침 (요청 간격은 제한기가 담당)
+        self.rate_limiter = rate_limiter or shared_limiter
+        
+        # 재개용 작업 저널 (None이면 기록 없이 매번 전체 수집)
+        self.frontier = frontier
+        
+        # 실행 간 공유되는 URL 지문 색인 (None이면 매 실행마다 본문을 새로 받음)
+        self.url_index = url_index
+        
+        # 원본 응답 보관소 (세션마다 연결, None이면 보관하지 않음)
+        self.archive = archive
+        
+        # 소스별 동시 수집 여부 (호스트가 달라 서로의 속도 제한과 무관)
+        self.parallel_sources = parallel_sources
+        
+        # 상세 페이지 동시 수집 (도메인별 동시 요청 제한), 스레드 수만큼 연결 풀 확보
+        self.detail_fetcher = DetailFetcher(max_workers=detail_workers, per_domain=per_domain,
+                                            min_interval=0)
+        self._mount_pool(self.session)
+        
+        # 연합뉴스 API 날짜 샤딩 (keep-alive 세션 공유 + 전체 초당 요청 수 제한)
+        self.yonhap_workers = yonhap_workers
+        self.yonhap_limiter = RateLimiter(yonhap_rate)
+        self.yonhap_session = requests.Session()
+        self.yonhap_session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Referer': 'https://www.yna.co.kr/'
+        })
+        mount_limited(self.yonhap_session, self.rate_limiter, pool_maxsize=yonhap_workers)
+        if self.archive is not None:
+            self.archive.attach(self.yonhap_session)
+        
+        # 네이버 메인에서 쿠키 획득 (보관소 재생 모드에서는 생략)
+        if self.archive is None or not self.archive.replay:
+            self.session.get('https://www.naver.com')
+    
+    def _mount_pool(self, session):
+        """상세 수집 스레드가 연결을 재사용할 수 있도록 세션 연결 풀 확장 (+ 속도 제한기 / 응답 보관소 연결)"""
+        mount_limited(session, self.rate_limiter, pool_maxsize=self.detail_fetcher.max_workers)
+        if self.archive is not None:
+            self.archive.attach(session)
+    
+    def _fill_pending(self, pending):
+        """본문 보강 대기 중인 기사들을 제출 순서대로 채움 (실패 건수 로그)"""
+        fill_content(pending)
+        failed = [article['url'] for article, future in pending if not (future.result() or {}).get('content')]
+        for url in failed:
+            logger.warning(f"    콘텐츠 수집 실패: {url}")
+    
+    def _checkpoint(self, source, key, page, fetch):
+        """(소스, 범위, 페이지) 작업 단위 - 저널에 완료 기록이 있으면 그대로, 없으면 fetch() 결과를 기록
+        
+        범위 키 앞에 검색어를 붙여 기록하므로 다른 검색어의 크롤러가 같은 저널을 써도 섞이지 않는다.
+        fetch()가 None을 돌려주면(응답 이상 등) 기록하지 않으므로 재시작 시 다시 요청한다.
+        """
+        key = f'{self.keyword}:{key}'
+        if self.frontier is not None:
+            done = self.frontier.get_unit(source, key, page)
+            if done is not None:
+                return done
+        result = fetch()
+        if self.frontier is not None and result is not None:
+            self.frontier.complete_unit(source, key, page, result)
+        return result
+    
+    def _submit_detail(self, fn, url, **kwargs):
+        """본문 수집 예약 - URL 색인/저널에 있는 URL은 요청 없이 완료된 Future 반환
+
+        본문(content)이 비어 있는 추출 결과는 저장하지 않는다 (다음 실행에서 다시 요청).
+        """
+        cached = None
+        if self.url_index is not None:
+            cached = self.url_index.get(url)
+        if cached is None and self.frontier is not None:
+            cached = self.frontier.get_fetched(url)
+        # 본문 없이 기록된 이전 결과(추출 실패)는 다시 요청
+        if cached is not None and not cached.get('content'):
+            cached = None
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+        future = self.detail_fetcher.submit(fn, url, **kwargs)
+        if self.frontier is not None or self.url_index is not None:
+            def record(done):
+                result = done.result()
+                # 본문을 얻지 못한 결과(미리보기만 남음)는 기록하지 않아 재실행 시 다시 요청
+                if not result or not result.get('content'):
+                    return
+                if self.frontier is not None:
+                    self.frontier.record_fetched(url, result)
+                if self.url_index is not None:
+                    self.url_index.add(url, result, source=result.get('source'))
+            future.add_done_callback(record)
+        return future
     
     def crawl_yonhap(self, start_date: str, end_date: str) -> List[Dict]:
         """연합뉴스 크롤링 - 일별 API 직접 요청 (2016년부터 가능)"""
         articles = []
+        pending = []  # (기사, 본문 Future) - API 순회가 끝난 뒤 순서대로 채움
         
         start_dt = datetime.strptime(start_date, '%Y-%m-%d')
         end_dt = datetime.strptime(end_date, '%Y-%m-%d')
@@ -56,108 +171,20 @@ class UnifiedNewsCrawler:
             logger.info(f"연합뉴스 {start_dt.year}년 데이터 - 네이버 뉴스 검색 사용")
             return self.crawl_yonhap_direct(start_date, end_date)
         
+        if self.yonhap_workers > 1:
+            return self.crawl_yonhap_sharded(start_date, end_date)
+        
         logger.info(f"연합뉴스 API 크롤링: {start_date} ~ {end_date}")
         
         # 날짜별로 API 요청 (작년 로직)
         current_date = start_dt
         total_articles = 0
         
+        def get(url, params):
+            return self.yonhap_session.get(url, params=params, timeout=20)
+        
         while current_date <= end_dt:
-            date_str = current_date.strftime('%Y%m%d')
-            daily_articles = []
-            
-            # 페이지네이션 처리 (각 날짜별로 모든 페이지 순회)
-            page_no = 1
-            
-            while True:  # 페이지 제한 없음
-                # 연합뉴스 API URL
-                url = 'http://ars.yna.co.kr/api/v2/search.asis'
-                
-                params = {
-                    'callback': 'Search.SearchPreCallback',
-                    'query': self.keyword,
-                    'page_no': str(page_no),
-                    'period': 'diy',
-                    'from': date_str,
-                    'to': date_str,
-                    'ctype': 'A',
-                    'page_size': '50',
-                    'channel': 'basic_kr'
-                }
-                
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Referer': 'https://www.yna.co.kr/'
-                }
-                
-                try:
-                    response = requests.get(url, params=params, headers=headers, timeout=20)
-                    
-                    if 'Search.SearchPreCallback' in response.text:
-                        # JSONP 콜백 제거 및 JSON 파싱
-                        import re
-                        json_str = re.search(r'Search\.SearchPreCallback\((.*)\)', response.text)
-                        if json_str:
-                            data = json.loads(json_str.group(1))
-                            results = data.get('KR_ARTICLE', {}).get('result', [])
-                            
-                            # 결과가 없으면 다음 날짜로
-                            if not results:
-                                break
-                            
-                            page_articles = []
-                            for item in results:
-                                # 날짜 확인 (API가 정확한 날짜를 반환하는지 체크)
-                                article_date = item.get('DIST_DATE', '')
-                                if article_date.startswith(date_str[:8]):
-                                    # URL 생성 (CONTENTS_ID 사용)
-                                    article_id = item.get('CONTENTS_ID', '')
-                                    article_url = f"https://www.yna.co.kr/view/{article_id}" if article_id else ''
-                                    
-                                    # 본문은 TEXT_BODY 사용
-                                    content = item.get('TEXT_BODY', item.get('CONTENTS', ''))
-                                    
-                                    article = {
-                                        'title': item.get('TITLE', ''),
-                                        'content': content,
-                                        'date': f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}",
-                                        'url': article_url,
-                                        'source': 'yonhap',
-                                        'keyword': self.keyword,
-                                        'content_length': len(content)
-                                    }
-                                    
-                                    # API가 본문을 제공하지 않거나 너무 짧은 경우 기사 페이지 직접 방문
-                                    if (not article['content'] or article['content_length'] < 200) and article['url']:
-                                        logger.debug(f"    콘텐츠 부족, URL 방문: {article['url']}")
-                                        full_article = self.extract_yonhap_article(article['url'])
-                                        if full_article and full_article.get('content'):
-                                            article['content'] = full_article['content']
-                                            article['content_length'] = len(full_article['content'])
-                                            logger.debug(f"    콘텐츠 수집 성공: {len(full_article['content'])}자")
-                                        else:
-                                            logger.warning(f"    콘텐츠 수집 실패: {article['url']}")
-                                    
-                                    page_articles.append(article)
-                            
-                            # 이 페이지에서 수집한 기사를 전체 목록에 추가
-                            daily_articles.extend(page_articles)
-                            
-                            # 이 페이지에서 날짜가 맞는 기사가 하나도 없으면 종료
-                            # (API가 날짜순으로 정렬되어 있다고 가정)
-                            if len(page_articles) == 0 and page_no > 1:
-                                break
-                            
-                            # 결과가 없으면 마지막 페이지로 간주
-                            if len(results) == 0:
-                                break
-                            
-                            page_no += 1
-                            time.sleep(0.3)  # 페이지 간 짧은 대기
-                    
-                except Exception as e:
-                    logger.error(f"연합뉴스 API 오류 ({date_str}, 페이지 {page_no}): {e}")
-                    break
+            daily_articles = self._crawl_yonhap_day(current_date, get, pending)
             
             # 하루 수집 결과 정리
             if daily_articles:
@@ -165,12 +192,151 @@ class UnifiedNewsCrawler:
                 logger.info(f"  {current_date.strftime('%Y-%m-%d')}: {len(daily_articles)}개 수집")
                 total_articles += len(daily_articles)
             
-            time.sleep(0.5)  # 날짜 간 대기
             current_date += timedelta(days=1)
         
+        self._fill_pending(pending)
         logger.info(f"연합뉴스 총 {total_articles}개 기사 수집 완료")
         return articles
     
+    def crawl_yonhap_sharded(self, start_date: str, end_date: str) -> List[Dict]:
+        """연합뉴스 API 날짜 샤딩 크롤링
+        
+        날짜(하루) 단위 버킷을 yonhap_workers개 스레드가 동시에 순회한다. 요청은 keep-alive
+        세션 하나를 공유하고 yonhap_limiter로 전체 초당 요청 수 상한을 둔다 (도메인 AIMD 제한기와 별도).
+        결과는 날짜 순서로 이어 붙이므로 순차 크롤링과 같은 목록이 된다.
+        """
+        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        days = [start_dt + timedelta(days=i) for i in range((end_dt - start_dt).days + 1)]
+        
+        logger.info(f"연합뉴스 API 샤딩 크롤링: {start_date} ~ {end_date} "
+                    f"({len(days)}일, {self.yonhap_workers} 워커, 초당 {self.yonhap_limiter.rate:g}회)")
+        
+        def get(url, params):
+            self.yonhap_limiter.acquire()
+            return self.yonhap_session.get(url, params=params, timeout=20)
+        
+        def crawl_day(day):
+            day_pending = []
+            return self._crawl_yonhap_day(day, get, day_pending), day_pending
+        
+        articles = []
+        pending = []
+        with ThreadPoolExecutor(max_workers=self.yonhap_workers) as executor:
+            # map은 입력(날짜) 순서대로 결과를 돌려줌
+            for day, (daily_articles, day_pending) in zip(days, executor.map(crawl_day, days)):
+                pending.extend(day_pending)
+                if daily_articles:
+                    articles.extend(daily_articles)
+                    logger.info(f"  {day.strftime('%Y-%m-%d')}: {len(daily_articles)}개 수집")
+        
+        self._fill_pending(pending)
+        logger.info(f"연합뉴스 총 {len(articles)}개 기사 수집 완료")
+        return articles
+    
+    def _crawl_yonhap_day(self, current_date, get, pending) -> List[Dict]:
+        """하루치 연합뉴스 API 페이지 순회 (본문이 짧은 기사는 pending에 본문 수집 예약)"""
+        date_str = current_date.strftime('%Y%m%d')
+        daily_articles = []
+        
+        # 페이지네이션 처리 (각 날짜별로 모든 페이지 순회)
+        page_no = 1
+        failed_pages = 0  # 같은 페이지 연속 응답 이상 횟수
+        
+        while True:  # 페이지 제한 없음
+            try:
+                page = self._checkpoint('yonhap', date_str, page_no,
+                                        lambda: self._fetch_yonhap_page(get, date_str, page_no))
+            except Exception as e:
+                logger.error(f"연합뉴스 API 오류 ({date_str}, 페이지 {page_no}): {e}")
+                break
+            
+            # JSONP 응답이 아니면 같은 페이지 재요청 (3회 연속이면 이 날짜 중단)
+            if page is None:
+                failed_pages += 1
+                if failed_pages >= 3:
+                    logger.error(f"연합뉴스 API 응답 이상 3회 연속 ({date_str}, 페이지 {page_no}), 다음 날짜로")
+                    break
+                continue
+            failed_pages = 0
+            
+            # 결과가 없으면 다음 날짜로
+            if not page['results']:
+                break
+            
+            page_articles = page['articles']
+            self._schedule_yonhap_content(page_articles, pending)
+            
+            # 이 페이지에서 수집한 기사를 전체 목록에 추가
+            daily_articles.extend(page_articles)
+            
+            # 이 페이지에서 날짜가 맞는 기사가 하나도 없으면 종료
+            # (API가 날짜순으로 정렬되어 있다고 가정)
+            if len(page_articles) == 0 and page_no > 1:
+                break
+            
+            page_no += 1
+        
+        return daily_articles
+    
+    def _fetch_yonhap_page(self, get, date_str, page_no) -> Optional[Dict]:
+        """연합뉴스 API 한 페이지 → {'results': API 결과 수, 'articles': 날짜가 맞는 기사} (JSONP가 아니면 None)"""
+        params = {
+            'callback': 'Search.SearchPreCallback',
+            'query': self.keyword,
+            'page_no': str(page_no),
+            'period': 'diy',
+            'from': date_str,
+            'to': date_str,
+            'ctype': 'A',
+            'page_size': '50',
+            'channel': 'basic_kr'
+        }
+        
+        response = get(YONHAP_API_URL, params)
+        if 'Search.SearchPreCallback' not in response.text:
+            return None
+        
+        # JSONP 콜백 제거 및 JSON 파싱
+        import re
+        json_str = re.search(r'Search\.SearchPreCallback\((.*)\)', response.text)
+        if not json_str:
+            return None
+        
+        data = json.loads(json_str.group(1))
+        results = data.get('KR_ARTICLE', {}).get('result', [])
+        
+        page_articles = []
+        for item in results:
+            # 날짜 확인 (API가 정확한 날짜를 반환하는지 체크)
+            article_date = item.get('DIST_DATE', '')
+            if article_date.startswith(date_str[:8]):
+                # URL 생성 (CONTENTS_ID 사용)
+                article_id = item.get('CONTENTS_ID', '')
+                article_url = f"https://www.yna.co.kr/view/{article_id}" if article_id else ''
+                
+                # 본문은 TEXT_BODY 사용
+                content = item.get('TEXT_BODY', item.get('CONTENTS', ''))
+                
+                page_articles.append({
+                    'title': item.get('TITLE', ''),
+                    'content': content,
+                    'date': f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}",
+                    'url': article_url,
+                    'source': 'yonhap',
+                    'keyword': self.keyword,
+                    'content_length': len(content)
+                })
+        
+        return {'results': len(results), 'articles': page_articles}
+    
+    def _schedule_yonhap_content(self, page_articles, pending):
+        """API가 본문을 제공하지 않거나 너무 짧은 경우 기사 페이지 직접 방문 (비동기)"""
+        for article in page_articles:
+            if (not article['content'] or article['content_length'] < 200) and article['url']:
+                logger.debug(f"    콘텐츠 부족, URL 방문 예약: {article['url']}")
+                pending.append((article, self._submit_detail(self.extract_yonhap_article, article['url'])))
+    
     def parse_date_from_text(self, date_text: str) -> Optional[str]:
         """날짜 텍스트를 파싱하여 YYYY-MM-DD 형식으로 변환"""
         import re
@@ -209,8 +375,7 @@ class UnifiedNewsCrawler:
                 except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
                     if attempt == 2:
                         raise e
-                    logger.warning(f"연합뉴스 재시도 {attempt+1}/3: {url}")
-                    time.sleep(3 * (attempt + 1))  # 3초, 6초 대기
+                    logger.warning(f"연합뉴스 재시도 {attempt+1}/3: {url}")  # 대기는 제한기 백오프가 담당
             
             if response.status_code != 200:
                 return None
@@ -341,11 +506,15 @@ class UnifiedNewsCrawler:
         end_dt = datetime.strptime(end_date, '%Y-%m-%d')
         
         logger.info(f"연합뉴스 직접 검색: {start_date} ~ {end_date}")
+        pending = []
         
         # 2014년도 API 시도 (실패할 가능성 높지만 시도)
         current_date = start_dt
         total_articles = 0
         
+        def get(url, params):
+            return self.yonhap_session.get(url, params=params, timeout=20)
+        
         while current_date <= end_dt:
             date_str = current_date.strftime('%Y%m%d')
             daily_articles = []
@@ -354,92 +523,27 @@ class UnifiedNewsCrawler:
             page_no = 1
             
             while True:  # 페이지 제한 없음
-                # 연합뉴스 API URL (2014년도 시도)
-                url = 'http://ars.yna.co.kr/api/v2/search.asis'
-                
-                params = {
-                    'callback': 'Search.SearchPreCallback',
-                    'query': self.keyword,
-                    'page_no': str(page_no),
-                    'period': 'diy',
-                    'from': date_str,
-                    'to': date_str,
-                    'ctype': 'A',
-                    'page_size': '50',
-                    'channel': 'basic_kr'
-                }
-                
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Referer': 'https://www.yna.co.kr/'
-                }
-                
+                # 연합뉴스 API (2014년도 시도)
                 try:
-                    response = requests.get(url, params=params, headers=headers, timeout=20)
-                    
-                    if 'Search.SearchPreCallback' in response.text:
-                        # JSONP 콜백 제거 및 JSON 파싱
-                        import re
-                        json_str = re.search(r'Search\.SearchPreCallback\((.*)\)', response.text)
-                        if json_str:
-                            data = json.loads(json_str.group(1))
-                            results = data.get('KR_ARTICLE', {}).get('result', [])
-                            
-                            # 결과가 없으면 다음 날짜로
-                            if not results:
-                                break
-                            
-                            page_articles = []
-                            for item in results:
-                                # 날짜 확인
-                                article_date = item.get('DIST_DATE', '')
-                                if article_date.startswith(date_str[:8]):
-                                    # URL 생성
-                                    article_id = item.get('CONTENTS_ID', '')
-                                    article_url = f"https://www.yna.co.kr/view/{article_id}" if article_id else ''
-                                    
-                                    # 본문
-                                    content = item.get('TEXT_BODY', item.get('CONTENTS', ''))
-                                    
-                                    article = {
-                                        'title': item.get('TITLE', ''),
-                                        'content': content,
-                                        'date': f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}",
-                                        'url': article_url,
-                                        'source': 'yonhap',
-                                        'keyword': self.keyword,
-                                        'content_length': len(content)
-                                    }
-                                    
-                                    # API가 본문을 제공하지 않거나 너무 짧은 경우
-                                    if (not article['content'] or article['content_length'] < 200) and article['url']:
-                                        logger.debug(f"    콘텐츠 부족, URL 방문: {article['url']}")
-                                        full_article = self.extract_yonhap_article(article['url'])
-                                        if full_article and full_article.get('content'):
-                                            article['content'] = full_article['content']
-                                            article['content_length'] = len(full_article['content'])
-                                    
-                                    page_articles.append(article)
-                            
-                            daily_articles.extend(page_articles)
-                            
-                            # 이 페이지에서 날짜가 맞는 기사가 하나도 없으면 종료
-                            if len(page_articles) == 0 and page_no > 1:
-                                break
-                            
-                            # 결과가 없으면 마지막 페이지로 간주
-                            if len(results) == 0:
-                                break
-                            
-                            page_no += 1
-                            time.sleep(0.3)
-                    else:
-                        # API 응답이 없으면 다음 날짜로
-                        break
-                    
+                    page = self._checkpoint('yonhap', date_str, page_no,
+                                            lambda: self._fetch_yonhap_page(get, date_str, page_no))
                 except Exception as e:
                     logger.debug(f"연합뉴스 API 오류 ({date_str}, 페이지 {page_no}): {e}")
                     break
+                
+                # API 응답이 없거나 결과가 없으면 다음 날짜로
+                if page is None or not page['results']:
+                    break
+                
+                page_articles = page['articles']
+                self._schedule_yonhap_content(page_articles, pending)
+                daily_articles.extend(page_articles)
+                
+                # 이 페이지에서 날짜가 맞는 기사가 하나도 없으면 종료
+                if len(page_articles) == 0 and page_no > 1:
+                    break
+                
+                page_no += 1
             
             # 하루 수집 결과 정리
             if daily_articles:
@@ -447,9 +551,10 @@ class UnifiedNewsCrawler:
                 logger.info(f"  {current_date.strftime('%Y-%m-%d')}: {len(daily_articles)}개 수집")
                 total_articles += len(daily_articles)
             
-            time.sleep(0.5)
             current_date += timedelta(days=1)
         
+        fill_content(pending)
+        
         # API 결과가 없으면 경고
         if total_articles == 0:
             logger.warning(f"연합뉴스 2014년 데이터 수집 실패 - 빅카인즈(www.bigkinds.or.kr) 사용 권장")
@@ -469,129 +574,144 @@ class UnifiedNewsCrawler:
         end = end_dt.strftime('%Y%m%d')
         
         logger.info(f"이데일리 직접 크롤링 시작: {start_date} ~ {end_date}")
+        pending = []  # (기사, 본문 Future)
         
         # URL 템플릿 (작년 코드와 동일)
         base_url = f'https://www.edaily.co.kr/search/news/?source=total&keyword={self.keyword}&include=&exclude=&jname=&start={start}&end={end}&sort=latest&date=pick&exact=false&page='
         
         page_number = 1
         empty_page_count = 0
+        failed_pages = 0  # 연속 요청 실패 페이지 수
         
         while True:
             # 페이지 제한 없음 - 빈 페이지가 연속으로 나올 때까지 계속
-                
             current_url = base_url + str(page_number)
             
             try:
-                # 재시도 로직 추가
-                max_retries = 3
-                for retry in range(max_retries):
-                    try:
-                        response = self.session.get(current_url, timeout=20)  # timeout 증가
-                        break
-                    except requests.exceptions.Timeout:
-                        if retry < max_retries - 1:
-                            logger.warning(f"  페이지 {page_number} Timeout, 재시도 {retry + 1}/{max_retries - 1}")
-                            time.sleep(2)  # 재시도 전 대기
-                        else:
-                            raise
-                
-                if response.status_code != 200:
-                    logger.error(f"HTTP {response.status_code}")
-                    break
-                    
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 뉴스 기사 추출
-                news_items = soup.select('.newsbox_04')
-                
-                if not news_items:
-                    empty_page_count += 1
-                    logger.info(f"  페이지 {page_number}: 결과 없음")
-                    if empty_page_count >= 3:
-                        logger.info("  3페이지 연속 결과 없음, 종료")
-                        last_page = page_number - 3
-                        last_url = base_url + str(last_page)
-                        logger.info(f"  수집 종료 - 마지막 페이지: {last_page}")
-                        logger.info(f"  마지막 페이지 링크: {last_url}")
-                        break
-                else:
-                    empty_page_count = 0
-                    logger.info(f"  페이지 {page_number}: {len(news_items)}개 기사 발견")
-                
-                for item in news_items:
-                    # 제목과 내용 추출
-                    text_elem = item.select_one('.newsbox_texts')
-                    if text_elem:
-                        content_text = text_elem.text.strip()
-                        lines = content_text.split('\n')
-                        title = lines[0] if lines else ""
-                        content = '\n'.join(lines[1:]) if len(lines) > 1 else ""
-                        
-                        # URL 추출
-                        link_tag = item.find('a', href=True)
-                        if link_tag:
-                            url = 'https://www.edaily.co.kr' + link_tag['href']
-                        else:
-                            url = None
-                        
-                        # 날짜 추출
-                        date_elem = item.select_one('.author_category')
-                        if date_elem:
-                            date_text = date_elem.text.split()[0]
-                            # 날짜 형식 변환 (YYYY.MM.DD -> YYYY-MM-DD)
-                            try:
-                                date_obj = datetime.strptime(date_text, '%Y.%m.%d')
-                                date_str = date_obj.strftime('%Y-%m-%d')
-                                
-                                # 날짜 범위 확인
-                                if start_dt.date() <= date_obj.date() <= end_dt.date():
-                                    # URL에서 전체 기사 내용 가져오기
-                                    full_content = content  # 기본값은 미리보기
-                                    if url:
-                                        full_article = self.extract_edaily_article(url)
-                                        if full_article and full_article.get('content'):
-                                            full_content = full_article['content']
-                                            logger.debug(f"    본문 수집: {len(full_content)}자")
-                                    
-                                    article = {
-                                        'date': date_str,
-                                        'title': title,
-                                        'content': full_content,  # 전체 본문
-                                        'url': url,
-                                        'source': 'edaily',
-                                        'content_length': len(full_content)
-                                    }
-                                    articles.append(article)
-                                    logger.info(f"    ✓ {title[:50]}...")
-                            except:
-                                pass
-                
-                page_number += 1
-                time.sleep(0.5)  # 서버 부하 방지
-                
+                page = self._checkpoint('edaily', f'{start}-{end}', page_number,
+                                        lambda: self._fetch_edaily_page(current_url, start_dt, end_dt))
             except requests.exceptions.Timeout as e:
                 logger.error(f"페이지 {page_number} Timeout 오류 (모든 재시도 실패): {e}")
-                # Timeout 시 잠시 대기 후 다음 페이지 시도
-                time.sleep(5)
+                # Timeout 시 다음 페이지 시도 (대기는 제한기 백오프가 담당)
+                failed_pages += 1
+                if failed_pages >= 3:
+                    logger.error("  3페이지 연속 요청 실패, 종료")
+                    break
                 page_number += 1
                 continue
                 
             except requests.exceptions.ConnectionError as e:
+                # 보관소 재생 모드의 미적중(ArchiveMiss)도 여기로 옴
                 logger.error(f"페이지 {page_number} 연결 오류: {e}")
-                time.sleep(5)
+                failed_pages += 1
+                if failed_pages >= 3:
+                    logger.error("  3페이지 연속 요청 실패, 종료")
+                    break
                 page_number += 1
                 continue
                 
             except Exception as e:
                 logger.error(f"페이지 {page_number} 기타 오류: {e}")
                 break
+            
+            if page is None:
+                break
+            
+            failed_pages = 0
+            if not page['items']:
+                empty_page_count += 1
+                logger.info(f"  페이지 {page_number}: 결과 없음")
+                if empty_page_count >= 3:
+                    logger.info("  3페이지 연속 결과 없음, 종료")
+                    last_page = page_number - 3
+                    last_url = base_url + str(last_page)
+                    logger.info(f"  수집 종료 - 마지막 페이지: {last_page}")
+                    logger.info(f"  마지막 페이지 링크: {last_url}")
+                    break
+            else:
+                empty_page_count = 0
+                logger.info(f"  페이지 {page_number}: {page['items']}개 기사 발견")
+            
+            for article in page['articles']:
+                # 기본값은 미리보기, 전체 본문은 상세 수집기가 채움
+                if article['url']:
+                    pending.append((article, self._submit_detail(self.extract_edaily_article, article['url'])))
+                articles.append(article)
+                logger.info(f"    ✓ {article['title'][:50]}...")
+            
+            page_number += 1
         
+        fill_content(pending)
         logger.info(f"이데일리 크롤링 완료: 총 {len(articles)}개 기사 수집")
         if page_number > 1:
             logger.info(f"  검증용 링크 - 1페이지: {base_url}1")
             logger.info(f"  검증용 링크 - 마지막 확인 페이지: {base_url}{page_number}")
         return articles
     
+    def _fetch_edaily_page(self, current_url, start_dt, end_dt) -> Optional[Dict]:
+        """이데일리 검색 결과 한 페이지 → {'items': 검색 결과 수, 'articles': 기간 내 기사} (HTTP 오류면 None)"""
+        # 재시도 로직 추가
+        max_retries = 3
+        for retry in range(max_retries):
+            try:
+                response = self.session.get(current_url, timeout=20)  # timeout 증가
+                break
+            except requests.exceptions.Timeout:
+                if retry < max_retries - 1:
+                    logger.warning(f"  {current_url} Timeout, 재시도 {retry + 1}/{max_retries - 1}")
+                else:
+                    raise
+        
+        if response.status_code != 200:
+            logger.error(f"HTTP {response.status_code}")
+            return None
+            
+        soup = BeautifulSoup(response.text, 'html.parser')
+        
+        # 뉴스 기사 추출
+        news_items = soup.select('.newsbox_04')
+        page_articles = []
+        
+        for item in news_items:
+            # 제목과 내용 추출
+            text_elem = item.select_one('.newsbox_texts')
+            if text_elem:
+                content_text = text_elem.text.strip()
+                lines = content_text.split('\n')
+                title = lines[0] if lines else ""
+                content = '\n'.join(lines[1:]) if len(lines) > 1 else ""
+                
+                # URL 추출
+                link_tag = item.find('a', href=True)
+                if link_tag:
+                    url = 'https://www.edaily.co.kr' + link_tag['href']
+                else:
+                    url = None
+                
+                # 날짜 추출
+                date_elem = item.select_one('.author_category')
+                if date_elem:
+                    date_text = date_elem.text.split()[0]
+                    # 날짜 형식 변환 (YYYY.MM.DD -> YYYY-MM-DD)
+                    try:
+                        date_obj = datetime.strptime(date_text, '%Y.%m.%d')
+                        date_str = date_obj.strftime('%Y-%m-%d')
+                        
+                        # 날짜 범위 확인
+                        if start_dt.date() <= date_obj.date() <= end_dt.date():
+                            page_articles.append({
+                                'date': date_str,
+                                'title': title,
+                                'content': content,  # 전체 본문으로 교체됨
+                                'url': url,
+                                'source': 'edaily',
+                                'content_length': len(content)
+                            })
+                    except:
+                        pass
+        
+        return {'items': len(news_items), 'articles': page_articles}
+    
     def extract_edaily_article(self, url: str) -> Optional[Dict]:
         """이데일리 기사 전체 본문 추출 - 작년 검증된 코드 기반"""
         try:
@@ -649,10 +769,13 @@ class UnifiedNewsCrawler:
             'Cache-Control': 'no-cache',
             'Pragma': 'no-cache'
         })
+        self._mount_pool(session)
         
-        # 인포맥스 메인 페이지 방문 (세션 초기화)
-        session.get('https://news.einfomax.co.kr')
-        time.sleep(0.5)
+        # 인포맥스 메인 페이지 방문 (세션 초기화, 실패/보관소 미적중이어도 목록 수집은 계속)
+        try:
+            session.get('https://news.einfomax.co.kr', timeout=10)
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"인포맥스 메인 페이지 접근 실패 (계속 진행): {e}")
         
         # 날짜별이 아닌 전체 기간 검색으로 변경
         start_str = start_dt.strftime('%Y%m%d')
@@ -660,121 +783,115 @@ class UnifiedNewsCrawler:
         
         page = 1
         consecutive_empty = 0  # 연속 빈 페이지 카운터
+        failed_pages = 0  # 같은 페이지 연속 요청 실패 횟수
         
-        while True:  # 페이지 제한 없음
-            url = "https://news.einfomax.co.kr/news/articleList.html"
-            params = {
-                'sc_word': self.keyword,
-                'sc_sdate': start_str,
-                'sc_edate': end_str,
-                'page': str(page)
-                # sc_section_code 제거 - 전체 섹션 검색
-            }
+        # 본문 수집 중인 페이지들 (페이지 순서대로 결과 처리 → 중복 제거 결과는 순차 수집과 동일)
+        pending_pages = deque()
+        max_pending_pages = 4
+        
+        def process_page_results(page_no, futures):
+            nonlocal total_duplicates
+            page_articles_count = 0
+            duplicate_count = 0
+            date_filtered_count = 0
             
-            try:
-                # 각 페이지마다 Referer 헤더 추가
-                headers = {
-                    'Referer': f'https://news.einfomax.co.kr/news/articleList.html?page={page-1}' if page > 1 else 'https://news.einfomax.co.kr'
-                }
-                response = session.get(url, params=params, headers=headers, timeout=10)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # 기사 링크 찾기 - 개선된 방식
-                    article_links = []
-                    seen_ids = set()  # 이 페이지에서 본 기사 ID
-                    
-                    for a in soup.find_all('a', href=True):
-                        href = a.get('href', '')
-                        # 더 정확한 패턴 매칭
-                        if '/articleView.html?idxno=' in href:
-                            # 기사 ID 추출
+            for future in futures:
+                article = future.result()
+                if article:
+                    # 제목 기반 중복 체크 추가
+                    title_hash = hashlib.md5(article['title'].encode()).hexdigest()
+                    if title_hash not in collected_titles:
+                        collected_titles.add(title_hash)
+                        
+                        # 날짜 확인
+                        article_date = None
+                        if article.get('date'):
                             try:
-                                article_id = href.split('idxno=')[1].split('&')[0]
-                                
-                                # 이 페이지에서 중복 제거
-                                if article_id not in seen_ids:
-                                    seen_ids.add(article_id)
-                                    
-                                    if not href.startswith('http'):
-                                        href = urljoin('https://news.einfomax.co.kr', href)
-                                    
-                                    url_hash = hashlib.md5(href.encode()).hexdigest()
-                                    if url_hash not in collected_urls:
-                                        collected_urls.add(url_hash)
-                                        article_links.append(href)
+                                article_date = datetime.strptime(article['date'], '%Y-%m-%d')
+                                # 날짜가 범위 내인지 확인
+                                if start_dt.date() <= article_date.date() <= end_dt.date():
+                                    articles.append(article)
+                                    logger.info(f"    ✓ {article['title'][:50]}...")
+                                    page_articles_count += 1
+                                else:
+                                    date_filtered_count += 1
+                                    logger.debug(f"    ⚠️ 날짜 범위 제외: {article['title'][:30]}... [{article_date.strftime('%Y-%m-%d')}]")
                             except:
-                                pass
-                    
-                    if not article_links:
-                        consecutive_empty += 1
-                        logger.info(f"  페이지 {page}: 결과 없음")
-                        if consecutive_empty >= 5:  # 연속 5페이지 빈 경우 종료 (더 관대하게)
-                            logger.info("  연속 5페이지 빈 결과, 크롤링 종료")
-                            last_page = page - 5
-                            base_search_url = f'https://news.einfomax.co.kr/news/articleList.html?page={last_page}&sc_section_code=&sc_sub_section_code=&sc_serial_code=&sc_area=&sc_level=&sc_article_type=&sc_view_level=&sc_sdate={start_str}&sc_edate={end_str}&sc_serial_number=&sc_word={quote(self.keyword)}'
-                            logger.info(f"  수집 종료 - 마지막 페이지: {last_page}")
-                            logger.info(f"  마지막 페이지 링크: {base_search_url}")
-                            break
+                                # 날짜 파싱 실패 시 포함
+                                articles.append(article)
+                                logger.info(f"    ✓ {article['title'][:50]}...")
+                                page_articles_count += 1
                     else:
-                        consecutive_empty = 0  # 리셋
-                        logger.info(f"  페이지 {page}: {len(article_links)}개 발견")
-                    
-                    # 각 링크에서 기사 추출 (page 증가 전에 처리)
-                    page_articles_count = 0
-                    duplicate_count = 0
-                    date_filtered_count = 0
-                    
-                    for link in article_links:
-                        article = self.extract_infomax_article(link, session=session)
-                        if article:
-                            # 제목 기반 중복 체크 추가
-                            title_hash = hashlib.md5(article['title'].encode()).hexdigest()
-                            if title_hash not in collected_titles:
-                                collected_titles.add(title_hash)
-                                
-                                # 날짜 확인
-                                article_date = None
-                                if article.get('date'):
-                                    try:
-                                        article_date = datetime.strptime(article['date'], '%Y-%m-%d')
-                                        # 날짜가 범위 내인지 확인
-                                        if start_dt.date() <= article_date.date() <= end_dt.date():
-                                            articles.append(article)
-                                            logger.info(f"    ✓ {article['title'][:50]}...")
-                                            page_articles_count += 1
-                                        else:
-                                            date_filtered_count += 1
-                                            logger.debug(f"    ⚠️ 날짜 범위 제외: {article['title'][:30]}... [{article_date.strftime('%Y-%m-%d')}]")
-                                    except:
-                                        # 날짜 파싱 실패 시 포함
-                                        articles.append(article)
-                                        logger.info(f"    ✓ {article['title'][:50]}...")
-                                        page_articles_count += 1
-                            else:
-                                duplicate_count += 1
-                                total_duplicates += 1
-                    
-                    # 해당 페이지 처리 결과 상세 로깅
-                    if page_articles_count > 0 or duplicate_count > 0 or date_filtered_count > 0:
-                        status_parts = []
-                        if page_articles_count > 0:
-                            status_parts.append(f"{page_articles_count}개 수집")
-                        if duplicate_count > 0:
-                            status_parts.append(f"{duplicate_count}개 중복")
-                        if date_filtered_count > 0:
-                            status_parts.append(f"{date_filtered_count}개 날짜범위 제외")
-                        logger.info(f"    → 페이지 {page} 결과: {', '.join(status_parts)}")
-                    
-                    # 페이지 증가는 기사 추출 완료 후에
-                    page += 1
-                    time.sleep(0.5)
-                    
+                        duplicate_count += 1
+                        total_duplicates += 1
+            
+            # 해당 페이지 처리 결과 상세 로깅
+            if page_articles_count > 0 or duplicate_count > 0 or date_filtered_count > 0:
+                status_parts = []
+                if page_articles_count > 0:
+                    status_parts.append(f"{page_articles_count}개 수집")
+                if duplicate_count > 0:
+                    status_parts.append(f"{duplicate_count}개 중복")
+                if date_filtered_count > 0:
+                    status_parts.append(f"{date_filtered_count}개 날짜범위 제외")
+                logger.info(f"    → 페이지 {page_no} 결과: {', '.join(status_parts)}")
+        
+        def drain_pages(block=False):
+            """앞쪽 페이지부터 본문 수집이 끝난 페이지 처리 (block이면 모두 처리)"""
+            while pending_pages and (block or all(f.done() for f in pending_pages[0][1])):
+                process_page_results(*pending_pages.popleft())
+        
+        while True:  # 페이지 제한 없음
+            try:
+                links = self._checkpoint('infomax', f'{start_str}-{end_str}', page,
+                                         lambda: self._fetch_infomax_page(session, start_str, end_str, page))
             except Exception as e:
                 logger.error(f"인포맥스 검색 오류: {e}")
                 break
+            
+            # HTTP 오류면 같은 페이지 재요청 (3회 연속이면 종료)
+            if links is None:
+                failed_pages += 1
+                if failed_pages >= 3:
+                    logger.error(f"  페이지 {page} 요청 3회 연속 실패, 크롤링 종료")
+                    break
+                continue
+            failed_pages = 0
+            
+            # 이전 페이지들과 겹치는 링크 제거 (URL 기반 중복 제거)
+            article_links = []
+            for href in links:
+                url_hash = hashlib.md5(href.encode()).hexdigest()
+                if url_hash not in collected_urls:
+                    collected_urls.add(url_hash)
+                    article_links.append(href)
+            
+            if not article_links:
+                consecutive_empty += 1
+                logger.info(f"  페이지 {page}: 결과 없음")
+                if consecutive_empty >= 5:  # 연속 5페이지 빈 경우 종료 (더 관대하게)
+                    logger.info("  연속 5페이지 빈 결과, 크롤링 종료")
+                    last_page = page - 5
+                    base_search_url = f'https://news.einfomax.co.kr/news/articleList.html?page={last_page}&sc_section_code=&sc_sub_section_code=&sc_serial_code=&sc_area=&sc_level=&sc_article_type=&sc_view_level=&sc_sdate={start_str}&sc_edate={end_str}&sc_serial_number=&sc_word={quote(self.keyword)}'
+                    logger.info(f"  수집 종료 - 마지막 페이지: {last_page}")
+                    logger.info(f"  마지막 페이지 링크: {base_search_url}")
+                    break
+            else:
+                consecutive_empty = 0  # 리셋
+                logger.info(f"  페이지 {page}: {len(article_links)}개 발견")
+            
+            # 각 링크의 본문 수집을 예약하고 다음 목록 페이지로 진행
+            pending_pages.append((page, [
+                self._submit_detail(self.extract_infomax_article, link, session=session)
+                for link in article_links
+            ]))
+            drain_pages()
+            while len(pending_pages) > max_pending_pages:
+                process_page_results(*pending_pages.popleft())
+            
+            page += 1
         
+        drain_pages(block=True)
         logger.info(f"인포맥스 크롤링 완료: 총 {len(articles)}개 기사 수집 (중복 {total_duplicates}개 제외)")
         if page > 1:
             first_url = f'https://news.einfomax.co.kr/news/articleList.html?page=1&sc_section_code=&sc_sub_section_code=&sc_serial_code=&sc_area=&sc_level=&sc_article_type=&sc_view_level=&sc_sdate={start_str}&sc_edate={end_str}&sc_serial_number=&sc_word={quote(self.keyword)}'
@@ -784,6 +901,52 @@ class UnifiedNewsCrawler:
             logger.info(f"  실제 발견 기사: {len(articles) + total_duplicates}개 (수집 {len(articles)}개 + 중복 {total_duplicates}개)")
         return articles
     
+    def _fetch_infomax_page(self, session, start_str, end_str, page) -> Optional[List[str]]:
+        """인포맥스 기사 목록 한 페이지 → 페이지 내 중복을 뺀 기사 링크 (HTTP 오류면 None)"""
+        url = "https://news.einfomax.co.kr/news/articleList.html"
+        params = {
+            'sc_word': self.keyword,
+            'sc_sdate': start_str,
+            'sc_edate': end_str,
+            'page': str(page)
+            # sc_section_code 제거 - 전체 섹션 검색
+        }
+        
+        # 각 페이지마다 Referer 헤더 추가
+        headers = {
+            'Referer': f'https://news.einfomax.co.kr/news/articleList.html?page={page-1}' if page > 1 else 'https://news.einfomax.co.kr'
+        }
+        response = session.get(url, params=params, headers=headers, timeout=10)
+        
+        if response.status_code != 200:
+            return None
+        
+        soup = BeautifulSoup(response.text, 'html.parser')
+        
+        # 기사 링크 찾기 - 개선된 방식
+        links = []
+        seen_ids = set()  # 이 페이지에서 본 기사 ID
+        
+        for a in soup.find_all('a', href=True):
+            href = a.get('href', '')
+            # 더 정확한 패턴 매칭
+            if '/articleView.html?idxno=' in href:
+                # 기사 ID 추출
+                try:
+                    article_id = href.split('idxno=')[1].split('&')[0]
+                    
+                    # 이 페이지에서 중복 제거
+                    if article_id not in seen_ids:
+                        seen_ids.add(article_id)
+                        
+                        if not href.startswith('http'):
+                            href = urljoin('https://news.einfomax.co.kr', href)
+                        links.append(href)
+                except:
+                    pass
+        
+        return links
+    
     def extract_infomax_article(self, url: str, session=None) -> Optional[Dict]:
         """인포맥스 기사 추출"""
         try:
@@ -908,6 +1071,10 @@ class UnifiedNewsCrawler:
     
     def crawl_all(self, start_date: str, end_date: str, sources=['yonhap', 'edaily', 'infomax']) -> Dict[str, List[Dict]]:
         """모든 소스에서 크롤링"""
+        if self.parallel_sources:
+            with SourceScheduler(self) as scheduler:
+                return scheduler.collect(scheduler.submit(start_date, end_date, sources))
+        
         results = {}
         
         if 'yonhap' in sources:
@@ -931,9 +1098,12 @@ class UnifiedNewsCrawler:
         return results
     
     def save_to_json(self, data: Dict, filename: str):
-        """JSON 파일로 저장"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """JSON 파일로 저장 (.jsonl / .jsonl.gz / .jsonl.zst이면 기사 한 줄씩 스트리밍 저장)"""
+        if is_jsonl(filename):
+            write_grouped(filename, data)
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
         
         total_articles = sum(len(articles) for articles in data.values())
         logger.info(f"저장 완료: {filename} (총 {total_articles}개)")
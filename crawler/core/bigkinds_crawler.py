@@ -2,14 +2,20 @@
 """
 빅카인즈(BigKinds) API 크롤러
 공식 API를 사용한 뉴스 데이터 수집
+요청 간격과 429 백오프는 고정 sleep 대신 공용 적응형 속도 제한기(core.rate_limiter)가 조절
 """
 import requests
 import json
-import time
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.rate_limiter import mount_limited
 
 # 로깅 설정
 logging.basicConfig(
@@ -22,12 +28,13 @@ logger = logging.getLogger(__name__)
 class BigKindsCrawler:
     """빅카인즈 공식 API 크롤러"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, rate_limiter=None):
         """
         초기화
         
         Args:
             api_key: 빅카인즈 API 키 (없으면 환경변수에서 읽음)
+            rate_limiter: 요청 속도 제한기 (없으면 공용 shared_limiter)
         """
         self.api_key = api_key or os.getenv('BIGKINDS_API_KEY')
         if not self.api_key:
@@ -37,8 +44,8 @@ class BigKindsCrawler:
         # API 엔드포인트
         self.base_url = "https://www.bigkinds.or.kr/api/news"
         
-        # 세션 설정
-        self.session = requests.Session()
+        # 세션 설정 (모든 요청이 속도 제한기를 거침)
+        self.session = mount_limited(requests.Session(), rate_limiter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (compatible; BigKindsCrawler/1.0)',
             'Content-Type': 'application/json',
@@ -126,14 +133,14 @@ class BigKindsCrawler:
                             break
                         
                         page += 1
-                        time.sleep(1)  # API 호출 간격
                     else:
                         logger.warning("응답에 documents가 없습니다")
                         break
                         
                 elif response.status_code == 429:
-                    logger.warning("Rate limit 초과. 60초 대기...")
-                    time.sleep(60)
+                    # 어댑터가 백오프하며 재시도한 뒤에도 429 → 이번 검색 중단
+                    logger.warning("Rate limit 초과 (재시도 모두 실패), 검색 중단")
+                    break
                     
                 elif response.status_code == 401:
                     logger.error("API 키 인증 실패")
@@ -228,9 +235,6 @@ class BigKindsCrawler:
             results[source_key] = articles
             
             logger.info(f"{provider}: {len(articles)}개 수집 완료")
-            
-            # 언론사 간 대기
-            time.sleep(2)
         
         return results
     
@@ -246,9 +250,9 @@ class BigKindsCrawler:
 class BigKindsLabCrawler:
     """빅카인즈 Lab API 크롤러 (분석 API)"""
     
-    def __init__(self):
+    def __init__(self, rate_limiter=None):
         """초기화"""
-        self.session = requests.Session()
+        self.session = mount_limited(requests.Session(), rate_limiter)
         
         # BigKinds Lab API 엔드포인트 (공개 API)
         self.endpoints = {
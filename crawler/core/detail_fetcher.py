@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+기사 본문(상세 페이지) 동시 수집기
+- 스레드 풀에서 extract_*_article 호출, 목록 페이지 순회는 기다리지 않고 계속 진행
+- 도메인별 동시 요청 수(per_domain)와 최소 요청 간격(min_interval)으로 예의(politeness) 유지
+- 결과는 Future로 돌려주고, 호출 측이 제출 순서대로 꺼내 쓰므로 출력 순서/중복 제거 규칙은 그대로
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+
+class DomainPoliteness:
+    """도메인별 동시 요청 세마포어 + 최소 요청 간격"""
+
+    def __init__(self, per_domain=4, min_interval=0.1):
+        self.per_domain = per_domain
+        self.min_interval = min_interval
+        self.lock = threading.Lock()
+        self.semaphores = {}
+        self.next_slot = {}
+
+    def _semaphore(self, domain):
+        with self.lock:
+            if domain not in self.semaphores:
+                self.semaphores[domain] = threading.BoundedSemaphore(self.per_domain)
+            return self.semaphores[domain]
+
+    def _wait_turn(self, domain):
+        """같은 도메인 요청 시작 시각을 min_interval 간격으로 배정"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(domain, now))
+            self.next_slot[domain] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def run(self, url, fn, *args, **kwargs):
+        domain = urlparse(url).netloc
+        with self._semaphore(domain):
+            self._wait_turn(domain)
+            return fn(url, *args, **kwargs)
+
+
+class DetailFetcher:
+    """여러 소스가 공유하는 bounded 동시 상세 페이지 수집기"""
+
+    def __init__(self, max_workers=8, per_domain=4, min_interval=0.1):
+        self.max_workers = max_workers
+        self.politeness = DomainPoliteness(per_domain, min_interval)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='detail')
+
+    def submit(self, fn, url, *args, **kwargs):
+        """fn(url, ...) 예약 → Future (예외는 None 결과로 바꿔 목록 순회를 막지 않음)"""
+        return self.executor.submit(self._call, fn, url, *args, **kwargs)
+
+    def _call(self, fn, url, *args, **kwargs):
+        try:
+            return self.politeness.run(url, fn, *args, **kwargs)
+        except Exception:
+            return None
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def fill_content(pending):
+    """(기사 dict, Future) 목록을 제출 순서대로 기다려 본문/길이 채움"""
+    for article, future in pending:
+        full_article = future.result()
+        if full_article and full_article.get('content'):
+            article['content'] = full_article['content']
+            article['content_length'] = len(full_article['content'])
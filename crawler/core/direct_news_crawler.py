@@ -2,18 +2,24 @@
 """
 연합뉴스와 이데일리 자체 홈페이지 직접 크롤링
 네이버 의존성 없이 안정적으로 데이터 수집
+요청 간격은 고정 sleep 대신 공용 적응형 속도 제한기(core.rate_limiter)가 조절
 """
 
 import requests
 from bs4 import BeautifulSoup
 import json
-import time
 from datetime import datetime, timedelta
 import logging
 from typing import List, Dict, Optional
 import re
+import sys
+from pathlib import Path
 from urllib.parse import urljoin, urlparse, parse_qs
 
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.rate_limiter import mount_limited
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -21,9 +27,10 @@ logger = logging.getLogger(__name__)
 class DirectNewsCrawler:
     """언론사 직접 크롤링 통합 클래스"""
     
-    def __init__(self, keyword="금리"):
+    def __init__(self, keyword="금리", rate_limiter=None):
         self.keyword = keyword
         self.collected_urls = set()
+        self.rate_limiter = rate_limiter
         
     def crawl(self, source: str, start_date: str, end_date: str) -> List[Dict]:
         """통합 크롤링 메서드"""
@@ -37,7 +44,7 @@ class DirectNewsCrawler:
     def crawl_yonhap(self, start_date: str, end_date: str) -> List[Dict]:
         """연합뉴스 직접 크롤링"""
         
-        session = requests.Session()
+        session = mount_limited(requests.Session(), self.rate_limiter)
         session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -101,7 +108,6 @@ class DirectNewsCrawler:
                                 logger.info(f"    ✓ {article['title'][:40]}...")
                     
                     page += 1
-                    time.sleep(0.5)  # 서버 부하 방지
                     
                 else:
                     logger.error(f"HTTP {response.status_code}")
@@ -185,7 +191,7 @@ class DirectNewsCrawler:
     def crawl_edaily(self, start_date: str, end_date: str) -> List[Dict]:
         """이데일리 직접 크롤링"""
         
-        session = requests.Session()
+        session = mount_limited(requests.Session(), self.rate_limiter)
         session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -268,7 +274,6 @@ class DirectNewsCrawler:
                         break
                     
                     page += 1
-                    time.sleep(0.5)
                     
                 else:
                     logger.error(f"HTTP {response.status_code}")
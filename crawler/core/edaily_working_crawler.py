@@ -2,15 +2,23 @@
 """
 이데일리 크롤러 - 실제 작동하는 버전
 작년 코드 기반으로 복구
+sink(JsonlSink)를 넘기면 기사를 수집하는 즉시 JSON Lines로 기록 (메모리 목록에는 쌓지 않음)
+요청 간격은 고정 sleep 대신 공용 적응형 속도 제한기(core.rate_limiter)가 조절
 """
 
 import requests
 from bs4 import BeautifulSoup as bs
 import pandas as pd
 import json
-import time
 from datetime import datetime
 import logging
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from common.jsonl_sink import JsonlSink, is_jsonl
+from core.rate_limiter import mount_limited
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,15 +27,17 @@ logger = logging.getLogger(__name__)
 class EdailyWorkingCrawler:
     """이데일리 실제 작동 크롤러"""
     
-    def __init__(self):
+    def __init__(self, rate_limiter=None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36'
         }
+        # 요청 간격은 도메인별 적응형 속도 제한기(core.rate_limiter)가 조절
+        self.session = mount_limited(requests.Session(), rate_limiter)
         self.contents = []
         self.date_list = []
         self.url_list = []
         
-    def crawl_edaily(self, start, end, max_pages=None):
+    def crawl_edaily(self, start, end, max_pages=None, sink=None):
         """
         이데일리 크롤링 함수
         
@@ -35,6 +45,7 @@ class EdailyWorkingCrawler:
             start: 시작날짜 (YYYYMMDD 형식, 예: 20190101)
             end: 종료날짜 (YYYYMMDD 형식, 예: 20190131)
             max_pages: 최대 페이지 수 (None이면 모든 페이지)
+            sink: JsonlSink (주어지면 기사마다 바로 기록하고 self.contents 등 목록에는 쌓지 않음)
         """
         
         logger.info(f"이데일리 크롤링 시작: {start} ~ {end}")
@@ -44,6 +55,7 @@ class EdailyWorkingCrawler:
         
         page_number = 1
         empty_page_count = 0
+        collected = 0
         
         while True:
             # 페이지 제한 확인
@@ -54,7 +66,7 @@ class EdailyWorkingCrawler:
             current_url = base_url + str(page_number)
             
             try:
-                response = requests.get(current_url, headers=self.headers, timeout=10)
+                response = self.session.get(current_url, headers=self.headers, timeout=10)
                 
                 if response.status_code != 200:
                     logger.error(f"HTTP {response.status_code}")
@@ -76,57 +88,80 @@ class EdailyWorkingCrawler:
                     logger.info(f"페이지 {page_number}: {len(news_items)}개 기사 발견")
                 
                 for item in news_items:
+                    content = url = date_text = None
+                    
                     # 제목과 내용 추출
                     text_elem = item.select_one('.newsbox_texts')
                     if text_elem:
                         content = text_elem.text.strip()
-                        self.contents.append(content)
                         
                         # URL 추출
                         link_tag = item.find('a', href=True)
                         if link_tag:
                             url = 'https://www.edaily.co.kr' + link_tag['href']
-                            self.url_list.append(url)
-                        else:
-                            self.url_list.append(None)
                     
                     # 날짜 추출
                     date_elem = item.select_one('.author_category')
                     if date_elem:
                         date_text = date_elem.text.split()[0]
-                        self.date_list.append(date_text)
+                    
+                    if content is None:
+                        if date_text is not None and sink is None:
+                            self.date_list.append(date_text)
+                        continue
+                    
+                    collected += 1
+                    if sink is not None:
+                        # 스트리밍 모드: 메모리 목록에 쌓지 않고 바로 기록
+                        sink.write(self.make_article(content, date_text, url))
+                    else:
+                        self.contents.append(content)
+                        self.url_list.append(url)
+                        if date_text is not None:
+                            self.date_list.append(date_text)
                 
                 page_number += 1
-                time.sleep(0.5)  # 서버 부하 방지
                 
             except Exception as e:
                 logger.error(f"페이지 {page_number} 오류: {e}")
                 break
         
-        logger.info(f"크롤링 완료: 총 {len(self.contents)}개 기사 수집")
+        logger.info(f"크롤링 완료: 총 {collected}개 기사 수집")
         return self.contents, self.date_list, self.url_list
     
+    @staticmethod
+    def make_article(text, date, url):
+        """검색 결과 텍스트(첫 줄이 제목) → 기사 dict"""
+        lines = text.split('\n')
+        title = lines[0] if lines else ""
+        content = '\n'.join(lines[1:]) if len(lines) > 1 else ""
+        
+        return {
+            'date': date,
+            'title': title,
+            'content': content,
+            'url': url,
+            'source': 'edaily'
+        }
+    
     def save_to_json(self, filename='edaily_output.json'):
-        """JSON 형식으로 저장"""
+        """JSON 형식으로 저장 (.jsonl / .jsonl.gz / .jsonl.zst이면 한 줄에 기사 하나)"""
         
         articles = []
         for i in range(len(self.contents)):
-            # 제목과 내용 분리 (첫 줄이 제목)
-            lines = self.contents[i].split('\n')
-            title = lines[0] if lines else ""
-            content = '\n'.join(lines[1:]) if len(lines) > 1 else ""
-            
-            article = {
-                'date': self.date_list[i] if i < len(self.date_list) else None,
-                'title': title,
-                'content': content,
-                'url': self.url_list[i] if i < len(self.url_list) else None,
-                'source': 'edaily'
-            }
+            article = self.make_article(
+                self.contents[i],
+                self.date_list[i] if i < len(self.date_list) else None,
+                self.url_list[i] if i < len(self.url_list) else None
+            )
             articles.append(article)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
+        if is_jsonl(filename):
+            with JsonlSink(filename, append=False) as sink:
+                sink.write_many(articles)
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(articles, f, ensure_ascii=False, indent=2)
         
         logger.info(f"저장 완료: {filename}")
         return articles
@@ -215,25 +250,17 @@ def crawl_full_period(start_date, end_date):
         (20240201, 20240831)
     ]
     
-    all_articles = []
-    
-    for start, end in periods:
-        if start >= int(start_date.replace('-', '')) and end <= int(end_date.replace('-', '')):
-            logger.info(f"\n기간: {start} ~ {end}")
-            
-            crawler = EdailyWorkingCrawler()
-            crawler.crawl_edaily(start, end)
-            articles = crawler.save_to_json(f'/tmp/edaily_{start}_{end}.json')
-            all_articles.extend(articles)
-            
-            time.sleep(2)  # 서버 부하 방지
-    
-    # 전체 데이터 저장
-    with open('/tmp/edaily_all.json', 'w', encoding='utf-8') as f:
-        json.dump(all_articles, f, ensure_ascii=False, indent=2)
+    # 전체 데이터는 수집하는 즉시 JSON Lines로 기록 (전 기간을 메모리에 모으지 않음)
+    with JsonlSink('/tmp/edaily_all.jsonl', append=False) as sink:
+        for start, end in periods:
+            if start >= int(start_date.replace('-', '')) and end <= int(end_date.replace('-', '')):
+                logger.info(f"\n기간: {start} ~ {end}")
+                
+                crawler = EdailyWorkingCrawler()
+                crawler.crawl_edaily(start, end, sink=sink)
     
-    logger.info(f"\n전체 수집 완료: {len(all_articles)}개")
-    return all_articles
+    logger.info(f"\n전체 수집 완료: {sink.count}개")
+    return sink.count
 
 
 if __name__ == "__main__":
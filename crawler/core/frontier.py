@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+재개 가능한 크롤링 작업 저널 (crawl frontier)
+- 작업 단위 = (소스, 범위 키(검색어:범위), 페이지): 목록 페이지 하나를 파싱한 결과(기사 목록 + 종료 판단 정보)를 기록
+- 본문 수집 결과는 URL 단위로 기록 (성공한 것만)
+- 재시작 시 완료된 단위/URL은 저널에서 그대로 읽고, 나머지만 네트워크 요청
+- SQLite(WAL) 한 파일, 기록마다 커밋하므로 중간에 죽어도 직전 페이지까지 보존
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+
+class CrawlFrontier:
+    """작업 단위 / 본문 URL 저널 (상세 수집 스레드에서 공유 가능)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS units (
+                source TEXT NOT NULL, key TEXT NOT NULL, page INTEGER NOT NULL,
+                result TEXT NOT NULL, done_at TEXT,
+                PRIMARY KEY (source, key, page));
+            CREATE TABLE IF NOT EXISTS fetched (
+                url TEXT PRIMARY KEY, result TEXT NOT NULL, fetched_at TEXT);
+        """)
+
+    def _now(self):
+        return datetime.now().isoformat(timespec='seconds')
+
+    def get_unit(self, source, key, page):
+        """완료된 작업 단위 결과 (없으면 None)"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT result FROM units WHERE source = ? AND key = ? AND page = ?",
+                (source, key, page)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def complete_unit(self, source, key, page, result):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO units (source, key, page, result, done_at) VALUES (?, ?, ?, ?, ?)",
+                (source, key, page, json.dumps(result, ensure_ascii=False), self._now()))
+            self.conn.commit()
+
+    def get_fetched(self, url):
+        """이미 받은 본문 수집 결과 (없으면 None)"""
+        with self.lock:
+            row = self.conn.execute("SELECT result FROM fetched WHERE url = ?", (url,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def record_fetched(self, url, result):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO fetched (url, result, fetched_at) VALUES (?, ?, ?)",
+                (url, json.dumps(result, ensure_ascii=False), self._now()))
+            self.conn.commit()
+
+    def stats(self, source=None):
+        """완료 단위 수 / 본문 URL 수"""
+        with self.lock:
+            if source:
+                units = self.conn.execute("SELECT COUNT(*) FROM units WHERE source = ?",
+                                          (source,)).fetchone()[0]
+            else:
+                units = self.conn.execute("SELECT COUNT(*) FROM units").fetchone()[0]
+            fetched = self.conn.execute("SELECT COUNT(*) FROM fetched").fetchone()[0]
+        return {'units': units, 'fetched': fetched}
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
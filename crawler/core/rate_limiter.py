@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+크롤러 공용 요청 속도 제한기
+- RateLimiter: 토큰 버킷 (초당 rate개 충전, 최대 burst개 적립), 여러 스레드가 공유하면 전체 속도 상한
+- AdaptiveRateLimiter: 도메인별 토큰 버킷 + AIMD 조절
+  (정상 응답마다 rate를 조금씩 올리고, 429/503/타임아웃이면 절반으로 줄이고 잠시 멈춤)
+- RateLimitedAdapter: requests 세션에 마운트하면 모든 요청이 자동으로 acquire/기록을 거침
+  (429/503/타임아웃은 백오프 후 같은 요청을 retries회까지 다시 보냄 → 호출 측은 최종 결과만 받음)
+- 도메인별 현재 속도/대기 시간/백오프 횟수를 metrics()로 조회, export_metrics()로 JSON 저장
+"""
+
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 속도를 줄여야 하는 응답 코드
+BACKOFF_STATUS = {429, 503}
+
+
+class RateLimiter:
+    """스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens=1.0):
+        """토큰을 얻을 때까지 대기 → 대기한 초"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class AdaptiveBucket(RateLimiter):
+    """AIMD로 rate가 바뀌는 토큰 버킷 (도메인 하나)"""
+
+    def __init__(self, rate, min_rate, max_rate, increase, decrease):
+        super().__init__(rate, burst=1.0)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.backoffs = 0
+        self.waited = 0.0
+
+    def acquire(self, tokens=1.0):
+        with self.lock:
+            pause = self.blocked_until - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+        waited = super().acquire(tokens) + max(pause, 0.0)
+        with self.lock:
+            self.requests += 1
+            self.waited += waited
+        return waited
+
+    def success(self):
+        """정상 응답 → rate 가산 증가"""
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def backoff(self, retry_after=None):
+        """429/503/타임아웃 → rate 승산 감소 + 남은 토큰 비우고 잠시 멈춤"""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = min(self.tokens, 0.0)
+            self.blocked_until = max(self.blocked_until, now + (retry_after or 1.0 / self.rate))
+            self.backoffs += 1
+
+
+class AdaptiveRateLimiter:
+    """도메인별 AIMD 토큰 버킷 모음 (크롤러 전체가 공유)"""
+
+    def __init__(self, initial_rate=2.0, min_rate=0.2, max_rate=10.0, increase=0.05,
+                 decrease=0.5, jitter=0.0, max_retry_after=60.0):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.jitter = jitter
+        self.max_retry_after = max_retry_after
+        self.lock = threading.Lock()
+        self.buckets = {}
+
+    def bucket(self, url):
+        domain = urlparse(url).netloc or url
+        with self.lock:
+            if domain not in self.buckets:
+                self.buckets[domain] = AdaptiveBucket(self.initial_rate, self.min_rate, self.max_rate,
+                                                      self.increase, self.decrease)
+            return self.buckets[domain]
+
+    def acquire(self, url):
+        """url 도메인의 토큰을 얻을 때까지 대기 (jitter > 0이면 간격을 무작위로 늘림)"""
+        bucket = self.bucket(url)
+        waited = bucket.acquire()
+        if self.jitter:
+            extra = random.uniform(0, self.jitter / bucket.rate)
+            time.sleep(extra)
+            waited += extra
+        return waited
+
+    def record(self, url, status=None, error=False, retry_after=None):
+        """응답 결과 반영 (error=True는 타임아웃/연결 오류)"""
+        bucket = self.bucket(url)
+        if error or status in BACKOFF_STATUS:
+            bucket.backoff(retry_after)
+        elif status is not None and status < 500:
+            bucket.success()
+
+    def _retry_after(self, response):
+        value = response.headers.get('Retry-After', '')
+        if value.isdigit():
+            return min(float(value), self.max_retry_after)
+        return None
+
+    def metrics(self):
+        """도메인별 현재 속도 / 요청 수 / 백오프 수 / 누적 대기 시간"""
+        with self.lock:
+            buckets = dict(self.buckets)
+        return {
+            domain: {
+                'rate': round(bucket.rate, 3),
+                'requests': bucket.requests,
+                'backoffs': bucket.backoffs,
+                'waited_sec': round(bucket.waited, 1),
+            }
+            for domain, bucket in sorted(buckets.items())
+        }
+
+    def export_metrics(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'updated': time.strftime('%Y-%m-%d %H:%M:%S'), 'domains': self.metrics()},
+                      f, ensure_ascii=False, indent=2)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """요청 전 도메인 토큰 획득, 응답 후 AIMD 기록, 속도 초과 응답은 백오프 후 재시도"""
+
+    RETRY_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+    def __init__(self, limiter, *args, retries=3, **kwargs):
+        self.limiter = limiter
+        self.retries = retries
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        retries = self.retries if request.method in self.RETRY_METHODS else 0
+        for attempt in range(retries + 1):
+            # 백오프로 막힌 도메인이면 acquire가 멈춤 시간(Retry-After)만큼 기다림
+            self.limiter.acquire(request.url)
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                self.limiter.record(request.url, error=True)
+                if attempt == retries:
+                    raise
+                continue
+            self.limiter.record(request.url, status=response.status_code,
+                                retry_after=self.limiter._retry_after(response))
+            if response.status_code not in BACKOFF_STATUS or attempt == retries:
+                return response
+            response.close()
+
+
+# 프로세스 전체가 공유하는 기본 제한기
+shared_limiter = AdaptiveRateLimiter()
+
+
+def mount_limited(session, limiter=None, pool_maxsize=10, retries=3):
+    """세션의 http/https 요청이 모두 limiter를 거치도록 어댑터 마운트 (429/503/타임아웃은 retries회 재시도)"""
+    adapter = RateLimitedAdapter(limiter or shared_limiter, pool_connections=10,
+                                 pool_maxsize=max(10, pool_maxsize), retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
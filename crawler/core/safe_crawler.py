@@ -2,6 +2,9 @@
 """
 통합 뉴스 크롤러 (안전 강화 버전)
 네이버 검색 제한 우회를 위한 개선된 크롤러
+요청 간격은 랜덤 sleep 대신 도메인별 적응형 속도 제한기(jitter 포함)가 조절
+url_index(core.url_index)를 주면 이전 실행에서 받은 본문은 요청 없이 재사용
+archive(common.response_archive)를 주면 모든 원본 응답을 보관 (replay 모드면 네트워크 없이 재생)
 """
 import requests
 from bs4 import BeautifulSoup
@@ -14,6 +17,13 @@ import os
 import logging
 from typing import List, Dict, Optional
 import hashlib
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.rate_limiter import AdaptiveRateLimiter, mount_limited
+from common.jsonl_sink import is_jsonl, write_grouped
 
 # 로깅 설정
 logging.basicConfig(
@@ -40,10 +50,12 @@ class SafeUnifiedNewsCrawler:
         'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/119.0'
     ]
     
-    def __init__(self, keyword="금리", safe_mode=True):
+    def __init__(self, keyword="금리", safe_mode=True, rate_limiter=None, url_index=None, archive=None):
         self.keyword = keyword
         self.safe_mode = safe_mode
         self.collected_urls = set()
+        self.url_index = url_index  # 실행 간 공유 URL 지문 색인 (None이면 매번 본문 요청)
+        self.archive = archive  # 원본 응답 보관소 (None이면 보관하지 않음)
         self.session = None
         self.retry_count = 0
         self.max_retries = 3
@@ -58,6 +70,16 @@ class SafeUnifiedNewsCrawler:
             self.max_delay = 2.0
             self.page_size = 10
         
+        # 도메인별 AIMD 제한기: 기본 간격 min_delay, jitter로 최대 2배까지 무작위 연장
+        # (정상 응답이 이어지면 간격을 조금씩 줄이고, 429/503/타임아웃이면 절반 속도로 후퇴)
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(
+            initial_rate=1.0 / self.min_delay,
+            min_rate=0.05,
+            max_rate=2.0 / self.min_delay,
+            increase=0.01,
+            jitter=1.0
+        )
+        
         # 세션 초기화
         self.reset_session()
     
@@ -67,6 +89,9 @@ class SafeUnifiedNewsCrawler:
             self.session.close()
         
         self.session = requests.Session()
+        mount_limited(self.session, self.rate_limiter)
+        if self.archive is not None:
+            self.archive.attach(self.session)
         
         # 랜덤 User-Agent 선택
         user_agent = random.choice(self.USER_AGENTS)
@@ -91,15 +116,22 @@ class SafeUnifiedNewsCrawler:
         try:
             logger.info(f"새 세션 생성 (User-Agent: {user_agent[:50]}...)")
             self.session.get('https://www.naver.com', timeout=10)
-            self.random_delay()  # 메인 페이지 방문 후 대기
         except:
             logger.warning("네이버 메인 접속 실패, 계속 진행")
     
-    def random_delay(self, multiplier=1.0):
-        """랜덤 대기 시간"""
-        delay = random.uniform(self.min_delay, self.max_delay) * multiplier
-        logger.debug(f"대기: {delay:.2f}초")
-        time.sleep(delay)
+    def fetch_article(self, extract, url):
+        """본문 추출 - URL 색인에 있으면 요청 없이 저장된 결과, 없으면 extract(url) 후 기록
+
+        본문(content)이 비어 있는 결과는 색인에 넣지 않는다 (다음 실행에서 다시 요청).
+        """
+        if self.url_index is not None:
+            cached = self.url_index.get(url)
+            if cached is not None and cached.get('content'):
+                return cached
+        article = extract(url)
+        if article and article.get('content') and self.url_index is not None:
+            self.url_index.add(url, article, source=article.get('source'))
+        return article
     
     def safe_request(self, url, params=None, max_retries=None):
         """안전한 요청 처리 (재시도 메커니즘 포함)"""
@@ -110,11 +142,9 @@ class SafeUnifiedNewsCrawler:
         
         for attempt in range(max_retries):
             try:
-                # 재시도 시 대기시간 증가 (exponential backoff)
+                # 재시도 대기는 제한기 백오프가 담당 (실패 응답마다 속도 절반)
                 if attempt > 0:
-                    wait_time = (2 ** attempt) * random.uniform(2, 4)
-                    logger.warning(f"재시도 {attempt+1}/{max_retries}, {wait_time:.1f}초 대기...")
-                    time.sleep(wait_time)
+                    logger.warning(f"재시도 {attempt+1}/{max_retries}...")
                     
                     # 3번째 시도부터는 세션 재생성
                     if attempt >= 2:
@@ -127,12 +157,10 @@ class SafeUnifiedNewsCrawler:
                 if response.status_code == 200:
                     return response
                 elif response.status_code == 429:
-                    logger.warning(f"Rate limit detected (429). Waiting longer...")
-                    time.sleep(30)  # Rate limit 시 30초 대기
+                    logger.warning(f"Rate limit detected (429). Backing off...")
                     self.reset_session()
                 elif response.status_code == 503:
                     logger.warning(f"Service unavailable (503). Retrying...")
-                    time.sleep(10)
                 else:
                     logger.warning(f"HTTP {response.status_code} for {url}")
                     
@@ -214,12 +242,9 @@ class SafeUnifiedNewsCrawler:
                     empty_page_count = 0
                     logger.info(f"  페이지 {page+1}: {len(yonhap_links)}개 발견")
                     
-                    # 각 링크에서 기사 추출 (대기시간 포함)
+                    # 각 링크에서 기사 추출 (요청 간격은 속도 제한기가 조절)
                     for idx, link in enumerate(yonhap_links):
-                        if idx > 0 and idx % 3 == 0:  # 3개마다 추가 대기
-                            self.random_delay(multiplier=1.5)
-                        
-                        article = self.extract_yonhap_article(link)
+                        article = self.fetch_article(self.extract_yonhap_article, link)
                         if article:
                             # 날짜 확인
                             if article.get('date'):
@@ -230,20 +255,13 @@ class SafeUnifiedNewsCrawler:
                                         logger.info(f"    ✓ {article['title'][:50]}...")
                                 except:
                                     pass
-                        
-                        # 각 기사 추출 후 짧은 대기
-                        self.random_delay(multiplier=0.5)
                 
                 page += 1
                 
-                # 페이지 간 대기 (안전 모드)
-                self.random_delay(multiplier=1.5)
-                
                 # 10페이지마다 세션 재생성
                 if page > 0 and page % 10 == 0:
                     logger.info("10페이지 처리 완료, 세션 재생성...")
                     self.reset_session()
-                    self.random_delay(multiplier=2.0)
                     
             else:
                 consecutive_errors += 1
@@ -394,10 +412,7 @@ class SafeUnifiedNewsCrawler:
                     
                     # 각 링크에서 기사 추출
                     for idx, link in enumerate(edaily_links):
-                        if idx > 0 and idx % 3 == 0:
-                            self.random_delay(multiplier=1.5)
-                        
-                        article = self.extract_edaily_article(link)
+                        article = self.fetch_article(self.extract_edaily_article, link)
                         if article:
                             if article.get('date'):
                                 try:
@@ -407,17 +422,13 @@ class SafeUnifiedNewsCrawler:
                                         logger.info(f"    ✓ {article['title'][:50]}...")
                                 except:
                                     pass
-                        
-                        self.random_delay(multiplier=0.5)
                 
                 page += 1
-                self.random_delay(multiplier=1.5)
                 
                 # 10페이지마다 세션 재생성
                 if page > 0 and page % 10 == 0:
                     logger.info("10페이지 처리 완료, 세션 재생성...")
                     self.reset_session()
-                    self.random_delay(multiplier=2.0)
                     
             else:
                 consecutive_errors += 1
@@ -551,10 +562,7 @@ class SafeUnifiedNewsCrawler:
                 
                 # 각 링크에서 기사 추출
                 for idx, link in enumerate(article_links):
-                    if idx > 0 and idx % 3 == 0:
-                        self.random_delay(multiplier=1.5)
-                    
-                    article = self.extract_infomax_article(link)
+                    article = self.fetch_article(self.extract_infomax_article, link)
                     if article:
                         title_hash = hashlib.md5(article['title'].encode()).hexdigest()
                         if title_hash not in collected_titles:
@@ -570,16 +578,11 @@ class SafeUnifiedNewsCrawler:
                                 except:
                                     articles.append(article)
                                     logger.info(f"    ✓ {article['title'][:50]}...")
-                    
-                    self.random_delay(multiplier=0.5)
-                
-                self.random_delay(multiplier=1.0)
                 
                 # 10페이지마다 세션 재생성
                 if page > 0 and page % 10 == 0:
                     logger.info("10페이지 처리 완료, 세션 재생성...")
                     self.reset_session()
-                    self.random_delay(multiplier=2.0)
                     
             else:
                 consecutive_errors += 1
@@ -713,7 +716,6 @@ class SafeUnifiedNewsCrawler:
         for source in sources:
             logger.info(f"\n=== {source.upper()} 크롤링 시작 ===")
             self.reset_session()
-            self.random_delay(multiplier=2.0)  # 소스 전환 시 추가 대기
             
             if source == 'yonhap':
                 articles = self.crawl_yonhap(start_date, end_date)
@@ -727,19 +729,16 @@ class SafeUnifiedNewsCrawler:
                 articles = self.crawl_infomax(start_date, end_date)
                 results['infomax'] = articles
                 logger.info(f"인포맥스: {len(articles)}개 수집")
-            
-            # 소스 간 대기 (긴 휴지 시간)
-            if source != sources[-1]:  # 마지막 소스가 아니면
-                wait_time = random.uniform(10, 20)
-                logger.info(f"다음 소스 크롤링 전 {wait_time:.1f}초 대기...")
-                time.sleep(wait_time)
         
         return results
     
     def save_to_json(self, data: Dict, filename: str):
-        """JSON 파일로 저장"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """JSON 파일로 저장 (.jsonl / .jsonl.gz / .jsonl.zst이면 기사 한 줄씩 스트리밍 저장)"""
+        if is_jsonl(filename):
+            write_grouped(filename, data)
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
         
         total_articles = sum(len(articles) for articles in data.values())
         logger.info(f"저장 완료: {filename} (총 {total_articles}개)")
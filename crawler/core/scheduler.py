@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+소스별 동시 크롤링 스케줄러
+- 소스(연합뉴스/이데일리/인포맥스)마다 전용 워커 풀 → 서로 다른 호스트를 동시에 수집
+- 소스별로 동시에 진행할 수 있는 기간(월) 수를 MONTH_OVERLAP으로 제한
+- 도메인별 요청 속도는 크롤러 세션의 공용 속도 제한기가 그대로 담당
+- 결과는 제출한 기간 순서대로, 소스 순서는 crawl_all과 같게(연합뉴스 → 이데일리 → 인포맥스) 모아서 반환
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+SOURCE_ORDER = ['yonhap', 'edaily', 'infomax']
+
+SOURCE_METHODS = {
+    'yonhap': 'crawl_yonhap',
+    'edaily': 'crawl_edaily',
+    'infomax': 'crawl_infomax',
+}
+
+SOURCE_NAMES = {
+    'yonhap': '연합뉴스',
+    'edaily': '이데일리',
+    'infomax': '인포맥스',
+}
+
+# 소스별 동시 진행 가능한 기간 수
+# 연합뉴스 API는 날짜 단위라 기간끼리 독립, 이데일리 검색도 기간 파라미터만 다름
+# 인포맥스는 기간마다 새 세션을 만들고 메인 페이지부터 방문하므로 한 번에 하나씩
+MONTH_OVERLAP = {
+    'yonhap': 2,
+    'edaily': 2,
+    'infomax': 1,
+}
+
+
+class SourceScheduler:
+    """소스별 워커 풀에 (소스, 기간) 작업을 배분"""
+
+    def __init__(self, crawler, overlap=None):
+        self.crawler = crawler
+        self.overlap = dict(MONTH_OVERLAP, **(overlap or {}))
+        self.executors = {
+            source: ThreadPoolExecutor(max_workers=self.overlap[source], thread_name_prefix=source)
+            for source in SOURCE_ORDER
+        }
+
+    def _crawl(self, source, start_date, end_date):
+        logger.info(f"\n=== {SOURCE_NAMES[source]} 크롤링 시작 ({start_date} ~ {end_date}) ===")
+        articles = getattr(self.crawler, SOURCE_METHODS[source])(start_date, end_date)
+        logger.info(f"{SOURCE_NAMES[source]}: {len(articles)}개 수집 ({start_date} ~ {end_date})")
+        return articles
+
+    def submit(self, start_date, end_date, sources):
+        """기간 하나의 소스별 작업 예약 → {소스: Future}"""
+        return {
+            source: self.executors[source].submit(self._crawl, source, start_date, end_date)
+            for source in SOURCE_ORDER if source in sources
+        }
+
+    @staticmethod
+    def collect(futures):
+        """소스별 Future를 기다려 crawl_all과 같은 결과 dict로 (작업 예외는 그대로 전달)"""
+        return {source: future.result() for source, future in futures.items()}
+
+    def run(self, ranges, sources):
+        """여러 기간을 한꺼번에 예약하고 기간 순서대로 (start, end, 결과) 반환"""
+        submitted = [(start, end, self.submit(start, end, sources)) for start, end in ranges]
+        for start, end, futures in submitted:
+            yield start, end, self.collect(futures)
+
+    def close(self, cancel=False):
+        for executor in self.executors.values():
+            executor.shutdown(wait=True, cancel_futures=cancel)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        # 예외로 빠져나가면 아직 시작하지 않은 기간은 취소
+        self.close(cancel=exc_type is not None)
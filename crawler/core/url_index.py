@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+실행 간 공유되는 URL 지문 색인 (본문 수집 결과 캐시)
+- 지문 = 정규화한 URL(스킴/프래그먼트 무시, 호스트 소문자)의 SHA-1 앞 16바이트 → SQLite 기본 키
+- 본문 추출 결과(기사 dict)를 zlib 압축 JSON으로 함께 보관 → 재실행 시 본문 요청 없이 그대로 사용
+- 메모리 Bloom 필터를 앞에 두어 처음 보는 URL은 SQLite 조회 없이 바로 통과
+- 같은 달 재수집 / 기간이 겹치는 수집은 목록 페이지 요청만 발생
+"""
+
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+def fingerprint(url):
+    """URL 지문 (16바이트) - http/https, #fragment, 호스트 대소문자 차이는 같은 URL로 취급"""
+    parts = urlsplit(url.strip())
+    key = f"{parts.netloc.lower()}{parts.path or '/'}"
+    if parts.query:
+        key += f"?{parts.query}"
+    return hashlib.sha1(key.encode('utf-8')).digest()[:16]
+
+
+class BloomFilter:
+    """지문(바이트열)용 Bloom 필터 - 지문 자체가 해시라 이중 해싱으로 k개 위치 계산"""
+
+    def __init__(self, capacity, error_rate=0.001):
+        capacity = max(int(capacity), 1)
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hashes = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, fp):
+        h1 = int.from_bytes(fp[:8], 'little')
+        h2 = int.from_bytes(fp[8:16], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, fp):
+        for pos in self._positions(fp):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, fp):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fp))
+
+
+class UrlIndex:
+    """URL 지문 → 본문 추출 결과 (여러 크롤러/스레드에서 공유 가능)"""
+
+    def __init__(self, path, capacity=1_000_000, error_rate=0.001):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS urls (
+                fp BLOB PRIMARY KEY, url TEXT NOT NULL, source TEXT,
+                result BLOB NOT NULL, fetched_at TEXT) WITHOUT ROWID;
+        """)
+
+        # 기존 지문을 모두 Bloom 필터에 적재 (여유분을 두고 크기 결정)
+        count = self.conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+        self.bloom = BloomFilter(max(capacity, count * 2), error_rate)
+        for (fp,) in self.conn.execute("SELECT fp FROM urls"):
+            self.bloom.add(fp)
+
+        self.hits = 0
+        self.misses = 0
+        self.false_positives = 0
+
+    def get(self, url):
+        """저장된 본문 추출 결과 (없으면 None)"""
+        fp = fingerprint(url)
+        with self.lock:
+            if fp not in self.bloom:
+                self.misses += 1
+                return None
+            row = self.conn.execute("SELECT result FROM urls WHERE fp = ?", (fp,)).fetchone()
+            if row is None:
+                self.false_positives += 1
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def __contains__(self, url):
+        fp = fingerprint(url)
+        with self.lock:
+            if fp not in self.bloom:
+                return False
+            return self.conn.execute("SELECT 1 FROM urls WHERE fp = ?", (fp,)).fetchone() is not None
+
+    def add(self, url, result, source=None):
+        """본문 추출 결과 기록 (같은 지문이면 덮어씀)"""
+        fp = fingerprint(url)
+        blob = zlib.compress(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO urls (fp, url, source, result, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (fp, url, source, blob, datetime.now().isoformat(timespec='seconds')))
+            self.conn.commit()
+            self.bloom.add(fp)
+
+    def stats(self):
+        """저장 URL 수 / 이번 실행 적중·미적중 / Bloom 오탐 수"""
+        with self.lock:
+            count = self.conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+        return {'urls': count, 'hits': self.hits, 'misses': self.misses,
+                'false_positives': self.false_positives}
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
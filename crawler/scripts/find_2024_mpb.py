@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """
 2024년 MPB 의사록 찾기
+요청 간격은 고정 sleep 대신 공용 적응형 속도 제한기(core.rate_limiter)가 조절
 """
 
 import requests
 from bs4 import BeautifulSoup
 import re
-import time
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.rate_limiter import mount_limited
 
 def find_2024_mpb():
     """2024년 의사록 찾기"""
@@ -15,6 +21,7 @@ def find_2024_mpb():
     print("2024년 MPB 의사록 검색 중...")
     print("="*60)
     
+    session = mount_limited(requests.Session())
     found_2024 = []
     pages_checked = 0
     
@@ -27,7 +34,7 @@ def find_2024_mpb():
             'pageIndex': page
         }
         
-        response = requests.get(url, params=params)
+        response = session.get(url, params=params)
         soup = BeautifulSoup(response.content, 'html.parser')
         
         items = soup.select('li.bbsRowCls')
@@ -69,8 +76,6 @@ def find_2024_mpb():
             min_year = min(years_on_page)
             max_year = max(years_on_page)
             print(f"페이지 {page}: {min_year}년 ~ {max_year}년")
-        
-        time.sleep(0.5)  # 서버 부담 방지
     
     print(f"\n검색 완료: {pages_checked}페이지 확인")
     print(f"2024년 의사록: {len(found_2024)}개 발견")
@@ -87,7 +92,7 @@ def find_2024_mpb():
         
         for page in range(min_page - 5, max_page + 5):
             params['pageIndex'] = page
-            response = requests.get(url, params=params)
+            response = session.get(url, params=params)
             soup = BeautifulSoup(response.content, 'html.parser')
             
             items = soup.select('li.bbsRowCls')
@@ -96,8 +101,6 @@ def find_2024_mpb():
                 date_match = re.search(r'(\d{4})[\.년\s]+(\d{1,2})[\.월\s]+(\d{1,2})', item_text)
                 if date_match and int(date_match.group(1)) == 2024:
                     total_2024 += 1
-            
-            time.sleep(0.3)
         
         print(f"\n총 2024년 의사록: {total_2024}개")
 
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+원본 응답 보관소(common.response_archive)에서 뉴스 기사 오프라인 재파싱 / 크롤러 벤치마크
+- 네트워크 접근 없이 보관된 응답만 사용 (보관소에 없는 요청은 실패로 집계)
+- articles: 보관된 기사 페이지에 현재 extract_*_article 파서를 다시 적용 (ProcessPool 병렬)
+  → 소스별 JSONL (url, source + 파서 결과), 파서 버그 수정 후 재수집 대신 사용
+- benchmark: 보관소를 고정 입력(fixture)으로 crawl_all을 재생해 속도 측정 (목록 순회 + 파싱 + 중복 제거)
+
+사용법:
+    python crawler/scripts/run.py --archive monthly 2020 1        # 수집하면서 원본 보관
+    python crawler/scripts/reparse.py articles --sources edaily --workers 8
+    python crawler/scripts/reparse.py benchmark 2020-01-01 2020-01-31 --repeat 3
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+CRAWLER_ROOT = Path(__file__).parent.parent
+sys.path.append(str(CRAWLER_ROOT))
+
+from core.base_crawler import UnifiedNewsCrawler
+from common.jsonl_sink import JsonlSink
+from common.response_archive import ARCHIVE_FILE, ResponseArchive
+
+OUTPUT_DIR = CRAWLER_ROOT / "data/reparsed"
+
+# 소스별 (파서 메서드, 보관소 기사 페이지 URL 패턴 - SQL LIKE)
+PARSERS = {
+    'yonhap': ('extract_yonhap_article', '%yna.co.kr/view/%'),
+    'edaily': ('extract_edaily_article', '%edaily.co.kr/news/read%'),
+    'infomax': ('extract_infomax_article', '%/articleView.html%'),
+}
+
+_crawler = None
+
+
+def offline_crawler(archive_path, **kwargs):
+    """보관소 재생 모드 크롤러 (모든 세션이 네트워크 대신 보관소 사용)"""
+    archive = ResponseArchive(archive_path, replay=True)
+    return UnifiedNewsCrawler(archive=archive, **kwargs)
+
+
+def _init_worker(archive_path):
+    global _crawler
+    logging.disable(logging.ERROR)  # 파서 오류 로그는 결과(None) 집계로 대신
+    _crawler = offline_crawler(archive_path)
+
+
+def _parse_task(args):
+    """(소스, URL) → (소스, URL, 파서 결과) (워커 프로세스)"""
+    source, url = args
+    return source, url, getattr(_crawler, PARSERS[source][0])(url)
+
+
+def reparse(sources, archive_path=ARCHIVE_FILE, output_dir=OUTPUT_DIR, workers=None):
+    """보관된 기사 페이지 전체 재파싱 → 소스별 통계 dict"""
+    start = time.perf_counter()
+    archive = ResponseArchive(archive_path, replay=True)
+    tasks = [(source, url) for source in sources for url in archive.urls(PARSERS[source][1])]
+    archive.close()
+
+    workers = workers or os.cpu_count() or 1
+    print(f"Re-parsing {len(tasks):,} archived article pages with {workers} workers (offline)")
+
+    stats = {source: {'pages': 0, 'parsed': 0, 'failed': 0, 'empty_content': 0} for source in sources}
+    sinks = {source: JsonlSink(Path(output_dir) / f"{source}_reparsed.jsonl", append=False)
+             for source in sources}
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(str(archive_path),)) as executor:
+            for source, url, result in executor.map(_parse_task, tasks, chunksize=16):
+                source_stats = stats[source]
+                source_stats['pages'] += 1
+                if not result:
+                    source_stats['failed'] += 1
+                    continue
+                source_stats['parsed'] += 1
+                if not result.get('content'):
+                    source_stats['empty_content'] += 1
+                sinks[source].write({'url': url, 'source': source, **result})
+    finally:
+        for sink in sinks.values():
+            sink.close()
+
+    for source, source_stats in stats.items():
+        print(f"  {source}: {source_stats['parsed']:,}/{source_stats['pages']:,} parsed, "
+              f"{source_stats['failed']:,} failed, {source_stats['empty_content']:,} without content "
+              f"→ {sinks[source].path}")
+    elapsed = time.perf_counter() - start
+    print(f"✓ Done in {elapsed:.1f}s ({len(tasks) / max(elapsed, 1e-9):,.0f} pages/sec)")
+    return stats
+
+
+def benchmark(start_date, end_date, sources, archive_path=ARCHIVE_FILE, repeat=3, parallel=True):
+    """보관소 재생으로 crawl_all 반복 실행 → 최고 기록 dict"""
+    best = None
+    for run in range(repeat):
+        crawler = offline_crawler(archive_path, parallel_sources=parallel)
+        began = time.perf_counter()
+        results = crawler.crawl_all(start_date, end_date, sources)
+        elapsed = time.perf_counter() - began
+
+        archived = crawler.archive.stats()
+        crawler.archive.close()
+        articles = sum(len(items) for items in results.values())
+        print(f"  run {run + 1}: {elapsed:.2f}s, {articles:,} articles, "
+              f"{archived['served']:,} responses replayed, {archived['missed']:,} missing")
+        if best is None or elapsed < best['elapsed']:
+            best = {'elapsed': elapsed, 'articles': articles, 'requests': archived['served'],
+                    'missed': archived['missed'],
+                    'sources': {source: len(items) for source, items in results.items()}}
+
+    print(f"Best: {best['elapsed']:.2f}s, {best['articles'] / max(best['elapsed'], 1e-9):,.1f} articles/sec, "
+          f"{best['requests'] / max(best['elapsed'], 1e-9):,.1f} responses/sec")
+    if best['missed']:
+        print(f"  ⚠️ 보관소에 없는 요청 {best['missed']:,}개 - 해당 기간을 --archive로 다시 수집해야 결과가 완전함")
+    return best
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='원본 응답 보관소에서 오프라인 재파싱 / 크롤러 벤치마크')
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--archive', type=str, default=str(ARCHIVE_FILE), help='응답 보관소 경로')
+    common.add_argument('--sources', default='yonhap,edaily,infomax', help='대상 소스')
+    subparsers = parser.add_subparsers(dest='command', help='실행 명령')
+
+    articles_parser = subparsers.add_parser('articles', parents=[common], help='보관된 기사 페이지 재파싱')
+    articles_parser.add_argument('--output', type=str, default=str(OUTPUT_DIR), help='결과 디렉토리')
+    articles_parser.add_argument('--workers', type=int, default=None, help='파싱 프로세스 수 (기본: CPU 수)')
+
+    bench_parser = subparsers.add_parser('benchmark', parents=[common], help='보관소 재생 크롤링 벤치마크')
+    bench_parser.add_argument('start_date', help='시작일 (YYYY-MM-DD)')
+    bench_parser.add_argument('end_date', help='종료일 (YYYY-MM-DD)')
+    bench_parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    bench_parser.add_argument('--sequential', action='store_true', help='소스 동시 수집 없이 순차 실행')
+
+    args = parser.parse_args()
+    if args.command is None:
+        parser.print_help()
+        return 1
+    if not Path(args.archive).exists():
+        print(f"보관소가 없습니다: {args.archive} (run.py --archive로 수집하면서 생성)")
+        return 1
+
+    sources = [source for source in args.sources.split(',') if source in PARSERS]
+    if args.command == 'articles':
+        reparse(sources, args.archive, args.output, args.workers)
+    elif args.command == 'benchmark':
+        logging.disable(logging.INFO)
+        benchmark(args.start_date, args.end_date, sources, args.archive, args.repeat,
+                  parallel=not args.sequential)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,6 @@
 import os
 import sys
 import json
-import time
-import random
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -19,6 +17,11 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from core.base_crawler import UnifiedNewsCrawler
 from core.safe_crawler import SafeUnifiedNewsCrawler
+from core.frontier import CrawlFrontier
+from core.scheduler import SourceScheduler
+from core.url_index import UrlIndex
+from common.jsonl_sink import read_grouped
+from common.response_archive import ARCHIVE_FILE, ResponseArchive
 
 # 로깅 설정
 def setup_logging(log_file='crawler.log'):
@@ -36,8 +39,11 @@ def setup_logging(log_file='crawler.log'):
 class CrawlerRunner:
     """통합 크롤러 실행 관리자"""
     
-    def __init__(self, safe_mode=False, base_dir=None):
+    def __init__(self, safe_mode=False, base_dir=None, yonhap_workers=1, yonhap_rate=10.0, use_frontier=True,
+                 parallel=True, output_format='jsonl', use_url_index=True, archive_path=None):
         self.safe_mode = safe_mode
+        # 결과 파일 형식: json(기존) / jsonl / jsonl.gz / jsonl.zst
+        self.output_suffix = f'.{output_format}'
         
         if base_dir:
             self.base_dir = Path(base_dir)
@@ -52,30 +58,57 @@ class CrawlerRunner:
         
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
+        # 실행 간 공유 URL 지문 색인 (이전 실행에서 받은 본문은 다시 요청하지 않음)
+        self.url_index = UrlIndex(self.data_dir / 'url_index.sqlite') if use_url_index else None
+        
+        # 원본 응답 보관소 (지정한 경우만, 파서 수정 후 scripts/reparse.py로 재수집 없이 재파싱)
+        self.archive = ResponseArchive(archive_path) if archive_path else None
+        
         # 크롤러 인스턴스 생성
         if safe_mode:
-            self.crawler = SafeUnifiedNewsCrawler(keyword="금리", safe_mode=True)
-            self.month_wait_min = 60
-            self.month_wait_max = 120
+            self.crawler = SafeUnifiedNewsCrawler(keyword="금리", safe_mode=True, url_index=self.url_index,
+                                                  archive=self.archive)
+            self.frontier = None  # 안전 모드 크롤러는 저널 미지원
         else:
-            self.crawler = UnifiedNewsCrawler(keyword="금리")
-            self.month_wait_min = 30
-            self.month_wait_max = 60
+            # 목록 페이지/본문 URL 저널 (중단 후 다시 실행하면 완료된 단위는 요청하지 않음)
+            self.frontier = CrawlFrontier(self.data_dir / 'frontier.sqlite') if use_frontier else None
+            
+            # yonhap_workers > 1이면 연합뉴스 API를 날짜 단위로 나눠 동시 수집
+            self.crawler = UnifiedNewsCrawler(keyword="금리", yonhap_workers=yonhap_workers,
+                                              yonhap_rate=yonhap_rate, frontier=self.frontier,
+                                              parallel_sources=parallel, url_index=self.url_index,
+                                              archive=self.archive)
+        
+        # 소스별 워커로 여러 달을 겹쳐 수집 (안전 모드는 세션 하나를 돌려 쓰므로 순차)
+        self.parallel = parallel and not safe_mode
+        
+        # 요청 간격은 크롤러 세션의 도메인별 AIMD 제한기가 담당 (월/소스 사이 고정 대기 없음)
+        self.rate_limiter = self.crawler.rate_limiter
+        self.metrics_file = self.data_dir / 'rate_metrics.json'
         
         self.logger = logging.getLogger(__name__)
     
-    def run_monthly(self, year, month, sources=['yonhap', 'edaily', 'infomax']):
-        """월별 크롤링 실행"""
-        # 월의 첫날과 마지막날 계산
+    def month_range(self, year, month):
+        """월의 첫날과 마지막날 → ('YYYY-MM-DD', 'YYYY-MM-DD')"""
         first_day = datetime(year, month, 1)
         if month == 12:
             last_day = datetime(year, 12, 31)
         else:
             last_day = datetime(year, month + 1, 1) - timedelta(days=1)
         
-        start_date = first_day.strftime('%Y-%m-%d')
-        end_date = last_day.strftime('%Y-%m-%d')
+        return first_day.strftime('%Y-%m-%d'), last_day.strftime('%Y-%m-%d')
+    
+    def run_monthly(self, year, month, sources=['yonhap', 'edaily', 'infomax']):
+        """월별 크롤링 실행"""
+        start_date, end_date = self.month_range(year, month)
+        self.log_month_header(year, month, start_date, end_date, sources)
         
+        # 크롤링 실행
+        results = self.crawler.crawl_all(start_date, end_date, sources)
+        
+        return self.save_month(year, month, start_date, end_date, results)
+    
+    def log_month_header(self, year, month, start_date, end_date, sources):
         self.logger.info(f"\n{'='*60}")
         self.logger.info(f"월별 크롤링: {year}년 {month}월")
         self.logger.info(f"모드: {'안전' if self.safe_mode else '일반'}")
@@ -83,12 +116,26 @@ class CrawlerRunner:
         self.logger.info(f"대상: {', '.join(sources)}")
         self.logger.info(f"{'='*60}")
         
-        # 크롤링 실행
-        results = self.crawler.crawl_all(start_date, end_date, sources)
+        if self.frontier is not None:
+            journal = self.frontier.stats()
+            self.logger.info(f"작업 저널: {self.frontier.path} "
+                             f"(완료 단위 {journal['units']}개, 본문 {journal['fetched']}개 - 재사용)")
         
-        # 결과 저장
-        output_file = self.data_dir / f'news_{year}_{month:02d}.json'
+        if self.url_index is not None:
+            index = self.url_index.stats()
+            self.logger.info(f"URL 색인: {self.url_index.path} (저장 {index['urls']}개, "
+                             f"재사용 {index['hits']}개, 새 URL {index['misses']}개)")
+        
+        if self.archive is not None:
+            archived = self.archive.stats()
+            self.logger.info(f"응답 보관소: {self.archive.path} (보관 {archived['responses']}개, "
+                             f"{archived['stored_bytes'] / 1e6:.1f}MB 압축 / 원본 {archived['bytes'] / 1e6:.1f}MB)")
+    
+    def save_month(self, year, month, start_date, end_date, results):
+        """월 결과 저장(news_YYYY_MM.json) + 통계"""
+        output_file = self.data_dir / f'news_{year}_{month:02d}{self.output_suffix}'
         self.crawler.save_to_json(results, str(output_file))
+        self.export_rate_metrics()
         
         # 통계
         stats = {
@@ -112,6 +159,33 @@ class CrawlerRunner:
         
         return stats
     
+    def iter_months(self, year, sources, start_month, end_month):
+        """월별 결과 통계를 월 순서대로 (일반 모드는 소스별 워커로 여러 달을 겹쳐 수집)"""
+        months = list(range(start_month, end_month + 1))
+        
+        if not self.parallel:
+            for month in months:
+                self.logger.info(f"\n>>> {month}월 수집 시작...")
+                yield self.run_monthly(year, month, sources)
+            return
+        
+        ranges = [self.month_range(year, month) for month in months]
+        with SourceScheduler(self.crawler) as scheduler:
+            self.logger.info(f"\n>>> {months[0]}~{months[-1]}월 예약 "
+                             f"(소스별 동시 진행 월 수: {scheduler.overlap})")
+            for month, (start_date, end_date, results) in zip(months, scheduler.run(ranges, sources)):
+                self.log_month_header(year, month, start_date, end_date, sources)
+                yield self.save_month(year, month, start_date, end_date, results)
+    
+    def export_rate_metrics(self):
+        """도메인별 현재 요청 속도를 로그와 JSON(rate_metrics.json)으로 내보냄"""
+        metrics = self.rate_limiter.metrics()
+        for domain, m in metrics.items():
+            self.logger.info(f"  속도 {domain}: {m['rate']:.2f}/s "
+                             f"(요청 {m['requests']}, 백오프 {m['backoffs']}, 대기 {m['waited_sec']}초)")
+        self.rate_limiter.export_metrics(self.metrics_file)
+        return metrics
+    
     def run_yearly(self, year, sources=['yonhap', 'edaily', 'infomax'], start_month=1, end_month=12):
         """연도별 크롤링 실행"""
         self.logger.info(f"\n{'#'*60}")
@@ -125,10 +199,7 @@ class CrawlerRunner:
         yearly_total = {source: 0 for source in sources}
         yearly_total['total'] = 0
         
-        for month in range(start_month, end_month + 1):
-            self.logger.info(f"\n>>> {month}월 수집 시작...")
-            
-            stats = self.run_monthly(year, month, sources)
+        for stats in self.iter_months(year, sources, start_month, end_month):
             yearly_stats.append(stats)
             
             # 통계 누적
@@ -136,22 +207,6 @@ class CrawlerRunner:
                 if source in stats['sources']:
                     yearly_total[source] += stats['sources'][source]
             yearly_total['total'] += stats['total']
-            
-            # 월간 휴지 시간
-            if month < end_month:
-                if self.safe_mode:
-                    wait_time = random.uniform(self.month_wait_min, self.month_wait_max)
-                else:
-                    wait_time = random.uniform(30, 60)
-                
-                self.logger.info(f"다음 월 수집 전 {wait_time:.1f}초 대기...")
-                time.sleep(wait_time)
-            
-            # 3개월마다 추가 휴지 (안전 모드)
-            if self.safe_mode and month % 3 == 0 and month < end_month:
-                extra_wait = random.uniform(120, 180)
-                self.logger.info(f"3개월 처리 완료, 추가 {extra_wait:.1f}초 대기...")
-                time.sleep(extra_wait)
         
         # 연간 요약 저장
         summary = {
@@ -196,12 +251,12 @@ class CrawlerRunner:
             if articles:
                 self.logger.info(f"    샘플: {articles[0]['title'][:50]}...")
         
-        test_file = self.data_dir / f'test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        test_file = self.data_dir / f'test_{datetime.now().strftime("%Y%m%d_%H%M%S")}{self.output_suffix}'
         self.crawler.save_to_json(results, str(test_file))
         
         return results
     
-    def merge_data(self, pattern='news_*.json'):
+    def merge_data(self, pattern='news_*.json*'):
         """데이터 파일 병합"""
         self.logger.info(f"\n데이터 병합 시작: {pattern}")
         
@@ -215,13 +270,13 @@ class CrawlerRunner:
         
         for json_file in sorted(json_files):
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    for source in ['yonhap', 'edaily', 'infomax']:
-                        if source in data:
-                            all_articles[source].extend(data[source])
-                            self.logger.info(f"  {json_file.name} - {source}: {len(data[source])}개")
+                # JSON / JSONL(압축 포함) 모두 {소스: [기사]}로 읽음
+                data = read_grouped(json_file)
+                
+                for source in ['yonhap', 'edaily', 'infomax']:
+                    if source in data:
+                        all_articles[source].extend(data[source])
+                        self.logger.info(f"  {json_file.name} - {source}: {len(data[source])}개")
             
             except Exception as e:
                 self.logger.error(f"파일 읽기 실패: {json_file.name} - {e}")
@@ -288,11 +343,26 @@ def main():
     
     # merge 명령
     merge_parser = subparsers.add_parser('merge', help='데이터 병합')
-    merge_parser.add_argument('--pattern', default='news_*.json', help='파일 패턴')
+    merge_parser.add_argument('--pattern', default='news_*.json*', help='파일 패턴 (json / jsonl / jsonl.gz / jsonl.zst)')
     
     # 공통 옵션
     parser.add_argument('--safe', action='store_true', help='안전 모드 활성화')
     parser.add_argument('--log', default='crawler.log', help='로그 파일 경로')
+    parser.add_argument('--format', default='jsonl', choices=['json', 'jsonl', 'jsonl.gz', 'jsonl.zst'],
+                        help='월별 결과 파일 형식 (jsonl: 기사 한 줄씩)')
+    parser.add_argument('--sequential', action='store_true',
+                        help='소스/월 동시 수집 없이 순차 실행')
+    parser.add_argument('--no-frontier', action='store_true',
+                        help='작업 저널(frontier.sqlite) 없이 매번 전체 수집')
+    parser.add_argument('--no-url-index', action='store_true',
+                        help='URL 색인(url_index.sqlite) 없이 본문을 매번 새로 요청')
+    parser.add_argument('--archive', action='store_true',
+                        help='원본 HTTP 응답 보관 (파서 수정 후 scripts/reparse.py로 오프라인 재파싱)')
+    parser.add_argument('--archive-path', default=str(ARCHIVE_FILE), help='응답 보관소 경로')
+    parser.add_argument('--yonhap-workers', type=int, default=1,
+                        help='연합뉴스 API 날짜 샤딩 워커 수 (1이면 순차, 안전 모드에서는 무시)')
+    parser.add_argument('--yonhap-rate', type=float, default=10.0,
+                        help='연합뉴스 API 전체 초당 요청 수 상한 (샤딩 모드)')
     
     args = parser.parse_args()
     
@@ -300,7 +370,10 @@ def main():
     logger = setup_logging(args.log)
     
     # 크롤러 실행기 생성
-    runner = CrawlerRunner(safe_mode=args.safe)
+    runner = CrawlerRunner(safe_mode=args.safe, yonhap_workers=args.yonhap_workers,
+                           yonhap_rate=args.yonhap_rate, use_frontier=not args.no_frontier,
+                           parallel=not args.sequential, output_format=args.format,
+                           use_url_index=not args.no_url_index, archive_path=args.archive_path if args.archive else None)
     
     # 명령 실행
     if args.command == 'test':
@@ -369,8 +369,25 @@ class MPBPipeline:
     def _label_data(self):
         """Label data based on rate changes"""
         logger.info("Labeling data...")
-        # TODO: Implement labeling logic
-        pass
+        from preprocess.labeling.rate_calendar import CALL_RATE_FILE, RateCalendar
+        from preprocess.labeling.label_matrix import (
+            DEFAULT_CONFIG, LABEL_MATRIX_FILE, build_label_matrix, save_label_matrix
+        )
+        
+        if not CALL_RATE_FILE.exists():
+            logger.warning("Call rates data not found, skipping labeling")
+            return None
+        
+        # Date × (horizon, threshold) labels; documents join on date with join_labels
+        calendar = RateCalendar.from_csv(CALL_RATE_FILE)
+        matrix = build_label_matrix(calendar)
+        save_label_matrix(matrix)
+        
+        counts = matrix[DEFAULT_CONFIG].value_counts()
+        logger.info(f"Label matrix: {len(matrix)} dates x {len(matrix.columns)} configs, "
+                    f"{DEFAULT_CONFIG}: Hawkish={counts.get(1, 0)}, Dovish={counts.get(0, 0)}, "
+                    f"saved to {LABEL_MATRIX_FILE}")
+        return matrix
     
     def analyze_ngrams(self):
         """Perform n-gram analysis"""
@@ -414,9 +431,23 @@ class MPBPipeline:
     
     def _train_model(self, model_type):
         """Train specific model type"""
-        # TODO: Implement model training
-        logger.debug(f"Training {model_type} model")
-        pass
+        trainers = {
+            'svm': self._train_linear_model,
+        }
+        if model_type not in trainers:
+            # TODO: Implement nbc / deep_learning training
+            logger.debug(f"Training {model_type} model")
+            return
+        return trainers[model_type]()
+    
+    def _train_linear_model(self):
+        """Train hinge / logistic SGD models on the sentence n-gram matrix"""
+        from modeling.linear.linear_sentence_model import train_and_report
+        
+        results = train_and_report()
+        for name, metrics in results.items():
+            logger.info(f"{name}: F1={metrics.get('f1')}, train_seconds={metrics.get('train_seconds')}")
+        return results
     
     def evaluate_models(self):
         """Evaluate model performance"""
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+linear_sentence_model.py
+문장 단위 희소 선형 모델 (MPBPipeline 'svm' 슬롯)
+- hinge(선형 SVM) / log_loss(로지스틱) SGD, 문장 n-gram CSR 행렬 공용 사용
+- 멀티스레드 parameter mixing: 샤드별 SGD 패스를 스레드로 동시에 돌린 뒤 가중치 평균
+  (sklearn SGD 내부 루프는 GIL을 해제하므로 스레드만으로 여러 코어 사용)
+- 검증 fold 기반 조기 종료
+- 디스크 샤드(.npz) 스트리밍 학습으로 RAM보다 큰 코퍼스 지원
+"""
+
+import argparse
+import json
+import pickle
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import joblib
+import numpy as np
+from joblib import Parallel, delayed
+from scipy.sparse import load_npz, save_npz
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+from sklearn.model_selection import train_test_split
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from modeling.sentence_nbc.ngram_vocab import NgramVocab
+from modeling.splits.split_index_store import SplitIndexStore
+
+OUTPUT_DIR = PROJECT_ROOT / "modeling/linear"
+NBC_DIR = PROJECT_ROOT / "modeling/sentence_nbc"
+
+
+def _sgd_pass(X, y, coef, intercept, loss, alpha, eta0, seed):
+    """샤드 하나에 대한 SGD 1 epoch (스레드 워커)"""
+    clf = SGDClassifier(loss=loss, alpha=alpha, learning_rate='constant', eta0=eta0,
+                        max_iter=1, tol=None, shuffle=True, random_state=seed)
+    with warnings.catch_warnings():
+        # max_iter=1은 의도된 설정이므로 수렴 경고 무시
+        warnings.simplefilter('ignore', ConvergenceWarning)
+        clf.fit(X, y, coef_init=coef, intercept_init=intercept)
+    return clf.coef_, clf.intercept_, X.shape[0]
+
+
+class SparseLinearModel:
+    """Parameter mixing SGD 기반 이진 선형 분류기"""
+
+    def __init__(self, loss='hinge', alpha=1e-6, eta0=0.01, n_jobs=4,
+                 max_epochs=20, patience=3, tol=1e-4, random_state=33):
+        self.loss = loss              # 'hinge' (선형 SVM) 또는 'log_loss' (로지스틱)
+        self.alpha = alpha            # L2 규제 강도
+        self.eta0 = eta0              # 초기 학습률 (epoch마다 1/sqrt(epoch) 감소)
+        self.n_jobs = n_jobs          # 동시에 학습하는 샤드 수 (스레드)
+        self.max_epochs = max_epochs
+        self.patience = patience      # 검증 F1이 개선되지 않아도 기다리는 epoch 수
+        self.tol = tol
+        self.random_state = random_state
+        self.coef_ = None
+        self.intercept_ = None
+        self.history = []
+
+    def _mix(self, shards, eta0, seed):
+        """샤드들을 병렬로 1 pass 학습 후 샘플 수 가중 평균"""
+        results = Parallel(n_jobs=self.n_jobs, prefer='threads')(
+            delayed(_sgd_pass)(X, y, self.coef_, self.intercept_,
+                               self.loss, self.alpha, eta0, seed + i)
+            for i, (X, y) in enumerate(shards)
+        )
+        weights = np.array([n for _, _, n in results], dtype=np.float64)
+        weights /= weights.sum()
+        self.coef_ = sum(w * coef for w, (coef, _, _) in zip(weights, results))
+        self.intercept_ = sum(w * intercept for w, (_, intercept, _) in zip(weights, results))
+
+    def fit_shards(self, shard_source, n_features, X_val, y_val):
+        """샤드 스트림으로 학습
+
+        shard_source: epoch마다 호출되어 (X, y) 샤드 iterator를 반환하는 함수.
+        n_jobs개씩 묶어 병렬로 학습하므로 동시에 메모리에 올라가는 샤드는 n_jobs개뿐이다.
+        """
+        self.coef_ = np.zeros((1, n_features))
+        self.intercept_ = np.zeros(1)
+        self.history = []
+
+        best_f1, best_state, stale = -1.0, None, 0
+        for epoch in range(self.max_epochs):
+            start = time.perf_counter()
+            eta0 = self.eta0 / np.sqrt(epoch + 1)
+            seed = self.random_state + epoch * 1000
+
+            batch = []
+            for shard in shard_source():
+                batch.append(shard)
+                if len(batch) == self.n_jobs:
+                    self._mix(batch, eta0, seed)
+                    seed += len(batch)
+                    batch = []
+            if batch:
+                self._mix(batch, eta0, seed)
+
+            val_f1 = f1_score(y_val, self.predict(X_val))
+            self.history.append({'epoch': epoch + 1, 'val_f1': float(val_f1),
+                                 'seconds': time.perf_counter() - start})
+            print(f"    Epoch {epoch + 1}: val F1={val_f1:.4f}")
+
+            if val_f1 > best_f1 + self.tol:
+                best_f1, stale = val_f1, 0
+                best_state = (self.coef_.copy(), self.intercept_.copy())
+            else:
+                stale += 1
+                if stale >= self.patience:
+                    print(f"    Early stopping (best val F1={best_f1:.4f})")
+                    break
+
+        self.coef_, self.intercept_ = best_state
+        return self
+
+    def fit(self, X, y, X_val, y_val):
+        """메모리 내 CSR 행렬 학습 (행을 섞어 n_jobs개 샤드로 분할)"""
+        rng = np.random.default_rng(self.random_state)
+        order = rng.permutation(X.shape[0])
+        X, y = X[order], np.asarray(y)[order]
+        bounds = np.linspace(0, X.shape[0], self.n_jobs + 1).astype(int)
+        shards = [(X[a:b], y[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+        return self.fit_shards(lambda: iter(shards), X.shape[1], X_val, y_val)
+
+    def decision_function(self, X):
+        return np.asarray(X @ self.coef_.T).ravel() + self.intercept_[0]
+
+    def predict(self, X):
+        return (self.decision_function(X) > 0).astype(int)
+
+    def predict_proba(self, X):
+        """Hawkish 확률 (log_loss 전용)"""
+        if self.loss != 'log_loss':
+            raise ValueError("predict_proba is only available for loss='log_loss'")
+        return 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+
+
+def save_shards(X, y, directory, rows_per_shard=200000):
+    """CSR 행렬을 행 단위 .npz 샤드로 저장"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for i, start in enumerate(range(0, X.shape[0], rows_per_shard)):
+        save_npz(directory / f"shard_{i:05d}.npz", X[start:start + rows_per_shard])
+        np.save(directory / f"shard_{i:05d}_labels.npy", np.asarray(y[start:start + rows_per_shard]))
+
+
+def iter_shards(directory):
+    """디스크 샤드를 하나씩 로드"""
+    for path in sorted(Path(directory).glob("shard_*[0-9].npz")):
+        yield load_npz(path).tocsr(), np.load(path.with_name(f"{path.stem}_labels.npy"))
+
+
+def load_sentence_matrix():
+    """문장 n-gram → 공용 사전 기반 CSR 행렬 (X, y)"""
+    with open(PROJECT_ROOT / "preprocess/sentence_ngram/sentence_ngrams.pkl", 'rb') as f:
+        sentence_ngrams = pickle.load(f)
+
+    vocab_dir = NBC_DIR / "ngram_vocab"
+    if vocab_dir.exists():
+        vocab = NgramVocab.load(vocab_dir)
+    else:
+        vocab = NgramVocab.build(ng for item in sentence_ngrams for ng in item['ngrams'])
+
+    X = vocab.transform(item['ngrams'] for item in sentence_ngrams)
+    y = np.array([item['label'] for item in sentence_ngrams])
+    return X, y
+
+
+def train_and_report(losses=('hinge', 'log_loss'), n_jobs=4, shard_dir=None,
+                     test_size=0.1, random_state=33):
+    """선형 모델 학습 후 30회 배깅 NBC와 wall time / F1 비교"""
+    print("="*60)
+    print("Sparse Linear Models (SGD)")
+    print("="*60)
+
+    print("\nBuilding sentence CSR matrix...")
+    X, y = load_sentence_matrix()
+    print(f"  {X.shape[0]:,} sentences × {X.shape[1]:,} n-grams, nnz={X.nnz:,}")
+
+    # NBC 앙상블 평가와 동일한 분할 (캐시된 random_state + 100 분할)
+    train_idx, test_idx = SplitIndexStore(y, test_size=test_size).split(random_state + 100)
+    # 조기 종료용 검증 fold는 학습 데이터 안에서 분리
+    fit_idx, val_idx = train_test_split(train_idx, test_size=test_size,
+                                        random_state=random_state, stratify=y[train_idx])
+    X_val, y_val = X[val_idx], y[val_idx]
+    X_test, y_test = X[test_idx], y[test_idx]
+
+    if shard_dir:
+        save_shards(X[fit_idx], y[fit_idx], shard_dir)
+        print(f"  Wrote training shards to {shard_dir}")
+
+    results = {}
+    for loss in losses:
+        print(f"\nTraining {loss} model ({n_jobs} threads)...")
+        model = SparseLinearModel(loss=loss, n_jobs=n_jobs, random_state=random_state)
+
+        start = time.perf_counter()
+        if shard_dir:
+            model.fit_shards(lambda: iter_shards(shard_dir), X.shape[1], X_val, y_val)
+        else:
+            model.fit(X[fit_idx], y[fit_idx], X_val, y_val)
+        elapsed = time.perf_counter() - start
+
+        y_pred = model.predict(X_test)
+        results[loss] = {
+            'train_seconds': elapsed,
+            'epochs': len(model.history),
+            'accuracy': float(accuracy_score(y_test, y_pred)),
+            'precision': float(precision_score(y_test, y_pred)),
+            'recall': float(recall_score(y_test, y_pred)),
+            'f1': float(f1_score(y_test, y_pred)),
+            'history': model.history
+        }
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        joblib.dump(model, OUTPUT_DIR / f"linear_{loss}.pkl")
+
+    # 30회 배깅 NBC 결과 (sentence_nbc_model.py 실행 결과)
+    nbc_stats_path = NBC_DIR / "model_stats.json"
+    if nbc_stats_path.exists():
+        with open(nbc_stats_path) as f:
+            nbc_stats = json.load(f)
+        results['nbc_30_bagging'] = {
+            'train_seconds': nbc_stats.get('train_seconds'),
+            'f1': nbc_stats.get('ensemble_f1'),
+            'mean_bag_f1': nbc_stats.get('mean_f1')
+        }
+
+    print("\n" + "="*60)
+    print(f"{'Model':<18}{'Wall time (s)':>15}{'F1':>10}")
+    for name, metrics in results.items():
+        seconds = metrics.get('train_seconds')
+        seconds = f"{seconds:,.1f}" if seconds is not None else 'n/a'
+        f1 = metrics.get('f1')
+        f1 = f"{f1:.4f}" if f1 is not None else 'n/a'
+        print(f"{name:<18}{seconds:>15}{f1:>10}")
+    print("="*60)
+
+    with open(OUTPUT_DIR / "linear_model_stats.json", 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"✓ Saved linear_model_stats.json")
+
+    return results
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='문장 단위 희소 선형 모델 학습')
+    parser.add_argument('--loss', nargs='+', choices=['hinge', 'log_loss'],
+                        default=['hinge', 'log_loss'])
+    parser.add_argument('--n-jobs', type=int, default=4, help='병렬 학습 스레드 수')
+    parser.add_argument('--shard-dir', type=str, help='학습 데이터를 샤드로 저장 후 스트리밍 학습')
+    args = parser.parse_args()
+
+    return train_and_report(losses=args.loss, n_jobs=args.n_jobs, shard_dir=args.shard_dir)
+
+
+if __name__ == "__main__":
+    results = main()
@@ -7,6 +7,7 @@ NBC 모델 학습 (Data Leakage 제거 버전)
 """
 
 import json
+import sys
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -19,6 +20,9 @@ import seaborn as sns
 
 # 프로젝트 루트 설정
 PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from modeling.sentence_nbc.ngram_vocab import NgramVocab
 
 def load_data():
     """날짜별 n-gram과 라벨 로드"""
@@ -109,18 +113,29 @@ def build_vocabulary(df_train, min_freq=5):
 
     return vocab_df, sum_0/sum_tot, sum_1/sum_tot
 
-def predict(ngrams, vocab_df, prior_0, prior_1):
+def build_scorer(vocab_df):
+    """vocabulary를 추론용 사전 + id 순서 로그확률 배열로 변환"""
+    vocab = NgramVocab.build(vocab_df.index)
+    ids = vocab.lookup(vocab_df.index)
+
+    log_prob_0 = np.empty(len(vocab))
+    log_prob_1 = np.empty(len(vocab))
+    log_prob_0[ids] = np.log(vocab_df['prob_0'].values)
+    log_prob_1[ids] = np.log(vocab_df['prob_1'].values)
+
+    return vocab, log_prob_0, log_prob_1
+
+def predict(ngrams, scorer, prior_0, prior_1):
     """Naive Bayes 예측"""
-    # Prior 확률 (log)
-    log_prob_0 = np.log(prior_0)
-    log_prob_1 = np.log(prior_1)
+    vocab, table_0, table_1 = scorer
+
+    # Train vocabulary에 있는 경우만 (Unknown n-gram은 무시, 기존 노트북과 동일)
+    ids = vocab.lookup(ngrams)
+    ids = ids[ids >= 0]
 
-    # Likelihood 계산
-    for ngram in ngrams:
-        if ngram in vocab_df.index:  # Train vocabulary에 있는 경우만
-            log_prob_0 += np.log(vocab_df.at[ngram, 'prob_0'])
-            log_prob_1 += np.log(vocab_df.at[ngram, 'prob_1'])
-        # Unknown n-gram은 무시 (기존 노트북과 동일)
+    # Prior 확률 (log) + Likelihood
+    log_prob_0 = np.log(prior_0) + table_0[ids].sum()
+    log_prob_1 = np.log(prior_1) + table_1[ids].sum()
 
     return 1 if log_prob_1 > log_prob_0 else 0
 
@@ -129,8 +144,9 @@ def evaluate_model(df_test, vocab_df, prior_0, prior_1):
     print("\nEvaluating model...")
 
     # 예측
+    scorer = build_scorer(vocab_df)
     df_test['y_pred'] = df_test['ngrams'].apply(
-        lambda x: predict(x, vocab_df, prior_0, prior_1)
+        lambda x: predict(x, scorer, prior_0, prior_1)
     )
 
     y_true = df_test['label'].values
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+compact_scorer.py
+추론용 경량 스코어러 export (배깅 앙상블 → 가지치기 + 저정밀도 테이블)
+- |mean_score| / std_score 유의도로 n-gram 가지치기 (ngram_polarity.csv)
+- 모델별 극성 테이블(log P(w|Hawkish) - log P(w|Dovish))을 float16 또는 int8(+모델별 scale)로 저장
+- 전체 정밀도 앙상블 대비 F1 변화량 보고
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import f1_score
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from modeling.sentence_nbc.ngram_vocab import NgramVocab
+from modeling.sentence_nbc.sentence_nbc_model import SentenceNBC
+
+MODEL_DIR = PROJECT_ROOT / "modeling/sentence_nbc"
+
+
+def select_ngrams(polarity_df, min_significance=2.0, min_iterations=15):
+    """배깅 점수가 안정적인 n-gram만 선택
+
+    std_score가 0이면 (모든 배깅에서 같은 점수) 유의도를 무한대로 본다.
+    등장한 배깅 횟수가 적은 n-gram은 평균/표준편차 자체를 믿기 어려우므로 제외한다.
+    """
+    mean = polarity_df['mean_score'].astype(float)
+    std = polarity_df['std_score'].astype(float)
+    significance = mean.abs() / std.where(std > 0, np.nan)
+    significance = significance.fillna(np.inf).where(mean != 0, 0.0)
+
+    keep = (significance >= min_significance) & (polarity_df['num_iterations'] >= min_iterations)
+    return polarity_df.index[keep].astype(str)
+
+
+def quantize(table, dtype):
+    """모델별(열별) 테이블 양자화 → (저장 테이블, 모델별 scale)"""
+    if dtype == 'float16':
+        return table.astype(np.float16), np.ones(table.shape[1], dtype=np.float32)
+
+    if dtype == 'int8':
+        scale = np.abs(table).max(axis=0) / 127.0
+        scale[scale == 0] = 1.0
+        quantized = np.clip(np.rint(table / scale), -127, 127).astype(np.int8)
+        return quantized, scale.astype(np.float32)
+
+    raise ValueError(f"Unsupported dtype: {dtype}")
+
+
+class CompactScorer:
+    """가지치기/양자화된 30개 모델 앙상블 스코어러"""
+
+    def __init__(self, vocab, table, scale, prior_delta):
+        self.vocab = vocab              # 가지치기된 n-gram 사전
+        self.table = table              # (V, n_models) float16 또는 int8
+        self.scale = scale              # 모델별 역양자화 scale
+        self.prior_delta = prior_delta  # 모델별 log P(Hawkish) - log P(Dovish)
+
+    @classmethod
+    def from_ensemble(cls, models, vectorizers, ngrams, dtype='int8'):
+        """학습된 배깅 앙상블에서 경량 스코어러 생성"""
+        vocab = NgramVocab.build(ngrams)
+        table = np.zeros((len(vocab), len(models)), dtype=np.float64)
+
+        for m, (model, vectorizer) in enumerate(zip(models, vectorizers)):
+            ids = vocab.lookup(vectorizer.get_feature_names_out())
+            kept = ids >= 0
+            delta = model.feature_log_prob_[1] - model.feature_log_prob_[0]
+            table[ids[kept], m] = delta[kept]
+
+        prior_delta = np.array([model.class_log_prior_[1] - model.class_log_prior_[0]
+                                for model in models], dtype=np.float32)
+        stored, scale = quantize(table, dtype)
+        return cls(vocab, stored, scale, prior_delta)
+
+    def save(self, directory):
+        """사전 + 테이블 저장"""
+        directory = Path(directory)
+        self.vocab.save(directory / "vocab")
+        np.savez(directory / "scorer.npz", table=self.table, scale=self.scale,
+                 prior_delta=self.prior_delta)
+
+    @classmethod
+    def load(cls, directory):
+        """저장된 스코어러 로드 (사전은 메모리 맵)"""
+        directory = Path(directory)
+        arrays = np.load(directory / "scorer.npz")
+        return cls(NgramVocab.load(directory / "vocab"), arrays['table'],
+                   arrays['scale'], arrays['prior_delta'])
+
+    @property
+    def nbytes(self):
+        """스코어링 테이블 크기 (bytes)"""
+        return self.table.nbytes + self.scale.nbytes + self.prior_delta.nbytes
+
+    def decision_function(self, docs):
+        """문서별 모델별 로그우도 차이 (n_docs, n_models)"""
+        X = self.vocab.transform(docs)
+        return np.asarray(X @ self.table, dtype=np.float32) * self.scale + self.prior_delta
+
+    def predict_proba(self, docs):
+        """Hawkish 확률 (모델 평균)"""
+        return (1.0 / (1.0 + np.exp(-self.decision_function(docs)))).mean(axis=1)
+
+    def predict(self, docs):
+        """다수결 투표 예측 (evaluate_ensemble과 동일한 규칙)"""
+        votes = (self.decision_function(docs) > 0).mean(axis=1)
+        return (votes >= 0.5).astype(int)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='경량 NBC 스코어러 export')
+    parser.add_argument('--min-significance', type=float, default=2.0,
+                        help='|mean_score| / std_score 최소값')
+    parser.add_argument('--min-iterations', type=int, default=15,
+                        help='n-gram이 등장해야 하는 최소 배깅 횟수')
+    parser.add_argument('--dtype', choices=['int8', 'float16'], default='int8')
+    parser.add_argument('--output-dir', type=str, default=str(MODEL_DIR / "compact_scorer"))
+    args = parser.parse_args()
+
+    print("="*60)
+    print("Compact Scorer Export")
+    print("="*60)
+
+    # 1. 학습된 앙상블 / n-gram 극성 로드
+    model_data = joblib.load(MODEL_DIR / "sentence_nbc_ensemble.pkl")
+    polarity_df = pd.read_csv(MODEL_DIR / "ngram_polarity.csv", index_col=0)
+    print(f"\nLoaded {len(model_data['models'])} models, {len(polarity_df):,} n-grams")
+
+    # 2. 가지치기
+    ngrams = select_ngrams(polarity_df, args.min_significance, args.min_iterations)
+    print(f"  Kept {len(ngrams):,} n-grams "
+          f"(|mean|/std >= {args.min_significance}, iterations >= {args.min_iterations})")
+
+    # 3. 경량 스코어러 생성 및 저장
+    scorer = CompactScorer.from_ensemble(model_data['models'], model_data['vectorizers'],
+                                         ngrams, dtype=args.dtype)
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    scorer.save(output_dir)
+    print(f"✓ Saved {output_dir} ({scorer.nbytes / 1024 / 1024:.2f} MB scoring tables)")
+
+    # 4. 전체 정밀도 앙상블과 동일한 평가 분할에서 F1 비교
+    nbc = SentenceNBC()
+    nbc.models = model_data['models']
+    nbc.vectorizers = model_data['vectorizers']
+    nbc.ngram_scores = model_data['ngram_scores']
+    nbc.build_vocab()
+
+    features, labels = nbc.prepare_features(nbc.load_data())
+    _, X_test_dict, _, y_test = nbc._split(features, labels, nbc.random_state + 100)
+
+    full_predictions, _ = nbc.predict_ensemble(nbc.vocab.transform(X_test_dict))
+    full_pred = (full_predictions.mean(axis=0) >= 0.5).astype(int)
+    compact_pred = scorer.predict(X_test_dict)
+
+    f1_full = f1_score(y_test, full_pred)
+    f1_compact = f1_score(y_test, compact_pred)
+    full_bytes = len(nbc.models) * 2 * len(nbc.vocab) * 8  # float64 feature_log_prob_
+
+    stats = {
+        'dtype': args.dtype,
+        'min_significance': args.min_significance,
+        'min_iterations': args.min_iterations,
+        'ngrams_full': len(nbc.vocab),
+        'ngrams_kept': len(scorer.vocab),
+        'table_bytes_full': full_bytes,
+        'table_bytes_compact': scorer.nbytes,
+        'f1_full': float(f1_full),
+        'f1_compact': float(f1_compact),
+        'f1_delta': float(f1_compact - f1_full),
+        'prediction_agreement': float((full_pred == compact_pred).mean())
+    }
+    with open(output_dir / "compact_scorer_stats.json", 'w') as f:
+        json.dump(stats, f, indent=2)
+
+    print(f"\n  N-grams:   {stats['ngrams_full']:,} → {stats['ngrams_kept']:,}")
+    print(f"  Tables:    {full_bytes / 1024 / 1024:.1f} MB → {scorer.nbytes / 1024 / 1024:.2f} MB")
+    print(f"  F1 (full):    {f1_full:.4f}")
+    print(f"  F1 (compact): {f1_compact:.4f} (Δ {f1_compact - f1_full:+.4f})")
+    print(f"✓ Saved compact_scorer_stats.json")
+
+    return scorer, stats
+
+
+if __name__ == "__main__":
+    scorer, stats = main()
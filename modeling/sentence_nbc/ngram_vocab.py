@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+ngram_vocab.py
+추론용 읽기 전용 n-gram 어휘 사전
+- 정렬된 64bit 해시 배열 + 이진 탐색 (np.searchsorted)
+- 문자열 테이블(offset + UTF-8 blob)로 역참조 및 충돌 검증
+- np.load(mmap_mode='r')로 적재하여 여러 워커 프로세스가 페이지 캐시를 공유
+  (Python dict와 달리 참조 카운트 갱신이 없어 copy-on-write로 메모리가 늘지 않음)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+VOCAB_FILES = ('hashes.npy', 'ids.npy', 'offsets.npy', 'strings.npy')
+
+
+def ngram_hash(ngram):
+    """n-gram 문자열의 64bit 해시 (프로세스 간 동일한 값 보장)"""
+    digest = hashlib.blake2b(ngram.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class NgramVocab:
+    """정렬 해시 테이블 기반 n-gram → id 사전"""
+
+    def __init__(self, hashes, ids, offsets, strings):
+        self.hashes = hashes    # 정렬된 uint64 해시
+        self.ids = ids          # 해시 위치별 n-gram id (int32)
+        self.offsets = offsets  # id별 문자열 시작 위치 (int64, 길이 V+1)
+        self.strings = strings  # UTF-8 문자열 blob (uint8)
+
+    @classmethod
+    def build(cls, ngrams):
+        """n-gram 목록으로 사전 생성 (id는 정렬된 문자열 순서 = DictVectorizer 순서)"""
+        ngrams = sorted(set(ngrams))
+        encoded = [ng.encode('utf-8') for ng in ngrams]
+
+        lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        strings = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+        raw_hashes = np.fromiter((ngram_hash(ng) for ng in ngrams),
+                                 dtype=np.uint64, count=len(ngrams))
+        order = np.argsort(raw_hashes, kind='stable')
+        hashes = raw_hashes[order]
+
+        # 64bit 충돌은 사실상 없지만, 있으면 조회 결과가 틀려지므로 생성 시점에 차단
+        if len(hashes) > 1 and np.any(hashes[1:] == hashes[:-1]):
+            raise ValueError("n-gram hash collision detected; vocabulary cannot be built")
+
+        return cls(hashes, order.astype(np.int32), offsets, strings)
+
+    def save(self, directory):
+        """디렉토리에 .npy 파일로 저장"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, array in zip(VOCAB_FILES, (self.hashes, self.ids, self.offsets, self.strings)):
+            np.save(directory / name, array)
+        with open(directory / 'meta.json', 'w') as f:
+            json.dump({'size': len(self), 'hash': 'blake2b-64'}, f, indent=2)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """저장된 사전 로드 (기본: 메모리 맵)"""
+        directory = Path(directory)
+        mode = 'r' if mmap else None
+        arrays = [np.load(directory / name, mmap_mode=mode) for name in VOCAB_FILES]
+        return cls(*arrays)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, ngram):
+        return self.get(ngram) >= 0
+
+    def lookup(self, ngrams):
+        """n-gram 목록 → id 배열 (사전에 없으면 -1)"""
+        ngrams = list(ngrams)
+        if not ngrams or not len(self):
+            return np.full(len(ngrams), -1, dtype=np.int32)
+
+        keys = np.fromiter((ngram_hash(ng) for ng in ngrams),
+                           dtype=np.uint64, count=len(ngrams))
+        pos = np.searchsorted(self.hashes, keys)
+        pos[pos == len(self.hashes)] = 0
+        found = self.hashes[pos] == keys
+        return np.where(found, self.ids[pos], -1).astype(np.int32)
+
+    def get(self, ngram, default=-1):
+        """단일 n-gram 조회 (문자열 테이블로 결과 검증)"""
+        key = np.uint64(ngram_hash(ngram))
+        pos = int(np.searchsorted(self.hashes, key))
+        if pos < len(self.hashes) and self.hashes[pos] == key:
+            idx = int(self.ids[pos])
+            if self.ngram(idx) == ngram:
+                return idx
+        return default
+
+    def ngram(self, idx):
+        """id → n-gram 문자열"""
+        start, end = self.offsets[idx], self.offsets[idx + 1]
+        return self.strings[start:end].tobytes().decode('utf-8')
+
+    def feature_names(self):
+        """id 순서의 n-gram 배열 (DictVectorizer.get_feature_names_out과 동일 순서)"""
+        return np.array([self.ngram(i) for i in range(len(self))], dtype=object)
+
+    def transform(self, docs):
+        """문서별 n-gram(list 또는 {ngram: count} dict) → CSR 빈도 행렬"""
+        flat = []
+        counts = []
+        indptr = [0]
+        for doc in docs:
+            if isinstance(doc, dict):
+                flat.extend(doc.keys())
+                counts.extend(doc.values())
+            else:
+                flat.extend(doc)
+                counts.extend([1] * len(doc))
+            indptr.append(len(flat))
+
+        ids = self.lookup(flat)
+        rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        known = ids >= 0
+
+        # 중복 (row, id) 쌍은 csr_matrix 생성 시 합산됨
+        matrix = csr_matrix(
+            (np.asarray(counts, dtype=np.float64)[known], (rows[known], ids[known])),
+            shape=(len(indptr) - 1, len(self))
+        )
+        matrix.sum_duplicates()
+        return matrix
+
+
+def _memory_usage_mb():
+    """현재 프로세스 메모리 (RSS, 공유분을 나눈 PSS, 전용 메모리)"""
+    usage = {}
+    smaps = Path('/proc/self/smaps_rollup')
+    if smaps.exists():
+        for line in smaps.read_text().splitlines():
+            parts = line.split()
+            if parts[0] in ('Rss:', 'Pss:', 'Private_Clean:', 'Private_Dirty:'):
+                usage[parts[0].rstrip(':').lower()] = int(parts[1]) / 1024
+        usage['private'] = usage.pop('private_clean', 0) + usage.pop('private_dirty', 0)
+    else:
+        import resource
+        usage['rss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return usage
+
+
+def _benchmark_worker(args):
+    """워커 프로세스: 메모리 맵 사전으로 조회 후 메모리/처리량 보고"""
+    vocab_dir, queries = args
+    vocab = NgramVocab.load(vocab_dir)
+    start = time.perf_counter()
+    hits = int((vocab.lookup(queries) >= 0).sum())
+    elapsed = time.perf_counter() - start
+    return {
+        'pid': os.getpid(),
+        'lookups_per_sec': len(queries) / elapsed if elapsed else 0.0,
+        'hits': hits,
+        'memory_mb': _memory_usage_mb()
+    }
+
+
+def benchmark(vocab_dir, n_queries=200000, n_workers=4, seed=33):
+    """프로세스별 메모리와 초당 조회 수 측정"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    vocab = NgramVocab.load(vocab_dir)
+    rng = np.random.default_rng(seed)
+    sample = rng.integers(0, len(vocab), size=n_queries)
+    queries = [vocab.ngram(int(i)) for i in sample]
+    # 절반은 사전에 없는 n-gram으로 구성 (미등록 조회 비용 포함)
+    queries[::2] = [q + ' __oov__' for q in queries[::2]]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        workers = list(executor.map(_benchmark_worker, [(str(vocab_dir), queries)] * n_workers))
+
+    return {
+        'vocab_size': len(vocab),
+        'vocab_bytes': sum((Path(vocab_dir) / name).stat().st_size for name in VOCAB_FILES),
+        'n_queries': n_queries,
+        'workers': workers
+    }
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='n-gram 어휘 사전 생성/벤치마크')
+    parser.add_argument('--build-from', type=str,
+                        help='n-gram 목록 CSV (첫 컬럼 또는 ngram 컬럼, 예: ngram_polarity.csv)')
+    parser.add_argument('--vocab-dir', type=str,
+                        default=str(PROJECT_ROOT / 'modeling/sentence_nbc/ngram_vocab'))
+    parser.add_argument('--benchmark', action='store_true', help='메모리/조회 속도 측정')
+    parser.add_argument('--queries', type=int, default=200000)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    if args.build_from:
+        import pandas as pd
+        df = pd.read_csv(args.build_from)
+        column = 'ngram' if 'ngram' in df.columns else df.columns[0]
+        vocab = NgramVocab.build(df[column].dropna().astype(str))
+        vocab.save(args.vocab_dir)
+        print(f"✓ Saved vocabulary ({len(vocab):,} n-grams) to {args.vocab_dir}")
+
+    if args.benchmark:
+        result = benchmark(args.vocab_dir, n_queries=args.queries, n_workers=args.workers)
+        print(f"\nVocabulary: {result['vocab_size']:,} n-grams "
+              f"({result['vocab_bytes'] / 1024 / 1024:.1f} MB on disk)")
+        for worker in result['workers']:
+            memory = worker['memory_mb']
+            print(f"  pid {worker['pid']}: {worker['lookups_per_sec']:,.0f} lookups/sec, "
+                  + ', '.join(f"{k.upper()} {v:.1f}MB" for k, v in memory.items()))
+
+
+if __name__ == "__main__":
+    main()
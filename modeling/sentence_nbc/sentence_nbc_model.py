@@ -12,7 +12,6 @@ import pandas as pd
 import pickle
 import json
 from pathlib import Path
-from sklearn.model_selection import train_test_split
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 from sklearn.metrics import classification_report, confusion_matrix
@@ -21,9 +20,15 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from tqdm import tqdm
 import joblib
+import sys
+import time
 from collections import defaultdict
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from modeling.sentence_nbc.ngram_vocab import NgramVocab
+from modeling.splits.split_index_store import SplitIndexStore, bagging_seeds
 
 class SentenceNBC:
     """문장 단위 Naive Bayes Classifier with Bagging"""
@@ -35,6 +40,8 @@ class SentenceNBC:
         self.models = []
         self.vectorizers = []
         self.ngram_scores = defaultdict(list)  # 각 n-gram의 30회 점수
+        self.vocab = None  # 30개 모델 공용 n-gram 사전 (추론용)
+        self.splits = None  # 31개 층화 분할 캐시 (배깅 30 + 최종 평가 1)
 
     def load_data(self):
         """문장 n-gram 데이터 로드"""
@@ -79,6 +86,19 @@ class SentenceNBC:
 
         return features, np.array(labels)
 
+    def split_store(self, labels):
+        """배깅/평가 분할 캐시 로드 (없는 분할만 생성 후 저장)"""
+        if self.splits is None or len(self.splits.labels) != len(labels):
+            self.splits = SplitIndexStore(labels, test_size=self.test_size)
+            self.splits.precompute(bagging_seeds(self.random_state, self.n_estimators))
+        return self.splits
+
+    def _split(self, features, labels, seed):
+        """캐시된 분할 인덱스로 (X_train, X_test, y_train, y_test) 구성"""
+        train_idx, test_idx = self.split_store(labels).split(seed)
+        return ([features[i] for i in train_idx], [features[i] for i in test_idx],
+                labels[train_idx], labels[test_idx])
+
     def train_with_bagging(self, features, labels):
         """30회 배깅으로 모델 학습"""
         print(f"\nTraining with {self.n_estimators}x bagging...")
@@ -86,12 +106,9 @@ class SentenceNBC:
         all_scores = []
 
         for i in tqdm(range(self.n_estimators), desc="Bagging iterations"):
-            # Train/Test 분할 (매번 다른 랜덤 시드)
-            X_train_dict, X_test_dict, y_train, y_test = train_test_split(
-                features, labels,
-                test_size=self.test_size,
-                random_state=self.random_state + i,
-                stratify=labels
+            # Train/Test 분할 (매번 다른 랜덤 시드, 캐시된 인덱스 사용)
+            X_train_dict, X_test_dict, y_train, y_test = self._split(
+                features, labels, self.random_state + i
             )
 
             # DictVectorizer로 변환
@@ -157,32 +174,51 @@ class SentenceNBC:
 
         return ngram_polarity, hawkish_ngrams, dovish_ngrams
 
+    def build_vocab(self):
+        """30개 vectorizer의 n-gram 합집합으로 공용 사전 생성"""
+        self.vocab = NgramVocab.build(self.ngram_scores.keys())
+        print(f"  Shared vocabulary: {len(self.vocab):,} n-grams")
+        return self.vocab
+
+    def predict_ensemble(self, X):
+        """공용 사전 CSR 행렬로 30개 모델 예측 (모델별 transform 없이)
+
+        MultinomialNB의 결합 로그우도(X @ log_prob.T + log_prior)를 공용 id 공간에서
+        계산하므로, 각 모델 vocabulary에 없는 n-gram은 기존과 동일하게 무시된다.
+        """
+        all_predictions = []
+        all_probabilities = []
+        log_prob = np.zeros((2, len(self.vocab)))
+
+        for model, vectorizer in zip(self.models, self.vectorizers):
+            columns = self.vocab.lookup(vectorizer.get_feature_names_out())
+            log_prob[:] = 0.0
+            log_prob[:, columns] = model.feature_log_prob_
+
+            jll = np.asarray(X @ log_prob.T) + model.class_log_prior_
+            all_predictions.append(jll.argmax(axis=1))
+            all_probabilities.append(1.0 / (1.0 + np.exp(jll[:, 0] - jll[:, 1])))  # Hawkish 확률
+
+        return np.array(all_predictions), np.array(all_probabilities)
+
     def evaluate_ensemble(self, features, labels):
         """앙상블 모델 평가"""
         print("\nEvaluating ensemble model...")
 
         # 전체 데이터를 한 번 더 분할 (최종 평가용)
-        X_train_dict, X_test_dict, y_train, y_test = train_test_split(
-            features, labels,
-            test_size=self.test_size,
-            random_state=self.random_state + 100,
-            stratify=labels
+        X_train_dict, X_test_dict, y_train, y_test = self._split(
+            features, labels, self.random_state + 100
         )
 
-        # 앙상블 예측 (다수결 투표)
-        all_predictions = []
-        all_probabilities = []  # 확률 저장 추가
-
-        for model, vectorizer in zip(self.models, self.vectorizers):
-            X_test = vectorizer.transform(X_test_dict)
-            y_pred = model.predict(X_test)
-            y_proba = model.predict_proba(X_test)  # 확률 예측
-            all_predictions.append(y_pred)
-            all_probabilities.append(y_proba[:, 1])  # Hawkish 확률
+        # 앙상블 예측 (다수결 투표) - 공용 사전으로 테스트 세트를 한 번만 변환
+        if self.vocab is None:
+            self.build_vocab()
+        X_test = self.vocab.transform(X_test_dict)
+        all_predictions, all_probabilities = self.predict_ensemble(X_test)
 
         # 다수결 투표
-        ensemble_pred = np.array(all_predictions).mean(axis=0)
-        ensemble_proba = np.array(all_probabilities).mean(axis=0)  # 평균 확률
+        ensemble_pred = all_predictions.mean(axis=0)
+        ensemble_proba = all_probabilities.mean(axis=0)  # 평균 확률
         ensemble_pred = (ensemble_pred >= 0.5).astype(int)
 
         # 확률 저장 (PR 곡선용)
@@ -272,10 +308,13 @@ def main():
     features, labels = nbc.prepare_features(sentence_ngrams)
 
     # 3. 30회 배깅으로 학습
+    train_start = time.perf_counter()
     f1_scores = nbc.train_with_bagging(features, labels)
+    train_seconds = time.perf_counter() - train_start
 
     # 4. n-gram 극성 계산
     ngram_polarity, hawkish_ngrams, dovish_ngrams = nbc.calculate_ngram_polarity()
+    nbc.build_vocab()
 
     # 5. 앙상블 평가
     accuracy, precision, recall, f1, cm = nbc.evaluate_ensemble(features, labels)
@@ -293,6 +332,10 @@ def main():
     joblib.dump(model_data, output_dir / "sentence_nbc_ensemble.pkl")
     print(f"✓ Saved sentence_nbc_ensemble.pkl")
 
+    # 추론용 공용 n-gram 사전 저장 (메모리 맵 로드용)
+    nbc.vocab.save(output_dir / "ngram_vocab")
+    print(f"✓ Saved ngram_vocab/")
+
     # n-gram 극성 저장
     polarity_df = pd.DataFrame(ngram_polarity).T
     polarity_df.to_csv(output_dir / "ngram_polarity.csv")
@@ -314,6 +357,7 @@ def main():
         'total_sentences': len(sentence_ngrams),
         'n_estimators': nbc.n_estimators,
         'test_size': nbc.test_size,
+        'train_seconds': train_seconds,
         'mean_f1': float(np.mean(f1_scores)),
         'std_f1': float(np.std(f1_scores)),
         'ensemble_accuracy': float(accuracy),
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+split_index_store.py
+층화 분할 인덱스 캐시 (배깅 30회 + 최종 평가 1회)
+- train_test_split(stratify=labels, random_state=seed)과 동일한 test 집합을 생성
+- 분할은 packbits 비트마스크로 저장 (문장 280만 개 × 31회 ≈ 11MB)
+- 라벨 배열 + test_size 지문으로 캐시 파일을 구분하여 실행 간 / 모델 간 재사용
+"""
+
+import argparse
+import hashlib
+import pickle
+from pathlib import Path
+
+import numpy as np
+from sklearn.model_selection import StratifiedShuffleSplit
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "modeling/splits/cache"
+
+
+def dataset_fingerprint(labels, test_size):
+    """라벨 배열과 test_size로 데이터셋 지문 생성"""
+    labels = np.ascontiguousarray(labels, dtype=np.int64)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(len(labels)).encode())
+    h.update(repr(float(test_size)).encode())
+    h.update(labels.tobytes())
+    return h.hexdigest()
+
+
+class SplitIndexStore:
+    """seed별 층화 분할 인덱스 저장소"""
+
+    def __init__(self, labels, test_size=0.1, cache_dir=DEFAULT_CACHE_DIR):
+        self.labels = np.asarray(labels)
+        self.test_size = test_size
+        self.fingerprint = dataset_fingerprint(self.labels, test_size)
+        self.path = Path(cache_dir) / f"splits_{self.fingerprint}.npz"
+        self._masks = {}  # seed -> packbits test 마스크
+
+        if self.path.exists():
+            with np.load(self.path) as cached:
+                self._masks = {int(key[len('seed_'):]): cached[key]
+                               for key in cached.files if key.startswith('seed_')}
+
+    def __contains__(self, seed):
+        return seed in self._masks
+
+    def _generate(self, seed):
+        """train_test_split과 동일한 층화 분할로 test 마스크 생성"""
+        splitter = StratifiedShuffleSplit(n_splits=1, test_size=self.test_size,
+                                          random_state=seed)
+        _, test_idx = next(splitter.split(np.zeros(len(self.labels)), self.labels))
+        mask = np.zeros(len(self.labels), dtype=bool)
+        mask[test_idx] = True
+        return np.packbits(mask)
+
+    def precompute(self, seeds):
+        """없는 seed의 분할을 생성하고 캐시 파일 갱신"""
+        missing = [seed for seed in seeds if seed not in self._masks]
+        for seed in missing:
+            self._masks[seed] = self._generate(seed)
+        if missing:
+            self.save()
+        return self
+
+    def save(self):
+        """캐시 파일 저장"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(self.path, n=np.int64(len(self.labels)),
+                 **{f"seed_{seed}": mask for seed, mask in self._masks.items()})
+
+    def test_mask(self, seed):
+        """seed 분할의 test 여부 bool 배열"""
+        if seed not in self._masks:
+            self.precompute([seed])
+        return np.unpackbits(self._masks[seed], count=len(self.labels)).astype(bool)
+
+    def split(self, seed):
+        """seed 분할의 (train_idx, test_idx) int32 배열 (오름차순)"""
+        mask = self.test_mask(seed)
+        return (np.flatnonzero(~mask).astype(np.int32),
+                np.flatnonzero(mask).astype(np.int32))
+
+
+def bagging_seeds(random_state, n_estimators):
+    """배깅(random_state + i) + 최종 평가(random_state + 100) seed 목록"""
+    return [random_state + i for i in range(n_estimators)] + [random_state + 100]
+
+
+def main():
+    """메인 실행 함수: 문장 데이터셋의 31개 분할 미리 생성"""
+    parser = argparse.ArgumentParser(description='층화 분할 인덱스 캐시 생성')
+    parser.add_argument('--n-estimators', type=int, default=30)
+    parser.add_argument('--test-size', type=float, default=0.1)
+    parser.add_argument('--random-state', type=int, default=33)
+    args = parser.parse_args()
+
+    with open(PROJECT_ROOT / "preprocess/sentence_ngram/sentence_ngrams.pkl", 'rb') as f:
+        labels = np.array([item['label'] for item in pickle.load(f)])
+
+    store = SplitIndexStore(labels, test_size=args.test_size)
+    store.precompute(bagging_seeds(args.random_state, args.n_estimators))
+    print(f"✓ {len(store._masks)} splits for {len(labels):,} sentences → {store.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,73 +2,89 @@
 # -*- coding: utf-8 -*-
 """
 bond_consolidator.py
-6,515개의 채권 보고서 CSV 파일을 하나의 JSON으로 통합
+6,515개의 채권 보고서 CSV 파일을 하나의 JSON Lines 파일로 통합
+- CSV 읽기는 ProcessPool로 병렬 처리 (파일 단위 작업)
+- 날짜 정규화 / 빈 본문 필터는 iterrows 대신 컬럼 연산으로 처리
+- 결과는 한 줄에 보고서 하나씩 JSON Lines로 저장, 실패 파일은 별도 리포트로 저장
 """
 
-import pandas as pd
-import json
-import os
+import argparse
 import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
+
+import pandas as pd
 from tqdm import tqdm
 
 # 프로젝트 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 BOND_CSV_DIR = PROJECT_ROOT / "crawler/archive/bond_csvs"
-OUTPUT_FILE = PROJECT_ROOT / "data/auxiliary/bond_reports_consolidated.json"
+OUTPUT_FILE = PROJECT_ROOT / "data/auxiliary/bond_reports_consolidated.jsonl"
+ERROR_REPORT = PROJECT_ROOT / "data/auxiliary/bond_consolidation_errors.csv"
+
+REQUIRED_COLUMNS = ['Date', 'Title', 'Content']
+
+
+def read_bond_csv(csv_file):
+    """CSV 하나 → (정규화된 DataFrame, None) 또는 (None, 에러 메시지)"""
+    try:
+        df = pd.read_csv(csv_file)
+    except Exception as e:
+        return None, str(e)
+
+    if not all(col in df.columns for col in REQUIRED_COLUMNS):
+        return None, "Missing required columns"
+
+    # 기존 str(row[...]) 변환과 동일하게 문자열화 (NaN → 'nan')
+    def as_text(column):
+        return df[column].astype(str).fillna('nan')
+
+    bonds = pd.DataFrame({
+        # YYYY.MM.DD 형식을 YYYY-MM-DD로 변경
+        'date': as_text('Date').str.replace('.', '-', regex=False),
+        'title': as_text('Title'),
+        'content': as_text('Content'),
+        'link': as_text('Link') if 'Link' in df.columns else '',
+    })
 
-def consolidate_bond_csvs():
+    # Content가 비어있지 않은 경우만 추가
+    bonds = bonds[(bonds['content'] != '') & (bonds['content'] != 'nan')]
+    return bonds, None
+
+
+def consolidate_bond_csvs(workers=None, csv_dir=BOND_CSV_DIR, output_file=OUTPUT_FILE,
+                          error_report=ERROR_REPORT):
     """모든 채권 CSV 파일을 통합"""
     print("="*60)
     print("Bond Report CSV Consolidation")
     print("="*60)
 
+    start = time.perf_counter()
+
     # CSV 파일 목록 가져오기
-    csv_files = glob.glob(str(BOND_CSV_DIR / "*.csv"))
-    print(f"Found {len(csv_files)} CSV files")
+    csv_files = sorted(glob.glob(str(Path(csv_dir) / "*.csv")))
+    workers = workers or os.cpu_count() or 1
+    print(f"Found {len(csv_files)} CSV files ({workers} workers)")
 
-    all_bonds = []
+    frames = []
     error_files = []
 
-    # 프로그레스 바와 함께 처리
-    for csv_file in tqdm(csv_files, desc="Processing CSV files"):
-        try:
-            # CSV 읽기
-            df = pd.read_csv(csv_file)
-
-            # 필수 컬럼 확인
-            required_cols = ['Date', 'Title', 'Content']
-            if all(col in df.columns for col in required_cols):
-                # 각 행을 딕셔너리로 변환
-                for _, row in df.iterrows():
-                    # 날짜 형식 표준화
-                    try:
-                        date_str = str(row['Date'])
-                        # YYYY.MM.DD 형식을 YYYY-MM-DD로 변경
-                        if '.' in date_str:
-                            date_str = date_str.replace('.', '-')
-
-                        bond_data = {
-                            'date': date_str,
-                            'title': str(row['Title']),
-                            'content': str(row['Content']),
-                            'link': str(row.get('Link', ''))
-                        }
-
-                        # Content가 비어있지 않은 경우만 추가
-                        if bond_data['content'] and bond_data['content'] != 'nan':
-                            all_bonds.append(bond_data)
-                    except Exception as e:
-                        continue
-            else:
-                error_files.append((csv_file, "Missing required columns"))
-
-        except Exception as e:
-            error_files.append((csv_file, str(e)))
-
-    # 날짜순 정렬
-    all_bonds.sort(key=lambda x: x['date'])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(read_bond_csv, csv_files, chunksize=64)
+        for csv_file, (bonds, error) in tqdm(zip(csv_files, results), total=len(csv_files),
+                                             desc="Processing CSV files"):
+            if error is not None:
+                error_files.append((csv_file, error))
+            elif len(bonds):
+                frames.append(bonds)
+
+    all_bonds = (pd.concat(frames, ignore_index=True) if frames
+                 else pd.DataFrame(columns=['date', 'title', 'content', 'link']))
+
+    # 날짜순 정렬 (같은 날짜는 파일 순서 유지)
+    all_bonds = all_bonds.sort_values('date', kind='stable').reset_index(drop=True)
 
     # 결과 출력
     print(f"\nProcessing complete:")
@@ -76,37 +92,41 @@ def consolidate_bond_csvs():
     print(f"  ✓ Total bond reports: {len(all_bonds)}")
     print(f"  ✗ Failed files: {len(error_files)}")
 
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
     if error_files:
         print("\nFirst 10 error files:")
         for file, error in error_files[:10]:
             print(f"  - {Path(file).name}: {error}")
+        pd.DataFrame(error_files, columns=['file', 'error']).to_csv(error_report, index=False,
+                                                                   encoding='utf-8')
+        print(f"  Error report: {error_report}")
 
-    # JSON으로 저장
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(all_bonds, f, ensure_ascii=False, indent=2)
-
-    print(f"\n✓ Saved consolidated data to: {OUTPUT_FILE}")
+    # JSON Lines로 저장 (한 줄 = 보고서 하나)
+    all_bonds.to_json(output_file, orient='records', lines=True, force_ascii=False)
+    print(f"\n✓ Saved consolidated data to: {output_file}")
 
     # 통계 정보
-    if all_bonds:
-        dates = [bond['date'] for bond in all_bonds]
-        print(f"\nDate range: {min(dates)} to {max(dates)}")
+    if len(all_bonds):
+        print(f"\nDate range: {all_bonds['date'].min()} to {all_bonds['date'].max()}")
 
         # 연도별 분포
-        years = {}
-        for date in dates:
-            year = date.split('-')[0]
-            years[year] = years.get(year, 0) + 1
-
+        years = all_bonds['date'].str.split('-').str[0].value_counts().sort_index()
         print("\nDistribution by year:")
-        for year in sorted(years.keys()):
-            print(f"  {year}: {years[year]} reports")
+        for year, count in years.items():
+            print(f"  {year}: {count} reports")
 
+    print(f"\nElapsed: {time.perf_counter() - start:.1f}s")
     return len(all_bonds)
 
+
 if __name__ == "__main__":
-    consolidate_bond_csvs()
+    parser = argparse.ArgumentParser(description='채권 보고서 CSV 통합')
+    parser.add_argument('--workers', type=int, help='CSV 읽기 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+
+    consolidate_bond_csvs(workers=args.workers)
     print("\n" + "="*60)
     print("✅ Bond consolidation completed!")
-    print("="*60)
\ No newline at end of file
+    print("="*60)
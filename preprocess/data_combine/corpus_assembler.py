@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+corpus_assembler.py
+월별 정제 파일 병렬 로드 → 컬럼 단위 코퍼스 조립
+- 월별 *_cleaned.json을 ProcessPool로 동시에 파싱하고, 워커는 기사별 dict 대신 컬럼 리스트를 반환
+- 뉴스/채권/MPB를 하나의 컬럼 집합으로 이어 붙인 뒤 DataFrame을 한 번만 생성
+- source는 category, pk는 int64 (기존 문자열 pk와 같은 자릿수: 출처 1자리 + YYYYMMDD + 순번 3자리)
+- 정제 파일은 JSON과 JSON Lines(.jsonl / .jsonl.gz / .jsonl.zst) 모두 읽음
+- corpus_data.parquet (pyarrow) 저장
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from crawler.common.jsonl_sink import JSONL_SUFFIXES, read_grouped, read_records
+
+CLEANED_DIR = PROJECT_ROOT / "cleansing/cleaned_data"
+CORPUS_PARQUET = PROJECT_ROOT / "preprocess/data_combine/corpus_data.parquet"
+
+COLUMNS = ('Date', 'Title', 'Content', 'Link', 'source')
+NEWS_SOURCES = ('yonhap', 'edaily', 'infomax')
+PK_SOURCE = {'yonhap': 1, 'edaily': 2, 'infomax': 3, 'bond': 4, 'mpb': 5}
+FIELD_SEP = '\x1f'
+
+
+def content_key(source, date, title, content):
+    """문서 내용 기반 63bit 양의 정수 키 (int64에 저장 가능)"""
+    text = FIELD_SEP.join((source, date, title or '', content or ''))
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') >> 1
+
+
+def _empty_columns():
+    return {name: [] for name in COLUMNS}
+
+
+def _news_source(source_name, url):
+    """기사 출처 판별 (소스 키가 비표준이면 URL로 추정)"""
+    if source_name in NEWS_SOURCES:
+        return source_name
+    if 'infomax' in url:
+        return 'infomax'
+    if 'edaily' in url:
+        return 'edaily'
+    return 'yh'
+
+
+def load_news_file(path):
+    """월별 뉴스 파일 하나 → 컬럼 리스트 (워커 프로세스)"""
+    data = read_grouped(path)
+
+    columns = _empty_columns()
+    for source_name, articles in data.items():
+        if not isinstance(articles, list):
+            continue
+        for item in articles:
+            content = item.get('content')
+            if not content:
+                continue
+            url = item.get('url', '')
+            columns['Date'].append(item.get('date'))
+            columns['Title'].append(item.get('title'))
+            columns['Content'].append(content)
+            columns['Link'].append(url)
+            columns['source'].append(_news_source(source_name, url))
+    return columns
+
+
+def load_bond_file(path):
+    """정제된 채권 리포트 파일 → 컬럼 리스트"""
+    bond_data = read_records(path)
+
+    columns = _empty_columns()
+    for item in bond_data:
+        content = item.get('content', '')
+        if not content:
+            continue
+        columns['Date'].append(item.get('date', ''))
+        columns['Title'].append(item.get('title', ''))
+        columns['Content'].append(content)
+        columns['Link'].append(item.get('link', ''))
+        columns['source'].append('bond')
+    return columns
+
+
+def load_mpb_file(path):
+    """정제된 MPB 의사록 파일 → 컬럼 리스트 (content 없으면 discussion + decision)"""
+    mpb_data = read_records(path)
+
+    columns = _empty_columns()
+    for item in mpb_data:
+        content = item.get('content', '')
+        if not content:
+            discussion = item.get('discussion', '')
+            decision = item.get('decision', '')
+            content = f"{discussion}\n{decision}" if discussion or decision else ''
+        if not content:
+            continue
+        columns['Date'].append(item.get('date', ''))
+        columns['Title'].append(item.get('title', ''))
+        columns['Content'].append(content)
+        columns['Link'].append(item.get('pdf_url', ''))
+        columns['source'].append('mpb')
+    return columns
+
+
+def _safe_load(loader, path):
+    """손상된 파일은 건너뛰고 경고만 출력"""
+    try:
+        return loader(path)
+    except (OSError, EOFError, json.JSONDecodeError) as e:
+        print(f"  Error loading {path}: {e}")
+        return _empty_columns()
+
+
+def _load_task(args):
+    loader, path = args
+    return _safe_load(loader, path)
+
+
+def source_files(cleaned_dir=CLEANED_DIR):
+    """(loader, 경로) 작업 목록 (뉴스는 월 순서)"""
+    cleaned_dir = Path(cleaned_dir)
+    tasks = [(load_news_file, path)
+             for path in sorted(glob.glob(str(cleaned_dir / "news_cleaned/*_cleaned.json*")))
+             if path.endswith(('.json',) + JSONL_SUFFIXES)]
+    for loader, name in ((load_bond_file, "bond_cleaned"), (load_mpb_file, "mpb_cleaned")):
+        for suffix in ('.json',) + JSONL_SUFFIXES:
+            if (cleaned_dir / f"{name}{suffix}").exists():
+                tasks.append((loader, str(cleaned_dir / f"{name}{suffix}")))
+                break
+    return tasks
+
+
+def build_frame(parts):
+    """컬럼 리스트 묶음 → 타입이 지정된 DataFrame"""
+    merged = _empty_columns()
+    for part in parts:
+        for name in COLUMNS:
+            merged[name].extend(part[name])
+
+    sources = list(PK_SOURCE) + sorted(set(merged['source']) - set(PK_SOURCE))
+    return pd.DataFrame({
+        'Date': pd.to_datetime(pd.Series(merged['Date'], dtype=object), errors='coerce'),
+        'Title': pd.Series(merged['Title'], dtype=object),
+        'Content': pd.Series(merged['Content'], dtype=object),
+        'Link': pd.Series(merged['Link'], dtype=object),
+        'source': pd.Categorical(merged['source'], categories=sources),
+    })
+
+
+def assign_pk(df):
+    """int64 pk = 출처번호 × 10^11 + YYYYMMDD × 10^3 + (출처, 날짜) 내 순번
+
+    출처를 알 수 없거나 날짜가 없는 문서는 pk를 만들 수 없으므로 제외한다.
+    """
+    source_num = df['source'].map(PK_SOURCE).astype('float64')
+    unknown = source_num.isna()
+    if unknown.any():
+        print(f"  WARNING: {unknown.sum()} rows with unmapped source detected")
+        print(f"  Unknown sources: {df.loc[unknown, 'source'].unique().tolist()}")
+    undated = df['Date'].isna() & ~unknown
+    if undated.any():
+        print(f"  WARNING: {undated.sum()} rows without a valid date dropped")
+
+    df = df[~unknown & ~undated].copy()
+    df['source'] = df['source'].cat.remove_unused_categories()
+
+    counter = df.groupby(['source', 'Date'], observed=True).cumcount().to_numpy(np.int64) + 1
+    ymd = (df['Date'].dt.year.to_numpy(np.int64) * 10000
+           + df['Date'].dt.month.to_numpy(np.int64) * 100
+           + df['Date'].dt.day.to_numpy(np.int64))
+    df['pk'] = (df['source'].map(PK_SOURCE).to_numpy(np.int64) * 10**11
+                + ymd * 1000 + counter)
+    return df
+
+
+def drop_near_duplicates(df, duplicate_ids):
+    """유사 중복 인덱스(cleansing/near_duplicates.py)에서 중복으로 판정된 뉴스 기사 제외"""
+    if not duplicate_ids:
+        return df
+    dates = df['Date'].dt.strftime('%Y-%m-%d').fillna('')
+    keys = np.fromiter(
+        (content_key(s, d, t, c) for s, d, t, c in
+         zip(df['source'].astype(str), dates, df['Title'], df['Content'])),
+        dtype=np.int64, count=len(df)
+    )
+    is_duplicate = np.isin(keys, np.fromiter(duplicate_ids, dtype=np.int64))
+    print(f"  Removed {is_duplicate.sum():,} near-duplicate documents")
+    return df[~is_duplicate].reset_index(drop=True)
+
+
+def assemble_corpus(cleaned_dir=CLEANED_DIR, workers=None, duplicate_ids=None):
+    """모든 정제 파일을 병렬로 읽어 pk가 부여된 코퍼스 DataFrame 반환
+
+    duplicate_ids가 주어지면 pk 부여 전에 유사 중복 기사를 제외한다.
+    """
+    tasks = source_files(cleaned_dir)
+    workers = workers or min(len(tasks), os.cpu_count() or 1) or 1
+    print(f"Loading {len(tasks)} cleaned files with {workers} workers...")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map은 입력 순서를 유지하므로 월 순서(= 기존 pk 순번)가 보존됨
+        parts = list(executor.map(_load_task, tasks, chunksize=4))
+
+    df = build_frame(parts)
+    print(f"Loaded {len(df):,} documents "
+          + ', '.join(f"{s}={n:,}" for s, n in df['source'].value_counts(sort=False).items() if n))
+    if duplicate_ids:
+        df = drop_near_duplicates(df, duplicate_ids)
+    return assign_pk(df)
+
+
+def save_corpus(df, path=CORPUS_PARQUET):
+    """컬럼 형식(parquet)으로 저장"""
+    df.to_parquet(path, index=False, engine='pyarrow')
+
+
+def load_corpus(path=CORPUS_PARQUET, columns=None):
+    """parquet 코퍼스 로드"""
+    return pd.read_parquet(path, columns=columns, engine='pyarrow')
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+incremental_corpus.py
+증분 코퍼스 빌드 (내용 기반 고정 pk)
+- 정제 파일별 sha256을 manifest에 기록하고, 새로 생기거나 바뀐 파일만 다시 읽음
+- pk = blake2b(출처, 날짜, 제목, 본문) 63bit 정수 → 다른 문서가 추가/삭제되어도 번호가 바뀌지 않음
+- 변경된 파일에서 온 문서만 교체하고, 이전 코퍼스에 없던 pk는 delta로 따로 저장
+  (후속 단계는 delta.parquet / removed_pks.csv만 처리하면 됨)
+- 라벨은 날짜와 금리로만 결정되므로 저장 시점에 RateCalendar로 전체 재계산 (미라벨 문서도 유지)
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from preprocess.data_combine.corpus_assembler import (
+    CLEANED_DIR, PK_SOURCE, _load_task, build_frame, content_key, source_files
+)
+from preprocess.labeling.rate_calendar import CALL_RATE_FILE, RateCalendar
+
+OUTPUT_DIR = PROJECT_ROOT / "preprocess/data_combine/incremental"
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """파일 내용 sha256"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def assign_content_pk(df):
+    """출처/날짜가 유효한 문서에 내용 기반 pk 부여"""
+    df = df[df['source'].isin(list(PK_SOURCE)) & df['Date'].notna()].copy()
+    dates = df['Date'].dt.strftime('%Y-%m-%d')
+    df['pk'] = np.fromiter(
+        (content_key(s, d, t, c) for s, d, t, c in
+         zip(df['source'].astype(str), dates, df['Title'], df['Content'])),
+        dtype=np.int64, count=len(df)
+    )
+    return df
+
+
+def empty_corpus():
+    """정제 파일이 없을 때 쓰는 빈 코퍼스 (컬럼/타입은 동일)"""
+    frame = assign_content_pk(build_frame([]))
+    frame['source_file'] = pd.Series(dtype=object)
+    return frame
+
+
+class IncrementalCorpus:
+    """manifest 기반 증분 코퍼스"""
+
+    def __init__(self, output_dir=OUTPUT_DIR, cleaned_dir=CLEANED_DIR):
+        self.output_dir = Path(output_dir)
+        self.cleaned_dir = Path(cleaned_dir)
+        self.manifest_path = self.output_dir / "manifest.json"
+        self.corpus_path = self.output_dir / "corpus.parquet"
+        self.delta_path = self.output_dir / "delta.parquet"
+        self.removed_path = self.output_dir / "removed_pks.csv"
+
+        self.manifest = {}
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+
+    def _relative(self, path):
+        return str(Path(path).relative_to(self.cleaned_dir))
+
+    def plan(self):
+        """(변경/신규 작업 목록, 삭제된 파일 목록, 현재 파일 해시)"""
+        tasks = source_files(self.cleaned_dir)
+        hashes = {self._relative(path): file_sha256(path) for _, path in tasks}
+
+        changed = [(loader, path) for loader, path in tasks
+                   if self.manifest.get(self._relative(path), {}).get('sha256') != hashes[self._relative(path)]]
+        removed = sorted(set(self.manifest) - set(hashes))
+        return changed, removed, hashes
+
+    def _load_changed(self, changed, workers):
+        """변경된 파일만 병렬 로드 → source_file 컬럼이 붙은 문서 DataFrame"""
+        if not changed:
+            return None
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_load_task, changed))
+
+        frames = []
+        for (_, path), part in zip(changed, parts):
+            frame = assign_content_pk(build_frame([part]))
+            frame['source_file'] = self._relative(path)
+            frames.append(frame)
+        return pd.concat(frames, ignore_index=True)
+
+    def build(self, workers=4, calendar=None):
+        """증분 빌드 실행 → 통계 dict"""
+        start = time.perf_counter()
+        changed, removed, hashes = self.plan()
+        print(f"Files: {len(hashes)} total, {len(changed)} new/changed, {len(removed)} removed")
+
+        previous = None
+        if self.corpus_path.exists():
+            previous = pd.read_parquet(self.corpus_path)
+
+        if not changed and not removed and previous is not None:
+            print("Corpus is up to date")
+            return {'added': 0, 'removed': 0, 'documents': len(previous)}
+
+        # 변경/삭제된 파일에서 온 기존 문서를 제외하고 새로 읽은 문서로 교체
+        stale_files = {self._relative(path) for _, path in changed} | set(removed)
+        kept = previous[~previous['source_file'].isin(stale_files)] if previous is not None else None
+        fresh = self._load_changed(changed, workers)
+
+        frames = [frame for frame in (kept, fresh) if frame is not None]
+        corpus = pd.concat(frames, ignore_index=True) if frames else empty_corpus()
+        corpus = corpus.drop(columns=['Label'], errors='ignore')
+        # 같은 문서가 여러 파일에 있으면 먼저 들어온 것만 유지
+        corpus = corpus.drop_duplicates(subset=['pk'], keep='first').reset_index(drop=True)
+        corpus['source'] = pd.Categorical(corpus['source'].astype(str), categories=list(PK_SOURCE))
+
+        if calendar is None and CALL_RATE_FILE.exists():
+            calendar = RateCalendar.from_csv(CALL_RATE_FILE)
+        corpus['Label'] = calendar.label(corpus['Date']) if calendar is not None else np.nan
+
+        previous_pks = previous['pk'].to_numpy() if previous is not None else np.array([], dtype=np.int64)
+        delta = corpus[~np.isin(corpus['pk'].to_numpy(), previous_pks)]
+        removed_pks = np.setdiff1d(previous_pks, corpus['pk'].to_numpy())
+
+        self.save(corpus, delta, removed_pks, hashes)
+        stats = {
+            'documents': len(corpus),
+            'added': len(delta),
+            'removed': len(removed_pks),
+            'files_reloaded': len(changed),
+            'seconds': time.perf_counter() - start
+        }
+        print(f"✓ Corpus: {stats['documents']:,} documents "
+              f"(+{stats['added']:,} / -{stats['removed']:,}) in {stats['seconds']:.1f}s")
+        return stats
+
+    def save(self, corpus, delta, removed_pks, hashes):
+        """코퍼스, delta, manifest 저장 (manifest는 마지막에 기록)"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        corpus.to_parquet(self.corpus_path, index=False, engine='pyarrow')
+        delta.to_parquet(self.delta_path, index=False, engine='pyarrow')
+        pd.DataFrame({'pk': removed_pks}).to_csv(self.removed_path, index=False)
+
+        counts = corpus['source_file'].value_counts()
+        self.manifest = {name: {'sha256': digest, 'documents': int(counts.get(name, 0))}
+                         for name, digest in sorted(hashes.items())}
+        tmp_path = self.manifest_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+        tmp_path.replace(self.manifest_path)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='증분 코퍼스 빌드')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--output-dir', type=str, default=str(OUTPUT_DIR))
+    parser.add_argument('--rebuild', action='store_true', help='manifest를 무시하고 전체 재빌드')
+    args = parser.parse_args()
+
+    corpus = IncrementalCorpus(args.output_dir)
+    if args.rebuild:
+        corpus.manifest = {}
+    return corpus.build(workers=args.workers)
+
+
+if __name__ == "__main__":
+    stats = main()
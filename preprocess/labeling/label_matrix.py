@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+label_matrix.py
+다중 horizon × 임계값 라벨 행렬 (날짜 × 라벨 설정)
+- 모든 날짜의 현재 금리 1회 + horizon별 미래 금리 1회 조회 후 임계값은 브로드캐스트로 처리
+- 컬럼명: {horizon}_{threshold}bp (예: 1m_3bp = 논문 기본 설정)
+- 값: Hawkish(1) / Dovish(0) / 변동 없음·조회 불가(<NA>), nullable Int8
+- 라벨링 방식 변경 시 코퍼스 재생성 없이 join_labels로 날짜 조인만 수행
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from preprocess.labeling.rate_calendar import CALL_RATE_FILE, RateCalendar
+
+LABEL_MATRIX_FILE = PROJECT_ROOT / "preprocess/labeling/label_matrix.csv"
+
+HORIZONS = {
+    '1w': pd.DateOffset(weeks=1),
+    '1m': pd.DateOffset(months=1),
+    '2m': pd.DateOffset(months=2),
+    '3m': pd.DateOffset(months=3),
+}
+THRESHOLDS = (0.03, 0.05, 0.10)
+DEFAULT_CONFIG = '1m_3bp'
+
+
+def config_name(horizon, threshold):
+    """라벨 설정 컬럼명 (예: '1m', 0.03 → '1m_3bp')"""
+    return f"{horizon}_{round(threshold * 100)}bp"
+
+
+def build_label_matrix(calendar, dates=None, horizons=tuple(HORIZONS), thresholds=THRESHOLDS):
+    """날짜 × 라벨 설정 행렬 생성
+
+    dates가 없으면 금리 데이터 기간의 모든 일자를 대상으로 하여
+    어떤 문서 날짜든 조인할 수 있게 한다.
+    """
+    if dates is None:
+        dates = pd.date_range(calendar.dates[0], calendar.dates[-1], freq='D')
+    dates = pd.DatetimeIndex(pd.to_datetime(dates)).dropna().unique().sort_values()
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+
+    current = calendar.rate_at(dates)
+    columns = {}
+    for horizon in horizons:
+        change = calendar.rate_at(dates + HORIZONS[horizon]) - current
+
+        # (날짜, 임계값) 브로드캐스트: NaN 변동은 어느 쪽에도 해당하지 않음
+        labels = np.full((len(dates), len(thresholds)), -1, dtype=np.int8)
+        labels[change[:, None] > thresholds] = 1
+        labels[change[:, None] < -thresholds] = 0
+
+        for j, threshold in enumerate(thresholds):
+            column = pd.array(labels[:, j], dtype='Int8')
+            column[labels[:, j] < 0] = pd.NA
+            columns[config_name(horizon, threshold)] = column
+
+    return pd.DataFrame(columns, index=pd.Index(dates, name='Date'))
+
+
+def save_label_matrix(matrix, path=LABEL_MATRIX_FILE):
+    """라벨 행렬 CSV 저장"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    matrix.to_csv(path, date_format='%Y-%m-%d')
+
+
+def load_label_matrix(path=LABEL_MATRIX_FILE):
+    """저장된 라벨 행렬 로드 (Int8 컬럼)"""
+    matrix = pd.read_csv(path, index_col='Date', parse_dates=['Date'])
+    return matrix.astype('Int8')
+
+
+def join_labels(df, matrix, config=DEFAULT_CONFIG, date_col='Date', label_col='Label'):
+    """문서 DataFrame에 라벨 설정 컬럼을 날짜 기준으로 조인"""
+    if config not in matrix.columns:
+        raise KeyError(f"Unknown label config: {config} (available: {list(matrix.columns)})")
+
+    dates = pd.to_datetime(df[date_col], errors='coerce').dt.normalize()
+    df = df.copy()
+    df[label_col] = matrix[config].reindex(dates).to_numpy()
+    return df
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='다중 horizon 라벨 행렬 생성')
+    parser.add_argument('--horizons', nargs='+', choices=list(HORIZONS), default=list(HORIZONS))
+    parser.add_argument('--thresholds', nargs='+', type=float, default=list(THRESHOLDS),
+                        help='금리 변동 임계값 (%%p, 예: 0.03 = 3bp)')
+    parser.add_argument('--output', type=str, default=str(LABEL_MATRIX_FILE))
+    args = parser.parse_args()
+
+    calendar = RateCalendar.from_csv(CALL_RATE_FILE)
+    matrix = build_label_matrix(calendar, horizons=args.horizons, thresholds=args.thresholds)
+    save_label_matrix(matrix, args.output)
+
+    print(f"✓ Saved label matrix: {len(matrix):,} dates × {len(matrix.columns)} configs → {args.output}")
+    for config in matrix.columns:
+        counts = matrix[config].value_counts()
+        print(f"  {config:<8} Hawkish={counts.get(1, 0):,}  Dovish={counts.get(0, 0):,}  "
+              f"None={matrix[config].isna().sum():,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+rate_calendar.py
+콜금리 as-of 조회 인덱스 (코퍼스 라벨링 공용 API)
+- 금리 데이터를 한 번만 정렬하고 np.searchsorted로 "해당 날짜 이전 가장 최근 금리" 조회
+- 문서 날짜 / 날짜 + horizon 두 번의 as-of 조회와 ±3bp 임계값을 배열 연산으로 처리
+- corpus_data_fixed.py, MPBPipeline._label_data, 시각화에서 공통 사용
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CALL_RATE_FILE = PROJECT_ROOT / "crawler/data/auxiliary/market_call_rates_daily_2014_2025.csv"
+
+DEFAULT_HORIZON = pd.DateOffset(months=1)  # 논문: 1개월 후 콜금리
+DEFAULT_THRESHOLD = 0.03                   # 논문: ±3bp
+
+
+class RateCalendar:
+    """정렬된 (날짜, 금리) 배열 기반 as-of 금리 조회"""
+
+    def __init__(self, dates, rates):
+        frame = pd.DataFrame({'Date': pd.to_datetime(dates), 'Call_Rate': rates})
+        frame = frame.dropna(subset=['Date']).sort_values('Date', kind='stable')
+        # 같은 날짜가 여러 번 있으면 마지막 값 사용 (기존 iloc[-1] 동작과 동일)
+        frame = frame.drop_duplicates(subset=['Date'], keep='last')
+        self.dates = frame['Date'].to_numpy(dtype='datetime64[ns]')
+        self.rates = frame['Call_Rate'].to_numpy(dtype=np.float64)
+
+    @classmethod
+    def from_frame(cls, df_call, date_col='Date', rate_col='Call_Rate'):
+        """금리 DataFrame으로 생성"""
+        return cls(df_call[date_col], df_call[rate_col])
+
+    @classmethod
+    def from_csv(cls, path=CALL_RATE_FILE):
+        """일별 콜금리 CSV(날짜, 콜금리)로 생성"""
+        df_call = pd.read_csv(path)
+        df_call = df_call.rename(columns={'날짜': 'Date', '콜금리': 'Call_Rate'})
+        return cls.from_frame(df_call)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def rate_at(self, dates):
+        """날짜별 유효 금리 (이전 금리가 없거나 NaT이면 NaN)"""
+        dates = pd.DatetimeIndex(pd.to_datetime(dates)).to_numpy(dtype='datetime64[ns]')
+        pos = np.searchsorted(self.dates, dates, side='right') - 1
+        valid = (pos >= 0) & ~np.isnat(dates)
+        rates = np.full(len(dates), np.nan)
+        rates[valid] = self.rates[pos[valid]]
+        return rates
+
+    def rate_change(self, dates, horizon=DEFAULT_HORIZON):
+        """horizon 후 금리 - 현재 금리"""
+        dates = pd.DatetimeIndex(pd.to_datetime(dates))
+        return self.rate_at(dates + horizon) - self.rate_at(dates)
+
+    def label(self, dates, horizon=DEFAULT_HORIZON, threshold=DEFAULT_THRESHOLD):
+        """Hawkish(1) / Dovish(0) / 변동 없음·조회 불가(NaN) 라벨 배열"""
+        change = self.rate_change(dates, horizon)
+        labels = np.full(len(change), np.nan)
+        labels[change > threshold] = 1
+        labels[change < -threshold] = 0
+        return labels
@@ -11,12 +11,17 @@ Paper: "Deciphering Monetary Policy Board Minutes Through Text Mining Approach"
 
 import json
 import os
+import sys
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 import logging
 
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawler.common.jsonl_sink import JSONL_SUFFIXES, read_records
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -84,6 +89,14 @@ class PaperDatasetPreparer:
             "preprocessing_version": str
         }
     
+    def month_file(self, year: int, month: int) -> Path:
+        """월별 통합 뉴스 파일 경로 (JSONL 형식 우선, 없으면 기존 JSON)"""
+        for suffix in JSONL_SUFFIXES + ('.json',):
+            file_path = self.unified_path / f"news_{year}_{month:02d}{suffix}"
+            if file_path.exists():
+                return file_path
+        return file_path
+    
     def load_unified_data(self, year: int, month: Optional[int] = None) -> List[Dict]:
         """
         통합된 뉴스 데이터 로드
@@ -98,21 +111,19 @@ class PaperDatasetPreparer:
         data = []
         
         if month:
-            file_path = self.unified_path / f"news_{year}_{month:02d}.json"
+            file_path = self.month_file(year, month)
             if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    month_data = json.load(f)
-                    data.extend(month_data)
-                    logger.info(f"Loaded {len(month_data)} articles from {file_path.name}")
+                month_data = read_records(file_path)
+                data.extend(month_data)
+                logger.info(f"Loaded {len(month_data)} articles from {file_path.name}")
         else:
             # 전체 연도 데이터 로드
             for month in range(1, 13):
-                file_path = self.unified_path / f"news_{year}_{month:02d}.json"
+                file_path = self.month_file(year, month)
                 if file_path.exists():
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        month_data = json.load(f)
-                        data.extend(month_data)
-                        logger.info(f"Loaded {len(month_data)} articles from {file_path.name}")
+                    month_data = read_records(file_path)
+                    data.extend(month_data)
+                    logger.info(f"Loaded {len(month_data)} articles from {file_path.name}")
         
         return data
     
@@ -77,9 +77,14 @@ def process_corpus():
     print("="*60)
 
     # 코퍼스 로드
-    corpus_path = PROJECT_ROOT / "preprocess/data_combine/corpus_data.csv"
+    corpus_path = PROJECT_ROOT / "preprocess/data_combine/corpus_data.parquet"
+    if not corpus_path.exists():
+        corpus_path = PROJECT_ROOT / "preprocess/data_combine/corpus_data.csv"
     print(f"\nLoading corpus from {corpus_path}")
-    df_corpus = pd.read_csv(corpus_path)
+    if corpus_path.suffix == '.parquet':
+        df_corpus = pd.read_parquet(corpus_path, columns=['pk', 'Date', 'Content', 'Label'])
+    else:
+        df_corpus = pd.read_csv(corpus_path)
 
     # NaN PK 제거
     df_corpus = df_corpus.dropna(subset=['pk'])
@@ -6,11 +6,16 @@
 
 import json
 import os
+import sys
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 import statistics
 
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawler.common.jsonl_sink import is_jsonl, read_grouped, strip_suffix
+
 def validate_news_data(base_path="/Users/lord_jubin/Desktop/my_git/mpb-stance-mining"):
     """뉴스 데이터 검증 메인 함수"""
     
@@ -28,12 +33,13 @@ def validate_news_data(base_path="/Users/lord_jubin/Desktop/my_git/mpb-stance-mi
     seen_urls = set()
     
     # 모든 뉴스 파일 처리
-    news_files = sorted(data_path.glob("news_*.json"))
+    news_files = sorted(p for p in data_path.glob("news_*.json*")
+                        if is_jsonl(p) or p.suffix == '.json')
     print(f"총 {len(news_files)}개 파일 발견\n")
     
     for file_path in news_files:
         # 파일명에서 연도와 월 추출
-        filename = file_path.stem  # news_2014_01
+        filename = strip_suffix(file_path)  # news_2014_01
         parts = filename.split('_')
         year = int(parts[1])
         month = int(parts[2])
@@ -41,8 +47,8 @@ def validate_news_data(base_path="/Users/lord_jubin/Desktop/my_git/mpb-stance-mi
         print(f"처리 중: {filename}...", end=" ")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # JSON / JSONL(압축 포함) 모두 {소스: [기사]}로 읽음
+            data = read_grouped(file_path)
             
             month_total = 0
             
@@ -19,12 +19,16 @@ import seaborn as sns
 from wordcloud import WordCloud
 from pathlib import Path
 import pickle
+import sys
 from collections import Counter
 import warnings
 warnings.filterwarnings('ignore')
 
 # 프로젝트 루트
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from preprocess.labeling.rate_calendar import RateCalendar
 
 # 색상 테마 정의 (타겟팅된 시인성 개선)
 THEME_COLORS = {
@@ -775,32 +779,10 @@ def create_call_rate_labeling():
     df_call['call_rate'] = df_call['콜금리']
     df_call = df_call.sort_values('date').reset_index(drop=True)
 
-    # 1개월 후 콜금리 찾기 함수
-    def get_future_rate(date, df):
-        future_date = date + pd.DateOffset(months=1)
-        future_rates = df[df['date'] <= future_date]
-        if not future_rates.empty:
-            return future_rates.iloc[-1]['call_rate']
-        return None
-
-    # 각 날짜에 대한 라벨 계산
-    labels = []
-    for idx, row in df_call.iterrows():
-        current_rate = row['call_rate']
-        future_rate = get_future_rate(row['date'], df_call)
-
-        if future_rate is not None:
-            diff = future_rate - current_rate
-            if diff > 0.03:
-                labels.append('Hawkish')
-            elif diff < -0.03:
-                labels.append('Dovish')
-            else:
-                labels.append('None')
-        else:
-            labels.append('None')
-
-    df_call['label'] = labels
+    # 1개월 후 콜금리 변동 기반 라벨 (코퍼스 라벨링과 동일한 as-of 조회)
+    calendar = RateCalendar.from_frame(df_call, date_col='date', rate_col='call_rate')
+    labels = calendar.label(df_call['date'])
+    df_call['label'] = np.select([labels == 1, labels == 0], ['Hawkish', 'Dovish'], default='None')
 
     # 월별 집계 (히트맵용)
     df_call['year_month'] = df_call['date'].dt.to_period('M')